@@ -0,0 +1,233 @@
+"""
+Асинхронний фасад для читання бази даних фільмів.
+
+`AsyncMovieDatabase` виконує SQL-скрипти читання в обмеженому пулі потоків, де кожен
+потік має власне підключення лише для читання. Методи повертають класи даних з модуля
+`records` замість виводу через Display, тому фасад можна використовувати в aiohttp/ASGI
+сервісі з великою кількістю одночасних читачів (режим WAL дозволяє читати паралельно із записом).
+
+Приклад:
+    async with AsyncMovieDatabase('db/kinobaza.db', max_workers=8) as db:
+        actors = await db.get_all_actors()
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from cast_graph import CastGraph, group_rows
+from connection_manager import ConnectionManager
+from movie_database import MovieDatabase, global_db_name
+from records import Actor, ActorMovies, GenreCount, Movie, MovieRelease, MovieWithActors
+from sql_registry import ScriptRegistry
+
+
+class AsyncMovieDatabase:
+    """
+    Асинхронний доступ до звітів бази даних фільмів лише для читання.
+
+    Атрибути:
+        db_name (str): Шлях до файлу SQLite бази даних.
+        max_workers (int): Кількість потоків (і підключень) для виконання запитів.
+        scripts (ScriptRegistry): Реєстр SQL-скриптів.
+        connections (ConnectionManager): Менеджер підключень лише для читання, одне на потік.
+    """
+
+    def __init__(self, db_name=global_db_name, max_workers=4):
+        """
+        Ініціалізує AsyncMovieDatabase.
+
+        :param db_name: Шлях до файлу бази даних. За замовчуванням global_db_name.
+        :type db_name: str
+        :param max_workers: Розмір пулу потоків. За замовчуванням 4.
+        :type max_workers: int
+        """
+        self.db_name = db_name
+        self.max_workers = max_workers
+        self.scripts = ScriptRegistry()
+        self.connections = ConnectionManager(db_name, cached_statements=max(128, 2 * len(self.scripts)),
+                                             read_only=True)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='movie_db_reader')
+        self._fts_enabled = None
+
+    async def __aenter__(self):
+        """
+        Повертає екземпляр при вході в асинхронний контекстний менеджер.
+
+        :return: Екземпляр AsyncMovieDatabase.
+        :rtype: AsyncMovieDatabase
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Зупиняє пул потоків та закриває підключення при виході з контекстного менеджера.
+        """
+        await self.close()
+        return False
+
+    async def close(self):
+        """
+        Очікує завершення запущених запитів, зупиняє пул потоків та закриває всі підключення.
+
+        :return: None
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown, True)
+        self.connections.close()
+
+    def _fetch_sync(self, script_name, params):
+        """
+        Виконує SQL-скрипт на підключенні поточного потоку пулу.
+
+        :return: Список рядків результату.
+        :rtype: list
+        """
+        return self.connections.connection.execute(self.scripts.get(script_name), params).fetchall()
+
+    async def fetch(self, script_name, params=()):
+        """
+        Виконує SQL-скрипт читання в пулі потоків і повертає рядки результату.
+
+        :param script_name: Назва SQL-скрипта.
+        :type script_name: str
+        :param params: Параметри запиту. За замовчуванням ().
+        :type params: tuple, опціонально
+        :return: Список рядків результату.
+        :rtype: list
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._fetch_sync, script_name, params)
+
+    async def fts_enabled(self):
+        """
+        Чи доступний повнотекстовий індекс назв фільмів.
+
+        :return: True, якщо таблиця movies_fts існує.
+        :rtype: bool
+        """
+        if self._fts_enabled is None:
+            self._fts_enabled = bool(await self.fetch('check_movies_fts.sql'))
+        return self._fts_enabled
+
+    async def get_all_actors(self):
+        """
+        Повертає список усіх акторів.
+
+        :return: Список усіх акторів.
+        :rtype: list[Actor]
+        """
+        return [Actor(*row) for row in await self.fetch('get_all_actors.sql')]
+
+    async def get_movies_with_actors(self):
+        """
+        Повертає фільми, у яких є пов'язані актори.
+
+        :return: Фільми з іменами акторів.
+        :rtype: list[MovieWithActors]
+        """
+        rows = await self.fetch('get_movies_with_actors.sql')
+        return [MovieWithActors(movie_id, title, tuple(actor_names))
+                for (movie_id, title), actor_names in group_rows(rows, key_size=2)]
+
+    async def get_actors_and_movies(self):
+        """
+        Повертає акторів з фільмами, у яких вони знімалися.
+
+        :return: Актори з назвами фільмів, у яких вони знімалися.
+        :rtype: list[ActorMovies]
+        """
+        rows = await self.fetch('select_actors_and_movies.sql')
+        return [ActorMovies(actor_id, name, tuple(titles)) for (actor_id, name), titles in group_rows(rows, key_size=2)]
+
+    async def get_movies_with_release_year(self):
+        """
+        Повертає всі фільми з роком випуску.
+
+        :return: Назви всіх фільмів з роком випуску.
+        :rtype: list[MovieRelease]
+        """
+        return [MovieRelease(*row) for row in await self.fetch('get_movies_with_release_year.sql')]
+
+    async def get_unique_genres(self):
+        """
+        Повертає унікальні жанри фільмів.
+
+        :return: Відсортований список унікальних жанрів.
+        :rtype: list[str]
+        """
+        return [row[0] for row in await self.fetch('get_unique_genres.sql')]
+
+    async def count_movies_by_genre(self):
+        """
+        Повертає кількість фільмів за жанрами.
+
+        :return: Кількість фільмів у кожному жанрі.
+        :rtype: list[GenreCount]
+        """
+        return [GenreCount(*row) for row in await self.fetch('count_movies_by_genre.sql')]
+
+    async def avg_birth_year_by_genre(self, genre):
+        """
+        Повертає середній рік народження акторів у фільмах жанру.
+
+        :param genre: Жанр.
+        :type genre: str
+        :return: Середній рік народження акторів у фільмах жанру або None, якщо даних немає.
+        :rtype: float або None
+        """
+        rows = await self.fetch('avg_birth_year_by_genre.sql', (genre,))
+        return rows[0][0] if rows else None
+
+    async def search_movies_by_title(self, keyword, mode=None):
+        """
+        Шукає фільми за назвою.
+
+        :param keyword: Ключове слово для пошуку.
+        :type keyword: str
+        :param mode: Режим пошуку (див. MovieDatabase.find_movies_by_title). За замовчуванням None.
+        :type mode: str, опціонально
+        :return: Знайдені фільми.
+        :rtype: list[MovieRelease]
+        """
+        script, params = MovieDatabase.search_query(keyword, mode, await self.fts_enabled())
+        return [MovieRelease(*row) for row in await self.fetch(script, params)]
+
+    async def get_movies_page(self, order_by='id', after=None, before=None, page_size=20):
+        """
+        Повертає сторінку фільмів з пагінацією за ключем.
+
+        :param order_by: Ключ сортування: 'id', 'genre' або 'release_year'. За замовчуванням 'id'.
+        :type order_by: str, опціонально
+        :param after: Ключ останнього рядка попередньої сторінки. За замовчуванням None.
+        :type after: tuple, опціонально
+        :param before: Ключ першого рядка поточної сторінки (попередня сторінка). За замовчуванням None.
+        :type before: tuple, опціонально
+        :param page_size: Кількість фільмів на сторінці. За замовчуванням 20.
+        :type page_size: int, опціонально
+        :return: Сторінка фільмів у порядку сортування.
+        :rtype: list[Movie]
+        """
+        script, params = MovieDatabase.page_query(order_by, after, before, page_size)
+        rows = await self.fetch(script, params)
+        return [Movie(*row) for row in (rows[::-1] if before is not None else rows)]
+
+    async def get_movies_paginated(self, limit, offset):
+        """
+        Повертає сторінку фільмів з пагінацією через OFFSET.
+
+        :param limit: Кількість фільмів.
+        :type limit: int
+        :param offset: Зміщення від початку (для глибоких сторінок краще get_movies_page).
+        :type offset: int
+        :return: Сторінка фільмів, впорядкованих за ID.
+        :rtype: list[Movie]
+        """
+        return [Movie(*row) for row in await self.fetch('get_movies_paginated.sql', (limit, offset))]
+
+    async def get_cast_graph(self):
+        """
+        Будує граф складу акторів для пошуку партнерів по зйомках і фільмів зі спільними акторами.
+
+        :return: Знімок графа складу акторів.
+        :rtype: CastGraph
+        """
+        return CastGraph.from_pairs(await self.fetch('get_cast_pairs.sql'))
@@ -0,0 +1,80 @@
+"""
+Бенчмарк підключень: підключення на кожен запит проти постійного підключення ConnectionManager.
+
+Створює тимчасову базу зі 100 000 фільмів і вимірює кількість запитів за секунду
+для пагінації, вставки акторів та звіту за жанрами.
+
+Запуск з каталогу Home_work_8:
+    python -m benchmarks.bench_connection [--movies 100000] [--queries 2000]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+
+from movie_database import MovieDatabase
+from benchmarks.catalogue import CatalogueSize, populate
+
+
+def connect_per_query(db_name, query, params, fetch):
+    """
+    Відтворює попередню поведінку: нове підключення та commit на кожен запит.
+
+    :return: Результат запиту або ID останнього вставленого рядка.
+    :rtype: Any
+    """
+    with closing(sqlite3.connect(db_name)) as conn:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute(query, params)
+            result = cursor.fetchall() if fetch else cursor.lastrowid
+            conn.commit()
+            return result
+
+
+def measure(run, queries):
+    """
+    Виконує `run(i)` задану кількість разів і повертає кількість запитів за секунду.
+
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for i in range(queries):
+        run(i)
+    return queries / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Порівняння підключення на запит та постійного підключення.")
+    parser.add_argument('--movies', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+
+    # Логування кожного запиту вимірювало б швидкість файлового логера, а не бази
+    logging.getLogger('db_logger').setLevel(logging.WARNING)
+
+    workloads = {
+        'paginate': ('get_movies_paginated.sql', lambda i: (5, (i * 97) % args.movies), True),
+        'insert_actor': ('insert_actor.sql', lambda i: (f"Актор {i}", 1950 + i % 50), False),
+        'count_by_genre': ('count_movies_by_genre.sql', lambda i: (), True),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_name = os.path.join(tmp_dir, 'bench.db')
+
+        print(f"{'workload':<16}{'before q/s':>14}{'after q/s':>14}{'speedup':>10}")
+        with MovieDatabase(db_name=db_name, cache_size=0) as db:
+            db.migrate()
+            populate(db, CatalogueSize(args.movies, 0, 0))
+            for label, (script, make_params, fetch) in workloads.items():
+                query = db.scripts.get(script)
+                before = measure(lambda i: connect_per_query(db_name, query, make_params(i), fetch), args.queries)
+                after = measure(lambda i: db.execute_query(query, make_params(i), fetch), args.queries)
+                print(f"{label:<16}{before:>14.0f}{after:>14.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
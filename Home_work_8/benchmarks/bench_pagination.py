@@ -0,0 +1,63 @@
+"""
+Бенчмарк пагінації: LIMIT/OFFSET проти пагінації за ключем (keyset).
+
+Вимірює затримку отримання сторінки на різній глибині каталогу з 1 000 000 фільмів.
+
+Запуск з каталогу Home_work_8:
+    python -m benchmarks.bench_pagination [--movies 1000000] [--page-size 5]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from movie_database import MovieDatabase
+from benchmarks.catalogue import CatalogueSize, populate
+
+DEPTHS = [1, 100, 10_000, 100_000]
+
+
+def timed(run, repeat=20):
+    """
+    Повертає середній час виконання `run()` у мілісекундах.
+
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Порівняння затримки OFFSET та keyset пагінації.")
+    parser.add_argument('--movies', type=int, default=1_000_000)
+    parser.add_argument('--page-size', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger('db_logger').setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with MovieDatabase(db_name=os.path.join(tmp_dir, 'bench.db'), cache_size=0) as db:
+            db.migrate()
+            populate(db, CatalogueSize(args.movies, 0, 0))
+
+            print(f"{'page':>10}{'offset ms':>12}{'keyset ms':>12}")
+            for page in DEPTHS:
+                offset = (page - 1) * args.page_size
+                if offset >= args.movies:
+                    break
+                # Граничний ключ попередньої сторінки, який keyset-пагінація запам'ятовує під час навігації
+                boundary = db.execute_script('get_movies_paginated.sql', (1, offset - 1), fetch=True) if offset else []
+                after = db.movie_page_key(boundary[0]) if boundary else None
+
+                offset_ms = timed(lambda: db.execute_script('get_movies_paginated.sql',
+                                                            (args.page_size, offset), fetch=True))
+                keyset_ms = timed(lambda: db.fetch_movies_page('id', after=after, page_size=args.page_size))
+                print(f"{page:>10}{offset_ms:>12.3f}{keyset_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Бенчмарк пошуку фільмів за назвою: LIKE '%kw%' проти повнотекстового індексу FTS5.
+
+Створює тимчасову базу з 1 000 000 назв, складених зі словника, та вимірює середню
+затримку кожного режиму `MovieDatabase.find_movies_by_title`.
+
+Запуск з каталогу Home_work_8:
+    python -m benchmarks.bench_search [--movies 1000000] [--repeat 20]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from movie_database import MovieDatabase, SEARCH_MODES
+from benchmarks.catalogue import CatalogueSize, populate
+
+# Ключові слова зі словника назв синтетичного каталогу (benchmarks.catalogue.WORDS)
+KEYWORDS = ['матриця', 'темний лицар', 'зелена миля', 'лег', 'острів серце']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Порівняння затримки пошуку LIKE та FTS5.")
+    parser.add_argument('--movies', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    logging.getLogger('db_logger').setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with MovieDatabase(db_name=os.path.join(tmp_dir, 'bench.db'), cache_size=0) as db:
+            db.migrate()
+            if not db.fts_enabled:
+                print("FTS5 недоступний у цій збірці SQLite: вимірюється лише режим 'like'.")
+            populate(db, CatalogueSize(args.movies, 0, 0))
+
+            modes = SEARCH_MODES if db.fts_enabled else ('like',)
+            print(f"{'keyword':<16}" + ''.join(f"{mode + ' ms':>12}{'rows':>8}" for mode in modes))
+            for keyword in KEYWORDS:
+                line = f"{keyword:<16}"
+                for mode in modes:
+                    start = time.perf_counter()
+                    for _ in range(args.repeat):
+                        rows = db.find_movies_by_title(keyword, mode)
+                    latency_ms = (time.perf_counter() - start) * 1000 / args.repeat
+                    line += f"{latency_ms:>12.2f}{len(rows):>8}"
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
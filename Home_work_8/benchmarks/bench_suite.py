@@ -0,0 +1,251 @@
+"""
+Набір бенчмарків бази фільмів на синтетичному каталозі.
+
+Генерує відтворюваний каталог (фільми, актори, склад акторів), виконує кожен SQL-скрипт
+з каталогу sql_scripts та звітні методи MovieDatabase зі сценарним вводом і виводить
+затримки (середня, p50/p95/p99) та пропускну здатність у форматі JSON.
+
+Скрипти запису та обслуговування виконуються в транзакції, що відкочується після
+кожного виміру, тому каталог лишається незмінним між вимірами.
+
+Запуск з каталогу Home_work_8:
+    python -m benchmarks.bench_suite [--movies 100000] [--actors 20000] [--cast-per-movie 4]
+                                     [--repeat 5] [--seed 42] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from movie_database import MovieDatabase
+from query_stats import percentile
+from benchmarks.catalogue import CatalogueSize, DEFAULT_SEED, GENRES, WORDS, populate
+from benchmarks.scripted_display import ScriptedDisplay
+
+PAGE_SIZE = 5
+
+# Генератори параметрів для скриптів з плейсхолдерами: (rnd, size) -> params
+SCRIPT_PARAMS = {
+    'avg_birth_year_by_genre.sql': lambda rnd, size: (rnd.choice(GENRES),),
+    'bulk_link_actor_to_movie.sql': lambda rnd, size: (rnd.randint(1, size.movies), rnd.randint(1, size.actors)),
+    'link_actor_to_movie.sql': lambda rnd, size: (rnd.randint(1, size.movies), rnd.randint(1, size.actors)),
+    'insert_actor.sql': lambda rnd, size: ("Актор бенчмарку", rnd.randint(1930, 2005)),
+    'insert_movie.sql': lambda rnd, size: ("Фільм бенчмарку", rnd.randint(1920, 2024), rnd.choice(GENRES)),
+    'get_movies_paginated.sql': lambda rnd, size: (PAGE_SIZE, rnd.randint(0, size.movies - 1)),
+    'get_movies_page_by_id_next.sql': lambda rnd, size: (rnd.randint(1, size.movies), PAGE_SIZE),
+    'get_movies_page_by_id_prev.sql': lambda rnd, size: (rnd.randint(1, size.movies), PAGE_SIZE),
+    'get_movies_page_by_genre_next.sql':
+        lambda rnd, size: (rnd.choice(GENRES), rnd.randint(1, size.movies), PAGE_SIZE),
+    'get_movies_page_by_genre_prev.sql':
+        lambda rnd, size: (rnd.choice(GENRES), rnd.randint(1, size.movies), PAGE_SIZE),
+    'get_movies_page_by_release_year_next.sql':
+        lambda rnd, size: (rnd.randint(1920, 2024), rnd.randint(1, size.movies), PAGE_SIZE),
+    'get_movies_page_by_release_year_prev.sql':
+        lambda rnd, size: (rnd.randint(1920, 2024), rnd.randint(1, size.movies), PAGE_SIZE),
+    'search_movie_by_title.sql': lambda rnd, size: MovieDatabase.search_query(rnd.choice(WORDS), 'like')[1],
+    'search_movie_by_title_fts.sql': lambda rnd, size: MovieDatabase.search_query(rnd.choice(WORDS), 'prefix')[1],
+    'search_movie_by_title_ranked.sql':
+        lambda rnd, size: MovieDatabase.search_query(' '.join(rnd.sample(WORDS, 2)), 'ranked')[1],
+}
+
+# Скрипти, які мають сенс лише після іншого скрипта в тій самій (відкоченій) транзакції
+SCRIPT_SETUP = {
+    'rebuild_genre_stats.sql': ['clear_genre_stats.sql'],
+}
+
+# Скрипти, що потребують повнотекстового індексу
+FTS_ONLY_SCRIPTS = {'search_movie_by_title_fts.sql', 'search_movie_by_title_ranked.sql', 'rebuild_movies_fts.sql'}
+
+# Звітні методи MovieDatabase та відповіді на їхні запити вводу
+REPORTS = {
+    'show_actors': {},
+    'show_movies_with_actors': {},
+    'show_movies_with_age': {},
+    'show_unique_genres': {},
+    'show_movie_count_by_genre': {},
+    'show_avg_birth_year_by_genre': {'enter_genre': GENRES[0]},
+    'search_movie_by_title': {'enter_keyword': 'темний лицар'},
+    'show_actors_and_movies': {},
+    'show_movies_paginated': {'choose_option': ['n'] * 10 + ['e']},
+}
+
+
+class _Rollback(Exception):
+    """Відкочує транзакцію виміру скрипта запису."""
+
+
+def summarize(timings, extra=None):
+    """
+    Обчислює підсумок вимірів.
+
+    :param timings: Час виконання кожного виміру в секундах.
+    :type timings: list
+    :param extra: Додаткові поля підсумку. За замовчуванням None.
+    :type extra: dict, опціонально
+    :return: Словник з кількістю вимірів, затримками в мс та кількістю операцій за секунду.
+    :rtype: dict
+    """
+    samples = sorted(elapsed * 1000 for elapsed in timings)
+    total = sum(timings)
+    result = {
+        'runs': len(samples),
+        'mean_ms': round(sum(samples) / len(samples), 4),
+        'p50_ms': round(percentile(samples, 0.50), 4),
+        'p95_ms': round(percentile(samples, 0.95), 4),
+        'p99_ms': round(percentile(samples, 0.99), 4),
+        'ops_per_sec': round(len(samples) / total, 1) if total else None,
+    }
+    result.update(extra or {})
+    return result
+
+
+def script_params(script_name, query, rnd, size):
+    """
+    Повертає параметри для одного виміру скрипта.
+
+    :raises KeyError: Якщо скрипт має плейсхолдери, але для нього не задано генератор параметрів.
+    """
+    if script_name in SCRIPT_PARAMS:
+        return SCRIPT_PARAMS[script_name](rnd, size)
+    if '?' in query:
+        raise KeyError(f"Для скрипта {script_name} не задано параметри в SCRIPT_PARAMS")
+    return ()
+
+
+def bench_script(db, script_name, rnd, size, repeat):
+    """
+    Вимірює затримку одного SQL-скрипта.
+
+    Скрипти читання виконуються як є; скрипти запису та зміни схеми — у транзакції,
+    яка відкочується після кожного виміру.
+
+    :return: Підсумок вимірів (див. summarize) з середньою кількістю рядків за вимір.
+    :rtype: dict
+    """
+    query = db.scripts.get(script_name)
+    is_write = bool(db.result_cache.tags(query)[1])
+    timings, rows, errors = [], 0, 0
+
+    for _ in range(repeat):
+        params = script_params(script_name, query, rnd, size)
+        if not is_write:
+            start = time.perf_counter()
+            rows += len(db.execute_query(query, params, fetch=True))
+            timings.append(time.perf_counter() - start)
+            continue
+
+        try:
+            with db.transaction():
+                for setup_script in SCRIPT_SETUP.get(script_name, []):
+                    db.execute_script(setup_script)
+                start = time.perf_counter()
+                try:
+                    db.execute_query(query, params)
+                except sqlite3.IntegrityError:
+                    # Випадкова пара фільм–актор вже могла бути у складі
+                    errors += 1
+                timings.append(time.perf_counter() - start)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    return summarize(timings, {'kind': 'write' if is_write else 'read', 'rows': rows // repeat, 'errors': errors})
+
+
+def bench_report(db, display, method_name, answers, repeat):
+    """
+    Вимірює затримку звітного методу MovieDatabase разом з форматуванням повідомлень.
+
+    :return: Підсумок вимірів (див. summarize) з кількістю повідомлень за один виклик.
+    :rtype: dict
+    """
+    timings = []
+    for _ in range(repeat):
+        display.reset(answers)
+        start = time.perf_counter()
+        getattr(db, method_name)()
+        timings.append(time.perf_counter() - start)
+    return summarize(timings, {'messages': display.shown})
+
+
+def run_suite(db, size, repeat, seed=DEFAULT_SEED, scripts=None, reports=None):
+    """
+    Виконує бенчмарки скриптів та звітів на заповненій базі.
+
+    :param db: Заповнена база даних.
+    :type db: MovieDatabase
+    :param size: Розмір каталогу (для генерації параметрів).
+    :type size: CatalogueSize
+    :param repeat: Кількість вимірів на скрипт або звіт.
+    :type repeat: int
+    :param seed: Початкове значення генератора параметрів. За замовчуванням DEFAULT_SEED.
+    :type seed: int
+    :param scripts: Назви скриптів. За замовчуванням усі скрипти реєстру.
+    :type scripts: list, опціонально
+    :param reports: Звітні методи та відповіді. За замовчуванням REPORTS.
+    :type reports: dict, опціонально
+    :return: Словник {'scripts': {...}, 'reports': {...}}.
+    :rtype: dict
+    """
+    rnd = random.Random(seed)
+    results = {'scripts': {}, 'reports': {}}
+
+    for script_name in db.scripts.names() if scripts is None else scripts:
+        if script_name in FTS_ONLY_SCRIPTS and not db.fts_enabled:
+            results['scripts'][script_name] = {'skipped': 'FTS5 недоступний'}
+            continue
+        results['scripts'][script_name] = bench_script(db, script_name, rnd, size, repeat)
+
+    display = ScriptedDisplay()
+    db.display = display
+    for method_name, answers in (REPORTS if reports is None else reports).items():
+        results['reports'][method_name] = bench_report(db, display, method_name, answers, repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк SQL-скриптів і звітів на синтетичному каталозі.")
+    parser.add_argument('--movies', type=int, default=100_000)
+    parser.add_argument('--actors', type=int, default=20_000)
+    parser.add_argument('--cast-per-movie', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--cache-size', type=int, default=0,
+                        help="Розмір кешу результатів. За замовчуванням 0 — вимірюється робота SQLite.")
+    parser.add_argument('--output', help="Файл для JSON-результатів. За замовчуванням — стандартний вивід.")
+    args = parser.parse_args()
+
+    logging.getLogger('db_logger').setLevel(logging.WARNING)
+    logging.getLogger('slow_query_logger').setLevel(logging.ERROR)
+    size = CatalogueSize(args.movies, args.actors, args.cast_per_movie)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with MovieDatabase(db_name=os.path.join(tmp_dir, 'bench.db'), cache_size=args.cache_size) as db:
+            db.migrate()
+            start = time.perf_counter()
+            populate(db, size, args.seed)
+            populate_seconds = time.perf_counter() - start
+
+            report = {
+                'catalogue': dict(size._asdict(), seed=args.seed, populate_seconds=round(populate_seconds, 2)),
+                'sqlite_version': sqlite3.sqlite_version,
+                'repeat': args.repeat,
+                **run_suite(db, size, args.repeat, args.seed),
+            }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output + '\n')
+    else:
+        sys.stdout.write(output + '\n')
+
+
+if __name__ == "__main__":
+    main()
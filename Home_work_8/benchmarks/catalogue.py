@@ -0,0 +1,116 @@
+"""
+Генератор синтетичного каталогу фільмів для бенчмарків.
+
+Каталог відтворюваний: однаковий seed завжди дає однакові фільми, акторів і склад акторів.
+Популярність акторів розподілена за законом Ципфа (кілька зірок грають у багатьох фільмах,
+більшість — в одному-двох), кількість акторів у фільмі — рівномірна навколо середнього.
+"""
+
+import itertools
+import random
+from collections import namedtuple
+
+from result_cache import ALL_TABLES
+
+DEFAULT_SEED = 42
+
+WORDS = ['зоряні', 'війни', 'матриця', 'повернення', 'останній', 'герой', 'ніч', 'місто', 'тінь', 'король',
+         'дорога', 'ярості', 'втеча', 'зелена', 'миля', 'темний', 'лицар', 'сонце', 'океан', 'легенда',
+         'таємниця', 'острів', 'серце', 'вогонь', 'лід', 'світанок', 'вовк', 'море', 'код', 'пісня']
+GENRES = ['Драма', 'Комедія', 'Бойовик', 'Трилер', 'Жахи', 'Фантастика', 'Мультфільм', 'Документальний']
+FIRST_NAMES = ['Олена', 'Андрій', 'Марія', 'Богдан', 'Ірина', 'Тарас', 'Софія', 'Дмитро', 'Наталія', 'Олег',
+               'Катерина', 'Василь', 'Юлія', 'Максим', 'Оксана', 'Ігор']
+LAST_NAMES = ['Шевченко', 'Коваленко', 'Бондаренко', 'Ткаченко', 'Кравченко', 'Олійник', 'Мельник',
+              'Савченко', 'Руденко', 'Мороз', 'Лисенко', 'Гончар']
+
+# Показник розподілу Ципфа для популярності акторів
+ACTOR_POPULARITY_EXPONENT = 0.8
+
+# Розмір каталогу: кількість фільмів, акторів та середня кількість акторів у фільмі
+CatalogueSize = namedtuple('CatalogueSize', ['movies', 'actors', 'cast_per_movie'])
+
+
+def movie_rows(rnd, count):
+    """
+    Генерує фільми з назвами з 2–4 слів словника, роком випуску та жанром.
+
+    :param rnd: Генератор випадкових чисел.
+    :type rnd: random.Random
+    :param count: Кількість фільмів.
+    :type count: int
+    :return: Генератор кортежів (назва, рік випуску, жанр).
+    :rtype: Iterator[tuple]
+    """
+    for _ in range(count):
+        title = ' '.join(rnd.choices(WORDS, k=rnd.randint(2, 4))).capitalize()
+        yield title, rnd.randint(1920, 2024), rnd.choice(GENRES)
+
+
+def actor_rows(rnd, count):
+    """
+    Генерує акторів з унікальними іменами та роком народження.
+
+    :param rnd: Генератор випадкових чисел.
+    :type rnd: random.Random
+    :param count: Кількість акторів.
+    :type count: int
+    :return: Генератор кортежів (ім'я, рік народження).
+    :rtype: Iterator[tuple]
+    """
+    for i in range(1, count + 1):
+        yield f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)} {i}", rnd.randint(1930, 2005)
+
+
+def cast_rows(rnd, movies_count, actors_count, cast_per_movie):
+    """
+    Генерує зв'язки фільм–актор з розподілом популярності акторів за Ципфом.
+
+    Ідентифікатори фільмів та акторів — 1..movies_count та 1..actors_count
+    (так їх призначає SQLite порожній базі).
+
+    :param rnd: Генератор випадкових чисел.
+    :type rnd: random.Random
+    :param movies_count: Кількість фільмів.
+    :type movies_count: int
+    :param actors_count: Кількість акторів.
+    :type actors_count: int
+    :param cast_per_movie: Середня кількість акторів у фільмі.
+    :type cast_per_movie: int
+    :return: Генератор кортежів (id фільму, id актора) без повторів.
+    :rtype: Iterator[tuple]
+    """
+    if not actors_count or cast_per_movie <= 0:
+        return
+    actor_ids = range(1, actors_count + 1)
+    cum_weights = list(itertools.accumulate(1 / rank ** ACTOR_POPULARITY_EXPONENT for rank in actor_ids))
+    for movie_id in range(1, movies_count + 1):
+        size = min(actors_count, rnd.randint(1, 2 * cast_per_movie - 1))
+        for actor_id in set(rnd.choices(actor_ids, cum_weights=cum_weights, k=size)):
+            yield movie_id, actor_id
+
+
+def populate(db, size, seed=DEFAULT_SEED):
+    """
+    Заповнює порожню базу синтетичним каталогом.
+
+    Вставка виконується скриптами реєстру в одній транзакції на таблицю, тому тригери
+    FTS та genre_stats підтримують похідні таблиці так само, як у робочій базі.
+
+    :param db: Екземпляр MovieDatabase з актуальною схемою (після migrate()).
+    :type db: MovieDatabase
+    :param size: Розмір каталогу.
+    :type size: CatalogueSize
+    :param seed: Початкове значення генератора. За замовчуванням DEFAULT_SEED.
+    :type seed: int
+    :return: None
+    """
+    rnd = random.Random(seed)
+    with db.transaction() as conn:
+        conn.executemany(db.scripts.get('insert_movie.sql'), movie_rows(rnd, size.movies))
+    with db.transaction() as conn:
+        conn.executemany(db.scripts.get('insert_actor.sql'), actor_rows(rnd, size.actors))
+    with db.transaction() as conn:
+        conn.executemany(db.scripts.get('bulk_link_actor_to_movie.sql'),
+                         cast_rows(rnd, size.movies, size.actors, size.cast_per_movie))
+    # Дані вставлено в обхід execute_query, тому кеш результатів очищується явно
+    db.result_cache.invalidate(frozenset({ALL_TABLES}))
@@ -0,0 +1,88 @@
+"""
+Неінтерактивна заміна Display для бенчмарків.
+
+`ScriptedDisplay` відповідає на запити вводу заздалегідь заданими відповідями та
+лише рахує повідомлення замість виводу в консоль і лог, тож звіти MovieDatabase
+можна виконувати в циклі без участі користувача.
+"""
+
+from display import Display
+
+
+class ScriptedDisplay(Display):
+    """
+    Display з відповідями за сценарієм.
+
+    Атрибути:
+        answers (dict): Відповіді за ключем повідомлення вводу; значення — рядок або список
+            рядків, що віддаються по черзі (після останнього повторюється останній).
+        shown (int): Кількість відображених повідомлень з моменту останнього reset().
+    """
+
+    def __init__(self, answers=None, messages_file='data/messages_ua.json'):
+        """
+        Ініціалізує ScriptedDisplay.
+
+        :param answers: Відповіді за ключем повідомлення вводу. За замовчуванням {}.
+        :type answers: dict, опціонально
+        :param messages_file: Шлях до JSON-файлу з повідомленнями. За замовчуванням 'data/messages_ua.json'.
+        :type messages_file: str
+        """
+        super().__init__(messages_file)
+        self.answers = answers or {}
+        self.shown = 0
+        self._positions = {}
+
+    def reset(self, answers=None):
+        """
+        Скидає лічильник повідомлень і починає сценарій відповідей спочатку.
+
+        :param answers: Нові відповіді. За замовчуванням залишаються поточні.
+        :type answers: dict, опціонально
+        :return: None
+        """
+        if answers is not None:
+            self.answers = answers
+        self.shown = 0
+        self._positions = {}
+
+    def display(self, message):
+        """
+        Рахує повідомлення без виводу.
+
+        :param message: Повідомлення для відображення.
+        :type message: str
+        :return: None
+        """
+        self.shown += 1
+
+    def write_lines(self, lines):
+        """
+        Рахує рядки звіту без виводу (форматування рядків при цьому виконується).
+
+        :param lines: Ітерований об'єкт рядків.
+        :type lines: Iterable[str]
+        :return: Кількість рядків.
+        :rtype: int
+        """
+        count = sum(1 for _ in lines)
+        self.shown += count
+        return count
+
+    def get_input(self, category, message_key):
+        """
+        Повертає наступну відповідь сценарію для ключа повідомлення.
+
+        :param category: Категорія повідомлення для вводу.
+        :type category: str
+        :param message_key: Ключ повідомлення для вводу.
+        :type message_key: str
+        :return: Відповідь зі сценарію або порожній рядок, якщо її не задано.
+        :rtype: str
+        """
+        answer = self.answers.get(message_key, "")
+        if isinstance(answer, str):
+            return answer
+        position = self._positions.get(message_key, 0)
+        self._positions[message_key] = position + 1
+        return answer[min(position, len(answer) - 1)]
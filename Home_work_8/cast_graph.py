@@ -0,0 +1,116 @@
+"""
+Модуль графа складу акторів (фільм — актори).
+
+Запити складу акторів повертають по одному рядку на пару фільм–актор, впорядковані
+за ключем групи, тому групування виконується потоково без склеювання рядків через
+GROUP_CONCAT і подальшого розбиття `split(', ')`, яке ламається на назвах з комами.
+
+Клас `CastGraph` зберігає двонаправлений індекс суміжності (фільм -> актори,
+актор -> фільми) для пошуку партнерів по зйомках і фільмів зі спільними акторами.
+"""
+
+from collections import Counter
+from itertools import groupby
+
+
+def group_rows(rows, key_size=1):
+    """
+    Групує впорядковані рядки за першими key_size колонками.
+
+    Рядки мають бути впорядковані за ключем групи (ORDER BY у SQL-скрипті),
+    тоді групування виконується за один прохід і не матеріалізує весь результат.
+
+    :param rows: Ітерований об'єкт рядків (ключ..., значення).
+    :type rows: Iterable[tuple]
+    :param key_size: Кількість колонок ключа групи. За замовчуванням 1.
+    :type key_size: int, опціонально
+    :return: Генератор пар (кортеж ключа, список значень колонки після ключа).
+    :rtype: Iterator[tuple]
+    """
+    for key, group in groupby(rows, key=lambda row: row[:key_size]):
+        yield key, [row[key_size] for row in group]
+
+
+class CastGraph:
+    """
+    Двонаправлений індекс складу акторів у пам'яті.
+
+    Атрибути:
+        movie_actors (dict): id фільму -> кортеж id акторів.
+        actor_movies (dict): id актора -> кортеж id фільмів.
+    """
+
+    def __init__(self, movie_actors):
+        """
+        Ініціалізує CastGraph з суміжності фільм -> актори та будує зворотний індекс.
+
+        :param movie_actors: Словник id фільму -> послідовність id акторів.
+        :type movie_actors: dict
+        """
+        self.movie_actors = {movie_id: tuple(actor_ids) for movie_id, actor_ids in movie_actors.items()}
+        actor_movies = {}
+        for movie_id, actor_ids in self.movie_actors.items():
+            for actor_id in actor_ids:
+                actor_movies.setdefault(actor_id, []).append(movie_id)
+        self.actor_movies = {actor_id: tuple(movie_ids) for actor_id, movie_ids in actor_movies.items()}
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """
+        Будує граф з пар (id фільму, id актора), впорядкованих за id фільму.
+
+        :param pairs: Ітерований об'єкт пар, наприклад результат get_cast_pairs.sql.
+        :type pairs: Iterable[tuple]
+        :return: Граф складу акторів.
+        :rtype: CastGraph
+        """
+        return cls({movie_id: actor_ids for (movie_id,), actor_ids in group_rows(pairs)})
+
+    def actors_of(self, movie_id):
+        """
+        Повертає id акторів фільму.
+
+        :rtype: tuple
+        """
+        return self.movie_actors.get(movie_id, ())
+
+    def movies_of(self, actor_id):
+        """
+        Повертає id фільмів актора.
+
+        :rtype: tuple
+        """
+        return self.actor_movies.get(actor_id, ())
+
+    def co_stars(self, actor_id):
+        """
+        Знаходить акторів, які знімалися разом з актором.
+
+        :param actor_id: Ідентифікатор актора.
+        :type actor_id: int
+        :return: Лічильник id партнера -> кількість спільних фільмів (від найбільшої).
+        :rtype: collections.Counter
+        """
+        partners = Counter()
+        for movie_id in self.movies_of(actor_id):
+            partners.update(self.movie_actors[movie_id])
+        del partners[actor_id]
+        return partners
+
+    def movies_sharing_actors(self, movie_id):
+        """
+        Знаходить фільми, що мають спільних акторів з фільмом.
+
+        :param movie_id: Ідентифікатор фільму.
+        :type movie_id: int
+        :return: Лічильник id фільму -> кількість спільних акторів.
+        :rtype: collections.Counter
+        """
+        movies = Counter()
+        for actor_id in self.actors_of(movie_id):
+            movies.update(self.actor_movies[actor_id])
+        del movies[movie_id]
+        return movies
+
+    def __len__(self):
+        return len(self.movie_actors)
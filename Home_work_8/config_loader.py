@@ -10,6 +10,8 @@
 import logging.config
 import configparser
 
+from query_stats import DEFAULT_SLOW_QUERY_MS  # Поріг повільного запиту (мс), якщо він не вказаний у конфігурації
+
 
 def setup_logging(logging_conf_path='config/logging.conf'):
     """
@@ -63,3 +65,18 @@ def load_config(config_path='config/settings.conf'):
     except configparser.NoSectionError as e:
         missing_section = e.args[0]
         raise configparser.NoSectionError(f"В конфігураційному файлі відсутня секція: {missing_section}") from e
+
+
+def load_slow_query_threshold(config_path='config/settings.conf'):
+    """
+    Завантажує поріг повільного запиту з секції [performance] конфігураційного файлу.
+
+    :param config_path: Шлях до конфігураційного файлу. За замовчуванням 'config/settings.conf'.
+    :type config_path: str
+    :return: Поріг у мілісекундах або DEFAULT_SLOW_QUERY_MS, якщо параметр не вказано.
+    :rtype: float
+    :raises ValueError: Якщо значення порогу не є числом.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config.getfloat('performance', 'slow_query_ms', fallback=DEFAULT_SLOW_QUERY_MS)
@@ -0,0 +1,146 @@
+"""
+Модуль для керування підключеннями до SQLite бази даних.
+
+Замість відкриття нового підключення для кожного запиту клас `ConnectionManager`
+тримає одне відкрите підключення на потік (thread-local), налаштовує його PRAGMA
+(WAL, synchronous, кеш сторінок, mmap, busy_timeout) та надає явні області транзакцій.
+"""
+
+import pathlib
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# PRAGMA, що застосовуються до кожного нового підключення
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',  # Читачі не блокують запис і навпаки
+    'synchronous': 'NORMAL',  # У режимі WAL безпечно і без fsync на кожен commit
+    'cache_size': -20000,  # Кеш сторінок ~20 МБ (від'ємне значення — у КБ)
+    'mmap_size': 268435456,  # Читання файлу бази через mmap (256 МБ)
+    'busy_timeout': 5000,  # Очікування блокування замість негайної помилки (мс)
+}
+
+
+class ConnectionManager:
+    """
+    Менеджер підключень до SQLite, що зберігає одне підключення на потік.
+
+    Підключення відкриваються ліниво при першому зверненні з потоку і живуть до виклику `close()`.
+    Підключення працюють у режимі autocommit (isolation_level=None), а транзакції
+    відкриваються явно через `transaction()`.
+
+    Атрибути:
+        db_name (str): Шлях до файлу SQLite бази даних.
+        pragmas (dict): PRAGMA, що застосовуються до кожного нового підключення.
+        cached_statements (int): Розмір кешу підготовлених запитів sqlite3 для кожного підключення.
+        read_only (bool): Чи відкривати підключення лише для читання.
+    """
+
+    def __init__(self, db_name, pragmas=None, cached_statements=128, read_only=False):
+        """
+        Ініціалізує менеджер підключень.
+
+        :param db_name: Шлях до файлу SQLite бази даних.
+        :type db_name: str
+        :param pragmas: PRAGMA для нових підключень. За замовчуванням DEFAULT_PRAGMAS.
+        :type pragmas: dict, опціонально
+        :param cached_statements: Розмір кешу підготовлених запитів. За замовчуванням 128.
+        :type cached_statements: int, опціонально
+        :param read_only: Відкривати підключення в режимі лише для читання (mode=ro).
+            Режим журналу при цьому не змінюється. За замовчуванням False.
+        :type read_only: bool, опціонально
+        """
+        self.db_name = db_name
+        self.pragmas = DEFAULT_PRAGMAS if pragmas is None else pragmas
+        self.cached_statements = cached_statements
+        self.read_only = read_only
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """
+        Відкриває нове підключення та застосовує до нього PRAGMA.
+
+        :return: Нове підключення до бази даних.
+        :rtype: sqlite3.Connection
+        """
+        if self.read_only:
+            database = f"{pathlib.Path(self.db_name).absolute().as_uri()}?mode=ro"
+        else:
+            database = self.db_name
+        conn = sqlite3.connect(database, isolation_level=None, check_same_thread=False,
+                               cached_statements=self.cached_statements, uri=self.read_only)
+        for name, value in self.pragmas.items():
+            # Режим журналу зберігається у файлі бази, підключення для читання його не змінюють
+            if not (self.read_only and name == 'journal_mode'):
+                conn.execute(f"PRAGMA {name}={value}")
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @property
+    def connection(self):
+        """
+        Повертає підключення поточного потоку, відкриваючи його за потреби.
+
+        :return: Підключення до бази даних.
+        :rtype: sqlite3.Connection
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    @property
+    def in_transaction(self):
+        """
+        Чи відкрита область транзакції на підключенні поточного потоку.
+
+        :rtype: bool
+        """
+        return getattr(self._local, 'depth', 0) > 0
+
+    @contextmanager
+    def transaction(self):
+        """
+        Відкриває область транзакції на підключенні поточного потоку.
+
+        Зовнішня область виконує BEGIN/COMMIT (або ROLLBACK у разі винятку),
+        вкладені області використовують SAVEPOINT, тому їх можна безпечно комбінувати.
+
+        :return: Підключення, на якому відкрита транзакція.
+        :rtype: sqlite3.Connection
+        """
+        conn = self.connection
+        depth = self._local.depth
+        savepoint = f"sp_{depth}"
+        conn.execute("BEGIN" if depth == 0 else f"SAVEPOINT {savepoint}")
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            if depth == 0:
+                conn.execute("ROLLBACK")
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        else:
+            conn.execute("COMMIT" if depth == 0 else f"RELEASE {savepoint}")
+        finally:
+            self._local.depth = depth
+
+    def close(self):
+        """
+        Закриває всі підключення, відкриті менеджером у будь-якому потоці.
+
+        :return: None
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
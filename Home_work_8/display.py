@@ -1,5 +1,7 @@
 import logging
+from collections.abc import Iterable
 from json_loader import load_json
+from message_catalog import MessageCatalog, write_lines
 
 
 class Display:
@@ -7,20 +9,29 @@ class Display:
     Клас для управління відображенням повідомлень та обробкою вводу користувача.
     Використовується для взаємодії з користувачем через консоль.
 
+    Окремі повідомлення проходять через логер 'console_logger' (консоль і файл логу),
+    а багаторядкові звіти виводяться пакетами напряму в потік, без запису кожного рядка в лог.
+
     Атрибути:
         logger (logging.Logger): Об'єкт логера для запису повідомлень у консоль.
         messages (dict): Словник з шаблонами повідомлень, завантажених з JSON.
+        catalog (MessageCatalog): Скомпільовані шаблони повідомлень.
+        stream (io.TextIOBase): Потік для виводу звітів (None — sys.stdout на момент виводу).
     """
 
-    def __init__(self, messages_file='data/messages_ua.json'):
+    def __init__(self, messages_file='data/messages_ua.json', stream=None):
         """
         Ініціалізує екземпляр класу Display з файлами повідомлень та налаштовує логування.
 
         :param messages_file: Шлях до JSON-файлу з повідомленнями. За замовчуванням 'messages_ua.json'.
         :type messages_file: str
+        :param stream: Потік для виводу звітів. За замовчуванням None (sys.stdout).
+        :type stream: io.TextIOBase, опціонально
         """
         self.logger = logging.getLogger('console_logger')
         self.messages = load_json(messages_file)
+        self.catalog = MessageCatalog.from_file(messages_file)
+        self.stream = stream
 
     def __call__(self, category, message_key):
         """
@@ -49,12 +60,35 @@ class Display:
         """
         Відображає список повідомлень у консолі.
 
-        :param messages: Список повідомлень для відображення.
-        :type messages: list
+        :param messages: Список або генератор повідомлень для відображення (читається ліниво).
+        :type messages: Iterable
         :return: None
         """
-        for message in messages:
-            self.display(message)
+        self.write_lines(messages)
+
+    def write_lines(self, lines):
+        """
+        Виводить готові рядки звіту пакетами одним викликом write на пакет.
+
+        :param lines: Ітерований об'єкт рядків.
+        :type lines: Iterable[str]
+        :return: Кількість виведених рядків.
+        :rtype: int
+        """
+        return write_lines(lines, self.stream)
+
+    def render_rows(self, template, rows):
+        """
+        Форматує рядки даних скомпільованим шаблоном і виводить їх пакетами.
+
+        :param template: Скомпільований шаблон повідомлення.
+        :type template: MessageTemplate
+        :param rows: Ітерований об'єкт рядків даних (кортежі або окремі значення).
+        :type rows: Iterable
+        :return: Кількість виведених рядків.
+        :rtype: int
+        """
+        return self.write_lines(map(template.render_row, rows))
 
     def show_formatted_messages(self, category, message_key, data_list):
         """
@@ -64,25 +98,20 @@ class Display:
         :type category: str
         :param message_key: Ключ повідомлення для форматування.
         :type message_key: str
-        :param data_list: Список або кортеж даних для форматування повідомлення.
-        :type data_list: list або tuple
+        :param data_list: Кортеж даних для одного повідомлення або список/генератор елементів
+            для кількох повідомлень (генератор читається ліниво).
+        :type data_list: tuple, list або Iterable
         :return: None
         :raises TypeError: Якщо тип `data_list` не підтримується для форматування.
         """
-        message_template = self.get_message(category, message_key)
+        template = self.catalog.get(category, message_key, self._missing_message(category, message_key))
 
         if isinstance(data_list, tuple):
             # Якщо передано кортеж даних, обробляємо його як один елемент
-            self.display(message_template.format(*data_list))
-        elif isinstance(data_list, list):
-            # Якщо передано список, проходимо по кожному елементу списку
-            for data in data_list:
-                if isinstance(data, tuple):
-                    # Якщо елемент списку — кортеж, розпаковуємо його
-                    self.display(message_template.format(*data))
-                else:
-                    # Якщо елемент списку — рядок, передаємо його як одне значення
-                    self.display(message_template.format(data))
+            self.display(template.render(*data_list))
+        elif isinstance(data_list, Iterable) and not isinstance(data_list, (str, bytes)):
+            # Якщо передано список або генератор, кортежі розпаковуються, інші значення передаються як одне поле
+            self.render_rows(template, data_list)
         else:
             self.logger.error(f"Непідтримуваний тип даних для форматування: {type(data_list)}")
             raise TypeError(f"Непідтримуваний тип даних для форматування: {type(data_list)}")
@@ -115,9 +144,16 @@ class Display:
         :return: Отримане повідомлення або повідомлення за замовчуванням, якщо ключ не знайдено.
         :rtype: str
         """
-        category_dict = self.messages.get(category, {})
-        return category_dict.get(message_key,
-                                 f"Повідомлення для ключа '{message_key}' в категорії '{category}' не знайдено.")
+        return self.catalog.text(category, message_key, self._missing_message(category, message_key))
+
+    @staticmethod
+    def _missing_message(category, message_key):
+        """
+        Повертає текст-заглушку для відсутнього повідомлення.
+
+        :rtype: str
+        """
+        return f"Повідомлення для ключа '{message_key}' в категорії '{category}' не знайдено."
 
     def show_message(self, category, message_key, *args):
         """
@@ -131,13 +167,13 @@ class Display:
         :type args: tuple
         :return: None
         """
-        message_template = self.get_message(category, message_key)
+        template = self.catalog.get(category, message_key, self._missing_message(category, message_key))
         if args:
             try:
-                message = message_template.format(*args)
+                message = template.render(*args)
             except IndexError as e:
                 self.logger.error(f"Помилка форматування повідомлення: {e}")
-                message = message_template
+                message = template.text
         else:
-            message = message_template
+            message = template.text
         self.display(message)
@@ -0,0 +1,55 @@
+"""
+Скрипт командного рядка для масового імпорту каталогу фільмів, акторів та зв'язків між ними.
+
+Приклад запуску з каталогу Home_work_8:
+    python import_catalogue.py --actors actors.csv --movies movies.jsonl --cast cast.csv
+
+Підтримувані формати файлів: CSV (з заголовком), JSON Lines та JSON-масив.
+"""
+
+import argparse
+
+from movie_database import MovieDatabase, DEFAULT_IMPORT_BATCH_SIZE, global_db_name
+from display import Display
+
+
+def parse_args():
+    """
+    Розбирає аргументи командного рядка.
+
+    :return: Розібрані аргументи.
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Масовий імпорт каталогу в базу даних фільмів.")
+    parser.add_argument('--db', default=global_db_name, help="Шлях до файлу бази даних.")
+    parser.add_argument('--movies', help="Файл з фільмами (title, release_year, genre).")
+    parser.add_argument('--actors', help="Файл з акторами (name, birth_year).")
+    parser.add_argument('--cast', help="Файл зі зв'язками (movie_id/movie_title, actor_id/actor_name).")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_IMPORT_BATCH_SIZE,
+                        help="Кількість рядків в одній транзакції.")
+    return parser.parse_args()
+
+
+def main():
+    """
+    Застосовує міграції схеми за потреби та імпортує вказані файли.
+
+    :return: None
+    """
+    args = parse_args()
+    display = Display()
+
+    if not (args.movies or args.actors or args.cast):
+        display.show_message("import", "nothing_to_import")
+        return
+
+    with MovieDatabase(db_name=args.db, display=display) as db:
+        db.migrate()
+        summary = db.import_catalogue(args.movies, args.actors, args.cast, args.batch_size)
+
+    for name, (inserted, skipped) in summary.items():
+        display.show_message("import", "import_summary", name, inserted, skipped)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,25 @@
 """
 
 import json
+import os
 
 # Кеш для збереження завантажених JSON-файлів, щоб уникнути повторного читання з диску
 _json_cache = {}
 
 
+def normalize_path(file_path):
+    """
+    Приводить шлях до абсолютного нормалізованого вигляду, щоб різні записи одного шляху
+    ('data/x.json', './data/x.json') потрапляли в один запис кешу.
+
+    :param file_path: Шлях до файлу.
+    :type file_path: str
+    :return: Нормалізований абсолютний шлях.
+    :rtype: str
+    """
+    return os.path.normcase(os.path.abspath(file_path))
+
+
 def load_json(file_path):
     """
     Завантажує дані з JSON-файлу з використанням кешу для покращення продуктивності.
@@ -24,12 +38,13 @@ def load_json(file_path):
     :raises FileNotFoundError: Якщо файл не знайдено за вказаним шляхом.
     :raises json.JSONDecodeError: Якщо файл не є валідним JSON.
     """
-    if file_path not in _json_cache:
+    path = normalize_path(file_path)
+    if path not in _json_cache:
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                _json_cache[file_path] = json.load(file)
+            with open(path, 'r', encoding='utf-8') as file:
+                _json_cache[path] = json.load(file)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Файл не знайдено: {file_path}") from e
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Помилка декодування JSON у файлі: {file_path}", e.doc, e.pos) from e
-    return _json_cache[file_path]
+    return _json_cache[path]
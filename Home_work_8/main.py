@@ -4,12 +4,12 @@
 Цей скрипт виконує наступні дії:
 1. Ініціалізує об'єкт Display для взаємодії з користувачем.
 2. Створює об'єкт MovieDatabase для управління базою даних.
-3. Створює необхідні таблиці в базі даних.
+3. Приводить схему бази даних до актуальної версії (міграції).
 4. Ініціалізує та запускає головне меню додатку.
 
 Передумови:
 - Наявність файлів конфігурації для налаштування логування та параметрів бази даних.
-- Наявність SQL-скриптів для створення таблиць та виконання запитів.
+- Наявність SQL-скриптів для міграцій схеми та виконання запитів.
 """
 
 from movie_database import MovieDatabase  # Імпортуємо MovieDatabase для управління базою даних фільмів
@@ -26,17 +26,17 @@ def main():
     # Ініціалізуємо екземпляр Display для взаємодії з користувачем
     display_instance = Display()
 
-    # Ініціалізуємо екземпляр MovieDatabase, передаючи об'єкт Display
-    db = MovieDatabase(display=display_instance)
+    # Ініціалізуємо екземпляр MovieDatabase, передаючи об'єкт Display;
+    # підключення до бази закриваються при виході з блоку with
+    with MovieDatabase(display=display_instance) as db:
+        # Застосовуємо незастосовані міграції схеми (таблиці, індекси)
+        db.migrate()
 
-    # Створюємо необхідні таблиці в базі даних, якщо вони ще не існують
-    db.create_tables()
+        # Ініціалізуємо екземпляр Menu, передаючи об'єкти MovieDatabase та Display
+        menu = Menu(db, display_instance)
 
-    # Ініціалізуємо екземпляр Menu, передаючи об'єкти MovieDatabase та Display
-    menu = Menu(db, display_instance)
-
-    # Запускаємо головний цикл меню, що дозволяє користувачу вибирати дії
-    menu.run()
+        # Запускаємо головний цикл меню, що дозволяє користувачу вибирати дії
+        menu.run()
 
 
 if __name__ == "__main__":
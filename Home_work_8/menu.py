@@ -1,3 +1,6 @@
+from message_catalog import compile_menu
+
+
 class Menu:
     """
     Клас для управління головним меню додатку, що дозволяє користувачу виконувати різні дії
@@ -6,6 +9,7 @@ class Menu:
     Атрибути:
         movie_database (MovieDatabase): Об'єкт для управління базою даних фільмів.
         display (Display): Об'єкт для взаємодії з користувачем (ввід/вивід).
+        menu (MenuSpec): Головне меню, скомпільоване з опцій меню один раз при ініціалізації.
     """
 
     def __init__(self, movie_database, display):
@@ -19,6 +23,7 @@ class Menu:
         """
         self.movie_database = movie_database
         self.display = display
+        self.menu = compile_menu(movie_database.menu_options)
 
     def run(self):
         """
@@ -28,20 +33,19 @@ class Menu:
         :raises KeyError: Якщо в конфігурації меню відсутні необхідні ключі.
         :return: None
         """
-        # Створюємо словник дій, де ключами є вибрані опції, а значеннями — відповідні методи
-        actions = {option['key']: option['action'] for option in
-                   self.movie_database.menu_options['menus']['main_menu']['options']}
+        # Словник дій, де ключами є вибрані опції, а значеннями — відповідні методи
+        actions = self.menu.actions
 
         while True:
 
             print()
 
             # Показуємо заголовок головного меню
-            self.display.display(self.movie_database.menu_options['menus']['main_menu']['title'])
+            self.display.display(self.menu.title)
 
-            # Відображаємо всі доступні опції меню
-            for option in self.movie_database.menu_options['menus']['main_menu']['options']:
-                self.display.display(f"{option['key']}. {option['option_name']}")
+            # Відображаємо всі доступні опції меню (рядки підготовлені заздалегідь)
+            for line in self.menu.lines:
+                self.display.display(line)
 
 
             print()
@@ -0,0 +1,201 @@
+"""
+Модуль скомпільованих шаблонів повідомлень та меню.
+
+JSON-файли повідомлень і меню один раз перетворюються на плоскі словники об'єктів
+`MessageTemplate` з інтернованими рядками та заздалегідь розібраними полями форматування,
+тому відображення рядка звіту не потребує вкладених пошуків у словниках.
+
+Функції `write_lines` та `render_rows` виводять великі звіти пакетами рядків: один виклик
+`write` на пакет замість проходу кожного рядка через обробники логування.
+"""
+
+import string
+import sys
+from collections import namedtuple
+
+from json_loader import load_json, normalize_path
+from record_reader import batched
+
+# Кількість рядків, що виводяться одним викликом write
+RENDER_CHUNK_SIZE = 1000
+
+_formatter = string.Formatter()
+
+
+class MessageTemplate:
+    """
+    Скомпільований шаблон повідомлення.
+
+    Атрибути:
+        key (str): Повний ключ 'категорія.ключ'.
+        text (str): Текст шаблону.
+        fields (tuple): Назви полів форматування у порядку появи ('' для автонумерації).
+    """
+
+    __slots__ = ('key', 'text', 'fields', 'render')
+
+    def __init__(self, key, text):
+        """
+        Ініціалізує MessageTemplate та розбирає поля форматування.
+
+        :param key: Повний ключ 'категорія.ключ'.
+        :type key: str
+        :param text: Текст шаблону у форматі str.format.
+        :type text: str
+        :raises ValueError: Якщо шаблон містить некоректний синтаксис форматування.
+        """
+        self.key = sys.intern(key)
+        self.text = sys.intern(text)
+        self.fields = tuple(field for _, field, _, _ in _formatter.parse(text) if field is not None)
+        # Шаблон без полів повертається як є, інакше — зв'язаний метод format без пошуку атрибута
+        self.render = self._constant if not self.fields else self.text.format
+
+    def _constant(self, *args):
+        return self.text
+
+    def render_row(self, row):
+        """
+        Форматує один рядок даних: кортеж розпаковується в поля, інше значення передається як одне поле.
+
+        :param row: Дані для форматування.
+        :type row: tuple або Any
+        :return: Відформатоване повідомлення.
+        :rtype: str
+        """
+        return self.render(*row) if isinstance(row, tuple) else self.render(row)
+
+    def __repr__(self):
+        return f"MessageTemplate({self.key!r}, {self.text!r})"
+
+
+class MessageCatalog:
+    """
+    Плоский каталог скомпільованих шаблонів повідомлень.
+
+    Атрибути:
+        templates (dict): (категорія, ключ) -> MessageTemplate.
+    """
+
+    def __init__(self, messages):
+        """
+        Компілює вкладений словник повідомлень {категорія: {ключ: текст}}.
+
+        :param messages: Словник повідомлень, завантажений з JSON.
+        :type messages: dict
+        """
+        self.templates = {
+            (sys.intern(category), sys.intern(key)): MessageTemplate(f"{category}.{key}", text)
+            for category, entries in messages.items()
+            for key, text in entries.items()
+        }
+
+    def get(self, category, key, default=None):
+        """
+        Повертає шаблон повідомлення.
+
+        :param category: Категорія повідомлення.
+        :type category: str
+        :param key: Ключ повідомлення.
+        :type key: str
+        :param default: Текст, який повертається як шаблон без полів, якщо ключ не знайдено.
+            За замовчуванням None.
+        :type default: str, опціонально
+        :return: Шаблон повідомлення або None, якщо ключ не знайдено і default не задано.
+        :rtype: MessageTemplate або None
+        """
+        template = self.templates.get((category, key))
+        if template is None and default is not None:
+            # Текст за замовчуванням не є шаблоном: фігурні дужки в ньому екрануються
+            template = MessageTemplate(f"{category}.{key}", default.replace('{', '{{').replace('}', '}}'))
+        return template
+
+    def text(self, category, key, default=None):
+        """
+        Повертає текст шаблону повідомлення.
+
+        :return: Текст шаблону або default, якщо ключ не знайдено.
+        :rtype: str
+        """
+        template = self.templates.get((category, key))
+        return default if template is None else template.text
+
+    @classmethod
+    def from_file(cls, file_path):
+        """
+        Повертає скомпільований каталог JSON-файлу повідомлень (компілюється один раз на файл).
+
+        :param file_path: Шлях до JSON-файлу повідомлень.
+        :type file_path: str
+        :return: Каталог повідомлень.
+        :rtype: MessageCatalog
+        """
+        path = normalize_path(file_path)
+        catalog = _catalogs.get(path)
+        if catalog is None:
+            catalog = _catalogs[path] = cls(load_json(path))
+        return catalog
+
+
+_catalogs = {}
+
+# Скомпільоване меню: заголовок, готові рядки опцій та словник ключ -> дія
+MenuSpec = namedtuple('MenuSpec', ['title', 'lines', 'actions'])
+
+
+def compile_menu(menu_options, menu_name='main_menu'):
+    """
+    Компілює опис меню з JSON у готові до виводу рядки.
+
+    :param menu_options: Словник опцій меню, завантажений з JSON.
+    :type menu_options: dict
+    :param menu_name: Назва меню. За замовчуванням 'main_menu'.
+    :type menu_name: str
+    :return: Скомпільоване меню.
+    :rtype: MenuSpec
+    :raises KeyError: Якщо в описі меню відсутні необхідні ключі.
+    """
+    menu = menu_options['menus'][menu_name]
+    return MenuSpec(
+        title=sys.intern(menu['title']),
+        lines=tuple(sys.intern(f"{option['key']}. {option['option_name']}") for option in menu['options']),
+        actions={sys.intern(option['key']): sys.intern(option['action']) for option in menu['options']},
+    )
+
+
+def write_lines(lines, stream=None, chunk_size=RENDER_CHUNK_SIZE):
+    """
+    Виводить рядки пакетами: один виклик write на chunk_size рядків.
+
+    :param lines: Ітерований об'єкт рядків без символу нового рядка.
+    :type lines: Iterable[str]
+    :param stream: Потік виводу. За замовчуванням sys.stdout (на момент виклику).
+    :type stream: io.TextIOBase, опціонально
+    :param chunk_size: Кількість рядків в одному пакеті. За замовчуванням RENDER_CHUNK_SIZE.
+    :type chunk_size: int, опціонально
+    :return: Кількість виведених рядків.
+    :rtype: int
+    """
+    stream = sys.stdout if stream is None else stream
+    count = 0
+    for chunk in batched(lines, chunk_size):
+        stream.write('\n'.join(chunk) + '\n')
+        count += len(chunk)
+    return count
+
+
+def render_rows(template, rows, stream=None, chunk_size=RENDER_CHUNK_SIZE):
+    """
+    Форматує рядки даних шаблоном і виводить їх пакетами (див. write_lines).
+
+    :param template: Скомпільований шаблон.
+    :type template: MessageTemplate
+    :param rows: Ітерований об'єкт рядків даних (кортежі або окремі значення).
+    :type rows: Iterable
+    :param stream: Потік виводу. За замовчуванням sys.stdout.
+    :type stream: io.TextIOBase, опціонально
+    :param chunk_size: Кількість рядків в одному пакеті. За замовчуванням RENDER_CHUNK_SIZE.
+    :type chunk_size: int, опціонально
+    :return: Кількість виведених рядків.
+    :rtype: int
+    """
+    return write_lines(map(template.render_row, rows), stream, chunk_size)
@@ -0,0 +1,113 @@
+"""
+Модуль версіонованих міграцій схеми бази даних фільмів.
+
+Поточна версія схеми зберігається в `PRAGMA user_version`. Кожна міграція виконується
+в окремій транзакції разом з оновленням версії, тому база ніколи не залишається
+в проміжному стані. Нові зміни схеми додаються в кінець списку `MIGRATIONS`.
+"""
+
+from collections import namedtuple
+import logging
+
+db_logger = logging.getLogger('db_logger')
+
+# Міграція: номер версії, назва та функція, що приймає MovieDatabase і застосовує зміни
+Migration = namedtuple('Migration', ['version', 'name', 'apply'])
+
+
+def _create_core_tables(db):
+    """
+    Створює таблиці фільмів, акторів та зв'язків між ними.
+    """
+    db.execute_script(['create_movies_table.sql', 'create_actors_table.sql', 'create_movie_cast_table.sql'])
+
+
+def _create_fts_index(db):
+    """
+    Створює повнотекстовий індекс назв фільмів, якщо SQLite підтримує FTS5.
+    """
+    if not db.create_fts_index():
+        db_logger.warning("FTS5 недоступний: пошук за назвою використовуватиме LIKE.")
+
+
+def _add_secondary_indexes(db):
+    """
+    Додає індекси для звітів за жанрами, пагінації за роком випуску та зв'язків за актором.
+    """
+    db.execute_script(['create_movies_genre_index.sql', 'create_movies_release_year_index.sql',
+                       'create_movie_cast_actor_index.sql'])
+
+
+def _create_genre_stats(db):
+    """
+    Створює зведену таблицю статистики жанрів, тригери її підтримки та заповнює її.
+    """
+    db.execute_script(['create_genre_stats_table.sql', 'create_genre_stats_movie_insert_trigger.sql',
+                       'create_genre_stats_movie_delete_trigger.sql', 'create_genre_stats_movie_update_trigger.sql',
+                       'create_genre_stats_cast_insert_trigger.sql', 'create_genre_stats_cast_delete_trigger.sql',
+                       'create_genre_stats_actor_update_trigger.sql', 'create_genre_stats_actor_delete_trigger.sql'])
+    db.execute_script(['clear_genre_stats.sql', 'rebuild_genre_stats.sql'])
+
+
+MIGRATIONS = [
+    Migration(1, 'create_core_tables', _create_core_tables),
+    Migration(2, 'create_movies_fts', _create_fts_index),
+    Migration(3, 'add_secondary_indexes', _add_secondary_indexes),
+    Migration(4, 'create_genre_stats', _create_genre_stats),
+]
+
+
+class MigrationRunner:
+    """
+    Клас для застосування міграцій схеми до бази даних.
+
+    Атрибути:
+        db (MovieDatabase): База даних, до якої застосовуються міграції.
+        migrations (list): Впорядкований список міграцій.
+    """
+
+    def __init__(self, db, migrations=None):
+        """
+        Ініціалізує MigrationRunner.
+
+        :param db: База даних, до якої застосовуються міграції.
+        :type db: MovieDatabase
+        :param migrations: Список міграцій. За замовчуванням MIGRATIONS.
+        :type migrations: list, опціонально
+        """
+        self.db = db
+        self.migrations = MIGRATIONS if migrations is None else migrations
+
+    def current_version(self):
+        """
+        Повертає поточну версію схеми бази даних.
+
+        :return: Значення PRAGMA user_version.
+        :rtype: int
+        """
+        return self.db.execute_query("PRAGMA user_version", fetch=True)[0][0]
+
+    def pending(self):
+        """
+        Повертає міграції, які ще не застосовані до бази даних.
+
+        :return: Список міграцій з версією, більшою за поточну.
+        :rtype: list
+        """
+        version = self.current_version()
+        return [migration for migration in self.migrations if migration.version > version]
+
+    def migrate(self):
+        """
+        Застосовує всі незастосовані міграції по черзі.
+
+        :return: Версія схеми після застосування міграцій.
+        :rtype: int
+        """
+        for migration in self.pending():
+            with self.db.transaction():
+                migration.apply(self.db)
+                # PRAGMA не підтримує параметри, версія — ціле число з коду міграції
+                self.db.execute_query(f"PRAGMA user_version = {int(migration.version)}")
+            db_logger.debug(f"Застосовано міграцію {migration.version}: {migration.name}")
+        return self.current_version()
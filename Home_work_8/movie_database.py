@@ -1,9 +1,19 @@
 import sqlite3
 import datetime
+import logging
+import time
 from contextlib import closing
-import os
+from itertools import chain
 from json_loader import load_json  # Імпортуємо функцію завантаження JSON
-from config_loader import setup_logging, load_config
+from message_catalog import MessageCatalog
+from config_loader import setup_logging, load_config, load_slow_query_threshold
+from connection_manager import ConnectionManager
+from sql_registry import ScriptRegistry
+from record_reader import iter_records, batched, required
+from migrations import MigrationRunner
+from query_stats import QueryStats, AD_HOC_QUERY
+from result_cache import ResultCache, DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL
+from cast_graph import CastGraph, group_rows
 
 # Ініціалізація логування
 db_logger = setup_logging()
@@ -11,6 +21,49 @@ db_logger = setup_logging()
 # Завантаження налаштувань конфігурації
 global_db_name, global_messages_file, global_menu_file = load_config()
 
+# Кількість рядків, що вставляються однією транзакцією при масовому імпорті
+DEFAULT_IMPORT_BATCH_SIZE = 10000
+
+# Кількість рядків, що отримуються з курсора за один виклик fetchmany при потоковому читанні
+DEFAULT_FETCH_BATCH_SIZE = 1000
+
+# Режими пошуку фільмів за назвою: 'like' працює завжди, решта потребують FTS5
+SEARCH_MODES = ('like', 'prefix', 'phrase', 'ranked')
+
+# Ключі сортування для посторінкового перегляду: назва -> індекси колонок рядка (id, title, release_year, genre)
+PAGINATION_KEYS = {
+    'id': (0,),
+    'genre': (3, 0),
+    'release_year': (2, 0),
+}
+
+# Ключі, менші за будь-який реальний ключ відповідного сортування (початок першої сторінки)
+_SQLITE_MIN_INT = -2 ** 63
+FIRST_PAGE_KEYS = {
+    'id': (_SQLITE_MIN_INT,),
+    'genre': ('', _SQLITE_MIN_INT),
+    'release_year': (_SQLITE_MIN_INT, _SQLITE_MIN_INT),
+}
+
+# SQL-скрипти для створення повнотекстового індексу назв фільмів
+FTS_SCRIPTS = ['create_movies_fts_table.sql', 'create_movies_fts_insert_trigger.sql',
+               'create_movies_fts_delete_trigger.sql', 'create_movies_fts_update_trigger.sql']
+
+
+def fts5_available():
+    """
+    Перевіряє, чи зібрано поточну версію SQLite з підтримкою FTS5.
+
+    :return: True, якщо віртуальні таблиці FTS5 підтримуються, інакше False.
+    :rtype: bool
+    """
+    with closing(sqlite3.connect(':memory:')) as conn:
+        try:
+            conn.execute("CREATE VIRTUAL TABLE fts5_probe USING fts5(text)")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
 
 class MovieDatabase:
     """
@@ -19,13 +72,18 @@ class MovieDatabase:
 
     Attributes:
         db_name (str): Назва файлу SQLite бази даних.
-        messages (dict): Словник з шаблонами повідомлень, завантажених з JSON.
+        catalog (MessageCatalog): Скомпільовані шаблони повідомлень.
         menu_options (dict): Словник з опціями меню, завантажених з JSON.
         display (Display): Об'єкт для взаємодії з користувачем (ввід/вивід).
+        connections (ConnectionManager): Менеджер постійних підключень до бази даних.
+        scripts (ScriptRegistry): Реєстр SQL-скриптів, завантажених при ініціалізації.
+        query_stats (QueryStats): Статистика часу виконання SQL-скриптів.
+        result_cache (ResultCache): Кеш результатів скриптів читання, що інвалідовується запитами запису.
     """
 
     def __init__(self, db_name=global_db_name, messages_file=global_messages_file, menu_file=global_menu_file,
-                 display=None):
+                 display=None, watch_scripts=False, slow_query_ms=None,
+                 cache_size=DEFAULT_CACHE_SIZE, cache_ttl=DEFAULT_CACHE_TTL):
         """
         Ініціалізує екземпляр MovieDatabase з назвою бази даних, повідомленнями,
         опціями меню та об'єктом display для взаємодії з користувачем.
@@ -38,11 +96,62 @@ class MovieDatabase:
         :type menu_file: str
         :param display: Об'єкт для обробки вводу/виводу користувача. За замовчуванням None.
         :type display: Display, опціонально
+        :param watch_scripts: Перечитувати змінені SQL-скрипти (режим розробки). За замовчуванням False.
+        :type watch_scripts: bool, опціонально
+        :param slow_query_ms: Поріг повільного запиту в мілісекундах. За замовчуванням — з settings.conf.
+        :type slow_query_ms: float, опціонально
+        :param cache_size: Кількість записів кешу результатів (0 вимикає кеш). За замовчуванням DEFAULT_CACHE_SIZE.
+        :type cache_size: int, опціонально
+        :param cache_ttl: Час життя запису кешу в секундах. За замовчуванням DEFAULT_CACHE_TTL.
+        :type cache_ttl: float, опціонально
         """
         self.db_name = db_name
-        self.messages = load_json(messages_file)
+        self.catalog = MessageCatalog.from_file(messages_file)
         self.menu_options = load_json(menu_file)
         self.display = display  # Зберігаємо об'єкт Display як атрибут класу
+        self.scripts = ScriptRegistry(watch=watch_scripts)
+        # Кеш підготовлених запитів вміщує всі скрипти реєстру з запасом для ad-hoc запитів
+        self.connections = ConnectionManager(db_name, cached_statements=max(128, 2 * len(self.scripts)))
+        self._fts_enabled = None  # Визначається ліниво при першому пошуку
+        self.query_stats = QueryStats(load_slow_query_threshold() if slow_query_ms is None else slow_query_ms)
+        self.result_cache = ResultCache(cache_size, cache_ttl)
+
+    def __enter__(self):
+        """
+        Повертає екземпляр MovieDatabase при вході в контекстний менеджер.
+
+        :return: Екземпляр MovieDatabase.
+        :rtype: MovieDatabase
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Закриває всі підключення до бази даних при виході з контекстного менеджера.
+
+        :return: False, щоб не приховувати виключення.
+        :rtype: bool
+        """
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Закриває всі відкриті підключення до бази даних.
+
+        :return: None
+        """
+        self.connections.close()
+
+    def transaction(self):
+        """
+        Повертає явну область транзакції: усі запити всередині блоку `with`
+        виконуються на одному підключенні та фіксуються одним COMMIT.
+
+        :return: Контекстний менеджер транзакції.
+        :rtype: contextlib.AbstractContextManager
+        """
+        return self.connections.transaction()
 
     def get_message(self, category, key):
         """
@@ -55,8 +164,8 @@ class MovieDatabase:
         :return: Отримане повідомлення або повідомлення за замовчуванням, якщо ключ не знайдено.
         :rtype: str
         """
-        return self.messages.get(category, {}).get(key,
-                                                   f"Повідомлення для ключа '{key}' не знайдено в категорії '{category}'")
+        return self.catalog.text(category, key,
+                                 f"Повідомлення для ключа '{key}' не знайдено в категорії '{category}'")
 
     @staticmethod
     def movie_age(year):
@@ -73,7 +182,7 @@ class MovieDatabase:
 
     def execute_script(self, script_name_or_filenames, params=(), fetch=False):
         """
-        Виконує один або декілька SQL-скриптів з каталогу 'sql_scripts'.
+        Виконує один або декілька SQL-скриптів з реєстру скриптів каталогу 'sql_scripts'.
 
         :param script_name_or_filenames: Назва одного SQL-скрипта або список назв скриптів.
         :type script_name_or_filenames: str або list
@@ -85,18 +194,13 @@ class MovieDatabase:
         :rtype: Any
         """
         if isinstance(script_name_or_filenames, list):
-            # Виконуємо кілька скриптів
-            for filename in script_name_or_filenames:
-                script_path = os.path.join('sql_scripts', filename)
-                with open(script_path, 'r', encoding='utf-8') as file:
-                    script = file.read()
-                self.execute_query(script)
+            # Виконуємо кілька скриптів в одній транзакції
+            with self.transaction():
+                for filename in script_name_or_filenames:
+                    self.execute_query(self.scripts.get(filename))
         else:
             # Виконуємо один скрипт
-            script_path = os.path.join('sql_scripts', script_name_or_filenames)
-            with open(script_path, 'r', encoding='utf-8') as file:
-                query = file.read()
-            return self.execute_query(query, params, fetch)
+            return self.execute_query(self.scripts.get(script_name_or_filenames), params, fetch)
 
     def execute_query(self, query, params=(), fetch=False):
         """
@@ -111,27 +215,60 @@ class MovieDatabase:
         :return: Отримані результати або ID останнього вставленого рядка, залежно від параметра 'fetch'.
         :rtype: Any
         """
-        return self._execute_with_cursor(lambda cursor: self._execute_and_fetch(cursor, query, params, fetch))
+        cache_key = self._cache_key(query, params) if fetch else None
+        if cache_key is not None:
+            rows = self.result_cache.get(cache_key)
+            if rows is not None:
+                return list(rows)
+
+        result = self._execute_with_cursor(lambda cursor: self._execute_and_fetch(cursor, query, params, fetch))
+
+        reads, writes = self.result_cache.tags(query)
+        self.result_cache.invalidate(writes)
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result, reads)
+        return result
+
+    def _cache_key(self, query, params):
+        """
+        Повертає ключ кешу результатів для запиту або None, якщо результат не кешується.
+
+        Кешуються лише скрипти реєстру, що тільки читають таблиці, і лише поза явною транзакцією:
+        всередині неї запит може бачити незафіксовані зміни, які ще можуть бути відкочені.
+
+        :param query: SQL-запит.
+        :type query: str
+        :param params: Параметри запиту.
+        :type params: tuple
+        :return: Кортеж (назва скрипта, параметри) або None.
+        :rtype: tuple або None
+        """
+        if not self.result_cache.enabled or self.connections.in_transaction:
+            return None
+        script = self.scripts.name_of(query)
+        reads, writes = self.result_cache.tags(query)
+        if script is None or writes or not reads:
+            return None
+        return script, tuple(params)
 
     def _execute_with_cursor(self, operation):
         """
-        Виконує операцію з використанням курсора бази даних, забезпечуючи коректне закриття з'єднання.
+        Виконує операцію з використанням курсора на постійному підключенні поточного потоку
+        в межах транзакції (або вкладеної, якщо транзакцію вже відкрито викликачем).
 
         :param operation: Функція, яка приймає курсор і виконує певну операцію.
         :type operation: callable
         :return: Результат виконання функції 'operation'.
         :rtype: Any
         """
-        with closing(sqlite3.connect(self.db_name)) as conn:
+        with self.connections.transaction() as conn:
             with closing(conn.cursor()) as cursor:
-                result = operation(cursor)
-                conn.commit()
-                return result
+                return operation(cursor)
 
-    @staticmethod
-    def _execute_and_fetch(cursor, query, params, fetch):
+    def _execute_and_fetch(self, cursor, query, params, fetch):
         """
         Виконує SQL-запит та, за потреби, отримує результати.
+        Час виконання та кількість рядків записуються в статистику запитів.
 
         :param cursor: Курсор бази даних.
         :type cursor: sqlite3.Cursor
@@ -144,19 +281,169 @@ class MovieDatabase:
         :return: Отримані результати або ID останнього вставленого рядка.
         :rtype: Any
         """
-        db_logger.debug(f"Виконання запиту: {query} з параметрами: {params}")
+        script = self.scripts.name_of(query, AD_HOC_QUERY)
+        started = time.perf_counter()
         cursor.execute(query, params)
         if fetch:
             result = cursor.fetchall()
-            db_logger.debug(f"Результат запиту: {result}")
-            return result
-        return cursor.lastrowid
+            rows = len(result)
+        else:
+            result = cursor.lastrowid
+            rows = cursor.rowcount
+        elapsed = time.perf_counter() - started
 
-    def create_tables(self):
+        self.query_stats.record(script, elapsed, rows, params)
+        if db_logger.isEnabledFor(logging.DEBUG):
+            db_logger.debug("Виконано %s з параметрами %r: рядків %d за %.2f мс",
+                            query if script == AD_HOC_QUERY else script, params, rows, elapsed * 1000)
+        return result
+
+    def migrate(self):
         """
-        Створює необхідні таблиці в базі даних, виконавши відповідні SQL-скрипти.
+        Приводить схему бази даних до актуальної версії, застосовуючи незастосовані міграції.
+
+        :return: Версія схеми після міграції.
+        :rtype: int
+        """
+        version = MigrationRunner(self).migrate()
+        self._fts_enabled = None
+        return version
+
+    def create_fts_index(self):
+        """
+        Створює віртуальну таблицю FTS5 для назв фільмів та тригери синхронізації з таблицею movies.
+        Якщо індекс створюється вперше, заповнює його з наявних фільмів.
+
+        :return: True, якщо індекс створено або він вже існує, False, якщо FTS5 недоступний.
+        :rtype: bool
+        """
+        if not fts5_available():
+            return False
+        with self.transaction():
+            is_new = not self.execute_script('check_movies_fts.sql', fetch=True)
+            self.execute_script(FTS_SCRIPTS)
+            if is_new:
+                self.execute_script('rebuild_movies_fts.sql')
+        return True
+
+    def rebuild_stats(self):
+        """
+        Повністю перераховує зведену таблицю genre_stats з таблиць movies, movie_cast та actors.
+
+        Таблиця підтримується тригерами інкрементально, тому перерахунок потрібен лише для
+        відновлення після змін, виконаних в обхід тригерів.
+
+        :return: None
+        """
+        with self.transaction():
+            self.execute_script(['clear_genre_stats.sql', 'rebuild_genre_stats.sql'])
+        if self.display:
+            self.display.show_message("messages", "stats_rebuilt")
+
+    def stats(self):
+        """
+        Повертає статистику виконання SQL-скриптів з моменту створення об'єкта.
+
+        :return: Список підсумків ScriptStats (назва скрипта, виклики, рядки, p50, p95, p99, max у мс).
+        :rtype: list
+        """
+        return self.query_stats.summary()
+
+    def show_query_stats(self):
+        """
+        Відображає перцентилі часу виконання p50/p95/p99 для кожного виконаного SQL-скрипта.
+
+        :return: None
         """
-        self.execute_script(['create_movies_table.sql', 'create_actors_table.sql', 'create_movie_cast_table.sql'])
+        summary = self.stats()
+        if summary:
+            self.display.show_formatted_messages("messages", "query_stats", summary)
+        else:
+            self.display.show_message("messages", "no_query_stats")
+        self.display.show_formatted_messages("messages", "cache_stats",
+                                             (len(self.result_cache), self.result_cache.hits,
+                                              self.result_cache.misses))
+
+    @property
+    def fts_enabled(self):
+        """
+        Чи доступний повнотекстовий індекс назв фільмів у поточній базі.
+
+        :return: True, якщо таблиця movies_fts існує, інакше False.
+        :rtype: bool
+        """
+        if self._fts_enabled is None:
+            self._fts_enabled = bool(self.execute_script('check_movies_fts.sql', fetch=True))
+        return self._fts_enabled
+
+    def iter_query(self, script_name, params=(), batch_size=DEFAULT_FETCH_BATCH_SIZE):
+        """
+        Виконує SQL-скрипт читання та повертає рядки результату потоково.
+
+        Рядки вибираються з курсора пакетами через fetchmany, тому в пам'яті одночасно
+        знаходиться не більше batch_size рядків незалежно від розміру результату.
+        Невеликі результати зберігаються в кеші результатів і повторно віддаються без звернення до SQLite.
+
+        :param script_name: Назва SQL-скрипта.
+        :type script_name: str
+        :param params: Параметри для передачі в SQL-скрипт. За замовчуванням ().
+        :type params: tuple, опціонально
+        :param batch_size: Кількість рядків в одному пакеті. За замовчуванням DEFAULT_FETCH_BATCH_SIZE.
+        :type batch_size: int, опціонально
+        :return: Генератор рядків результату.
+        :rtype: Iterator[tuple]
+        """
+        query = self.scripts.get(script_name)
+        script = self.scripts.name_of(query)
+        cache_key = self._cache_key(query, params)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                yield from cached
+                return
+
+        # Рядки накопичуються для кешу, доки результат не перевищить ліміт кешованих рядків
+        collected = [] if cache_key is not None else None
+        row_count = 0
+        started = time.perf_counter()
+        with closing(self.connections.connection.execute(query, params)) as cursor:
+            # Враховується лише час роботи SQLite, без часу обробки рядків споживачем
+            elapsed = time.perf_counter() - started
+            while True:
+                started = time.perf_counter()
+                rows = cursor.fetchmany(batch_size)
+                elapsed += time.perf_counter() - started
+                if not rows:
+                    break
+                row_count += len(rows)
+                if collected is not None:
+                    collected.extend(rows)
+                    if len(collected) > self.result_cache.max_rows:
+                        collected = None
+                yield from rows
+
+        if collected is not None:
+            self.result_cache.put(cache_key, collected, self.result_cache.tags(query)[0])
+
+        self.query_stats.record(script, elapsed, row_count, params)
+        if db_logger.isEnabledFor(logging.DEBUG):
+            db_logger.debug("Потоково виконано %s з параметрами %r: рядків %d за %.2f мс",
+                            script, params, row_count, elapsed * 1000)
+
+    @staticmethod
+    def _non_empty(rows):
+        """
+        Перевіряє, чи містить ітерований об'єкт хоча б один рядок, не читаючи його повністю.
+
+        :param rows: Список або генератор рядків.
+        :type rows: Iterable
+        :return: Ітератор з усіма рядками або None, якщо рядків немає.
+        :rtype: Iterator або None
+        """
+        iterator = iter(rows)
+        for first in iterator:
+            return chain((first,), iterator)
+        return None
 
     def get_all_actors(self):
         """
@@ -232,9 +519,10 @@ class MovieDatabase:
             self.display.show_message("messages", "invalid_actor_ids", ", ".join(map(str, invalid_ids)))
             return
 
-        # Связываем выбранных актёров с фильмом
-        for actor_id in selected_indices:
-            self.execute_script('link_actor_to_movie.sql', (movie_id, actor_id))
+        # Связываем выбранных актёров с фильмом одной транзакцией
+        with self.transaction():
+            for actor_id in selected_indices:
+                self.execute_script('link_actor_to_movie.sql', (movie_id, actor_id))
 
         self.display.show_message("messages", "actors_added_to_movie")
 
@@ -260,7 +548,7 @@ class MovieDatabase:
 
         :return: None
         """
-        rows = self.get_all_actors()
+        rows = self.iter_query('get_all_actors.sql')
         self._show_messages_from_rows(
             rows,
             "messages",
@@ -285,16 +573,147 @@ class MovieDatabase:
         except sqlite3.IntegrityError:
             self.display.show_message("messages", "actor_already_linked", actor_id)
 
+    def import_catalogue(self, movies_file=None, actors_file=None, cast_file=None,
+                         batch_size=DEFAULT_IMPORT_BATCH_SIZE):
+        """
+        Масово імпортує каталог з файлів у порядку: актори, фільми, зв'язки акторів з фільмами.
+
+        :param movies_file: Файл з фільмами (колонки title, release_year, genre). За замовчуванням None.
+        :type movies_file: str, опціонально
+        :param actors_file: Файл з акторами (колонки name, birth_year). За замовчуванням None.
+        :type actors_file: str, опціонально
+        :param cast_file: Файл зі зв'язками (movie_id або movie_title, actor_id або actor_name).
+            За замовчуванням None.
+        :type cast_file: str, опціонально
+        :param batch_size: Кількість рядків в одній транзакції. За замовчуванням DEFAULT_IMPORT_BATCH_SIZE.
+        :type batch_size: int, опціонально
+        :return: Підсумок імпорту для кожного файлу: {'actors': (додано, пропущено), ...}.
+        :rtype: dict
+        """
+        summary = {}
+        if actors_file:
+            summary['actors'] = self.import_actors(actors_file, batch_size)
+        if movies_file:
+            summary['movies'] = self.import_movies(movies_file, batch_size)
+        if cast_file:
+            summary['cast'] = self.import_cast(cast_file, batch_size)
+        return summary
+
+    def import_actors(self, file_path, batch_size=DEFAULT_IMPORT_BATCH_SIZE):
+        """
+        Масово імпортує акторів з CSV/JSON файлу.
+
+        :param file_path: Шлях до файлу з колонками name, birth_year.
+        :type file_path: str
+        :param batch_size: Кількість рядків в одній транзакції. За замовчуванням DEFAULT_IMPORT_BATCH_SIZE.
+        :type batch_size: int, опціонально
+        :return: Кортеж (кількість доданих, кількість пропущених записів).
+        :rtype: tuple
+        """
+        return self._bulk_insert(
+            'insert_actor.sql',
+            iter_records(file_path),
+            lambda record: (required(record, 'name'), int(record['birth_year'])),
+            batch_size
+        )
+
+    def import_movies(self, file_path, batch_size=DEFAULT_IMPORT_BATCH_SIZE):
+        """
+        Масово імпортує фільми з CSV/JSON файлу.
+
+        :param file_path: Шлях до файлу з колонками title, release_year, genre.
+        :type file_path: str
+        :param batch_size: Кількість рядків в одній транзакції. За замовчуванням DEFAULT_IMPORT_BATCH_SIZE.
+        :type batch_size: int, опціонально
+        :return: Кортеж (кількість доданих, кількість пропущених записів).
+        :rtype: tuple
+        """
+        return self._bulk_insert(
+            'insert_movie.sql',
+            iter_records(file_path),
+            lambda record: (required(record, 'title'), int(record['release_year']), required(record, 'genre')),
+            batch_size
+        )
+
+    def import_cast(self, file_path, batch_size=DEFAULT_IMPORT_BATCH_SIZE):
+        """
+        Масово імпортує зв'язки акторів з фільмами з CSV/JSON файлу.
+
+        Назви фільмів та імена акторів перетворюються на ID через словники в пам'яті,
+        побудовані одним запитом до кожної таблиці. Для однакових назв використовується
+        запис з найменшим ID. Вже існуючі зв'язки пропускаються.
+
+        :param file_path: Шлях до файлу з колонками movie_id або movie_title та actor_id або actor_name.
+        :type file_path: str
+        :param batch_size: Кількість рядків в одній транзакції. За замовчуванням DEFAULT_IMPORT_BATCH_SIZE.
+        :type batch_size: int, опціонально
+        :return: Кортеж (кількість доданих, кількість пропущених записів).
+        :rtype: tuple
+        """
+        movie_ids, actor_ids = {}, {}
+        for movie_id, title in self.execute_script('get_movie_ids_by_title.sql', fetch=True):
+            movie_ids.setdefault(title, movie_id)
+        for actor_id, name in self.get_all_actors():
+            actor_ids.setdefault(name, actor_id)
+
+        def to_row(record):
+            movie_id = record.get('movie_id') or movie_ids[record['movie_title']]
+            actor_id = record.get('actor_id') or actor_ids[record['actor_name']]
+            return int(movie_id), int(actor_id)
+
+        return self._bulk_insert('bulk_link_actor_to_movie.sql', iter_records(file_path), to_row, batch_size)
+
+    def _bulk_insert(self, script_name, records, to_row, batch_size):
+        """
+        Вставляє записи пакетами через executemany, кожен пакет — окрема транзакція.
+
+        :param script_name: Назва SQL-скрипта вставки.
+        :type script_name: str
+        :param records: Ітерований об'єкт вхідних записів.
+        :type records: Iterable[dict]
+        :param to_row: Функція перетворення запису на кортеж параметрів запиту.
+        :type to_row: callable
+        :param batch_size: Кількість рядків в одній транзакції.
+        :type batch_size: int
+        :return: Кортеж (кількість доданих, кількість пропущених записів).
+        :rtype: tuple
+        """
+        query = self.scripts.get(script_name)
+        written_tables = self.result_cache.tags(query)[1]
+        skipped = 0
+
+        def valid_rows():
+            nonlocal skipped
+            for record in records:
+                try:
+                    yield to_row(record)
+                except (KeyError, TypeError, ValueError):
+                    skipped += 1
+
+        inserted = 0
+        for batch in batched(valid_rows(), batch_size):
+            with self.transaction() as conn:
+                changed = conn.executemany(query, batch).rowcount
+            self.result_cache.invalidate(written_tables)
+            inserted += changed
+            # Рядки, проігноровані INSERT OR IGNORE, також вважаються пропущеними
+            skipped += len(batch) - changed
+
+        db_logger.debug("Імпорт '%s': додано %d, пропущено %d", script_name, inserted, skipped)
+        return inserted, skipped
+
     def show_movies_with_actors(self):
         """
         Показує лише ті фільми, у яких є пов'язані актори.
 
         :return: None
         """
-        rows = self.execute_script('get_movies_with_actors.sql', fetch=True)
+        # Рядки (id фільму, назва, ім'я актора) впорядковані за фільмом і групуються потоково
+        movies = self._non_empty(group_rows(self.iter_query('get_movies_with_actors.sql'), key_size=2))
 
-        if rows:
-            self.display.show_messages([f"Фільм: {row[0]}, Актори: {row[1]}" for row in rows])
+        if movies:
+            self.display.show_messages(f"Фільм: {title}, Актори: {', '.join(actor_names)}"
+                                       for (_, title), actor_names in movies)
         else:
             self.display.show_message("messages", "no_movies_available")
 
@@ -304,44 +723,45 @@ class MovieDatabase:
 
         :return: None
         """
-        rows = self.execute_script('get_movies_with_release_year.sql', fetch=True)
+        rows = self._non_empty(self.iter_query('get_movies_with_release_year.sql'))
 
         if rows:
-            formatted_rows = [(row[0], self.movie_age(row[1])) for row in
-                              rows]  # row[0] - назва фільму, row[1] - рік випуску
+            formatted_rows = ((row[0], self.movie_age(row[1])) for row in
+                              rows)  # row[0] - назва фільму, row[1] - рік випуску
             self.display.show_formatted_messages("movie_details", "movie_with_age", formatted_rows)
         else:
             self.display.show_message("messages", "no_data_available")
 
     def show_unique_genres(self):
         """
-        Показує унікальні жанри фільмів.
+        Показує унікальні жанри фільмів зі зведеної таблиці genre_stats.
 
         :return: None
         """
-        rows = self.execute_script('get_unique_genres.sql', fetch=True)
+        rows = self._non_empty(self.iter_query('get_unique_genres.sql'))
 
         if rows:
-            self.display.show_messages([f"Унікальний жанр: {row[0]}" for row in rows])
+            self.display.show_messages(f"Унікальний жанр: {row[0]}" for row in rows)
         else:
             self.display.show_message("messages", "no_data_available")
 
     def show_movie_count_by_genre(self):
         """
-        Показує кількість фільмів за жанрами.
+        Показує кількість фільмів за жанрами зі зведеної таблиці genre_stats.
 
         :return: None
         """
-        rows = self.execute_script('count_movies_by_genre.sql', fetch=True)
+        rows = self._non_empty(self.iter_query('count_movies_by_genre.sql'))
 
         if rows:
-            self.display.show_messages([f"Жанр: {row[0]}, Кількість фільмів: {row[1]}" for row in rows])
+            self.display.show_messages(f"Жанр: {row[0]}, Кількість фільмів: {row[1]}" for row in rows)
         else:
             self.display.show_message("messages", "no_data_available")
 
     def show_avg_birth_year_by_genre(self):
         """
         Показує середній рік народження акторів у фільмах певного жанру.
+        Середнє обчислюється з накопичених у genre_stats суми років народження та кількості акторів.
 
         :return: None
         """
@@ -373,18 +793,15 @@ class MovieDatabase:
         :return: None
         """
         rows = self.execute_query(query, params, fetch=True)
-        if rows:
-            formatted_data = [data_formatter(row) for row in rows]
-            self.display.show_formatted_messages(category, key, formatted_data)
-        else:
-            self.display.show_message("messages", "no_data_available")
+        self._show_messages_from_rows(rows, category, key, data_formatter)
 
     def _show_messages_from_rows(self, rows, category, key, formatter=lambda row: row):
         """
         Уніфікований метод для відображення повідомлень з форматуванням.
+        Рядки форматуються та виводяться по одному, тому генератор рядків не матеріалізується.
 
-        :param rows: Список рядків результату запиту.
-        :type rows: list
+        :param rows: Список або генератор рядків результату запиту.
+        :type rows: Iterable
         :param category: Категорія повідомлення.
         :type category: str
         :param key: Ключ повідомлення.
@@ -393,20 +810,92 @@ class MovieDatabase:
         :type formatter: callable, опціонально
         :return: None
         """
+        rows = self._non_empty(rows)
         if rows:
-            formatted_data = [formatter(row) for row in rows]
-            self.display.show_formatted_messages(category, key, formatted_data)
+            self.display.show_formatted_messages(category, key, (formatter(row) for row in rows))
         else:
             self.display.show_message("messages", "no_data_available")
 
-    def search_movie_by_title(self):
+    @staticmethod
+    def _build_match_query(keyword, mode):
+        """
+        Будує вираз FTS5 MATCH з ключового слова користувача.
+
+        Кожне слово береться в лапки, тому спецсимволи синтаксису FTS5 не інтерпретуються.
+
+        :param keyword: Ключове слово або фраза для пошуку.
+        :type keyword: str
+        :param mode: Режим пошуку: 'prefix', 'phrase' або 'ranked'.
+        :type mode: str
+        :return: Вираз для оператора MATCH.
+        :rtype: str
+        """
+        terms = ['"' + term.replace('"', '""') + '"' for term in keyword.split()]
+        if mode == 'phrase':
+            return '"' + ' '.join(keyword.split()).replace('"', '""') + '"'
+        if mode == 'ranked':
+            return ' OR '.join(term + '*' for term in terms)
+        return ' '.join(term + '*' for term in terms)
+
+    def find_movies_by_title(self, keyword, mode=None):
+        """
+        Шукає фільми за назвою.
+
+        Режими пошуку:
+        - 'like' — пошук підрядка через LIKE (повне сканування таблиці);
+        - 'prefix' — усі слова запиту як префікси слів назви (FTS5);
+        - 'phrase' — точна фраза (FTS5);
+        - 'ranked' — будь-яке зі слів як префікс, результати впорядковані за релевантністю bm25 (FTS5).
+
+        Якщо FTS5 недоступний або запит порожній, використовується режим 'like'.
+
+        :param keyword: Ключове слово для пошуку.
+        :type keyword: str
+        :param mode: Режим пошуку. За замовчуванням 'prefix', якщо FTS5 доступний, інакше 'like'.
+        :type mode: str, опціонально
+        :return: Список кортежів (назва, рік випуску).
+        :rtype: list
+        :raises ValueError: Якщо режим пошуку невідомий.
+        """
+        script, params = self.search_query(keyword, mode, self.fts_enabled)
+        return self.execute_script(script, params, fetch=True)
+
+    @classmethod
+    def search_query(cls, keyword, mode=None, fts_enabled=True):
+        """
+        Визначає SQL-скрипт та параметри пошуку фільмів за назвою (див. find_movies_by_title).
+
+        :param keyword: Ключове слово для пошуку.
+        :type keyword: str
+        :param mode: Режим пошуку. За замовчуванням 'prefix'.
+        :type mode: str, опціонально
+        :param fts_enabled: Чи доступний повнотекстовий індекс. За замовчуванням True.
+        :type fts_enabled: bool, опціонально
+        :return: Кортеж (назва скрипта, параметри запиту).
+        :rtype: tuple
+        :raises ValueError: Якщо режим пошуку невідомий.
+        """
+        if mode is None:
+            mode = 'prefix'
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Невідомий режим пошуку: {mode}")
+
+        if mode == 'like' or not keyword.strip() or not fts_enabled:
+            return 'search_movie_by_title.sql', ('%' + keyword + '%',)
+
+        script = 'search_movie_by_title_ranked.sql' if mode == 'ranked' else 'search_movie_by_title_fts.sql'
+        return script, (cls._build_match_query(keyword, mode),)
+
+    def search_movie_by_title(self, mode=None):
         """
         Пошук фільмів за назвою з використанням SQL-скрипта.
 
+        :param mode: Режим пошуку (див. find_movies_by_title). За замовчуванням None.
+        :type mode: str, опціонально
         :return: None
         """
         keyword = self.display.get_input("movie_input", "enter_keyword")
-        rows = self.execute_script('search_movie_by_title.sql', ('%' + keyword + '%',), fetch=True)
+        rows = self.find_movies_by_title(keyword, mode)
 
         if rows:
             formatted_rows = [
@@ -423,47 +912,133 @@ class MovieDatabase:
 
         :return: None
         """
-        rows = self.execute_script('select_actors_and_movies.sql', fetch=True)
+        # Рядки (id актора, ім'я, назва фільму) впорядковані за ім'ям і групуються потоково за ім'ям,
+        # як у звіті GROUP BY actors.name: фільми акторів з однаковим ім'ям виводяться одним рядком
+        rows = ((name, title) for _, name, title in self.iter_query('select_actors_and_movies.sql'))
+        actors = self._non_empty(group_rows(rows))
 
-        if rows:
-            messages = []
-            for row in rows:
-                actor_name = row[0]  # Имя актёра
-                movie_list = row[1]  # Список фильмов (строка с фильмами, разделёнными запятыми)
+        if actors:
+            self.display.show_messages(self._format_actor_movies(name, titles) for (name,), titles in actors)
+        else:
+            self.display.show_message("messages", "no_data_available")
 
-                # Преобразуем строку с фильмами в список
-                movies = movie_list.split(', ')
+    @staticmethod
+    def _format_actor_movies(actor_name, titles):
+        """
+        Форматує рядок звіту 'актор — фільми'.
 
-                # Проверяем, один ли фильм или несколько
-                if len(movies) == 1:
-                    messages.append(f"Aктор: {actor_name}, Фільм: {movies[0]}")
-                else:
-                    messages.append(f"Aктор: {actor_name}, Фільми: {movie_list}")
+        :param actor_name: Ім'я актора.
+        :type actor_name: str
+        :param titles: Назви фільмів актора.
+        :type titles: list
+        :return: Повідомлення для відображення.
+        :rtype: str
+        """
+        # Проверяем, один ли фильм или несколько
+        if len(titles) == 1:
+            return f"Aктор: {actor_name}, Фільм: {titles[0]}"
+        return f"Aктор: {actor_name}, Фільми: {', '.join(titles)}"
 
-                self.display.show_messages(messages)
-        else:
-            self.display.show_message("messages", "no_data_available")
+    def cast_adjacency(self):
+        """
+        Повертає склад акторів усіх фільмів як список суміжності.
+
+        Пари читаються впорядкованим скануванням первинного ключа movie_cast (movie_id, actor_id).
+
+        :return: Словник id фільму -> список id акторів (за зростанням).
+        :rtype: dict
+        """
+        return {movie_id: actor_ids for (movie_id,), actor_ids in group_rows(self.iter_query('get_cast_pairs.sql'))}
+
+    def cast_graph(self):
+        """
+        Будує двонаправлений індекс складу акторів для пошуку партнерів по зйомках
+        та фільмів зі спільними акторами.
+
+        Граф є знімком бази на момент виклику і не оновлюється при подальших змінах.
+
+        :return: Граф складу акторів.
+        :rtype: CastGraph
+        """
+        return CastGraph(self.cast_adjacency())
+
+    def fetch_movies_page(self, order_by='id', after=None, before=None, page_size=5):
+        """
+        Повертає сторінку фільмів з пагінацією за ключем (keyset), без OFFSET.
+
+        Сторінка визначається граничним ключем попередньої сторінки, тому SQLite переходить
+        до потрібного місця індексом, а час отримання не залежить від номера сторінки.
+
+        :param order_by: Ключ сортування: 'id', 'genre' (genre, id) або 'release_year' (release_year, id).
+            За замовчуванням 'id'.
+        :type order_by: str, опціонально
+        :param after: Ключ останнього рядка попередньої сторінки (наступна сторінка). За замовчуванням None.
+        :type after: tuple, опціонально
+        :param before: Ключ першого рядка поточної сторінки (попередня сторінка). За замовчуванням None.
+        :type before: tuple, опціонально
+        :param page_size: Кількість фільмів на сторінці. За замовчуванням 5.
+        :type page_size: int, опціонально
+        :return: Список кортежів (id, назва, рік випуску, жанр) у порядку сортування.
+        :rtype: list
+        :raises ValueError: Якщо ключ сортування невідомий.
+        """
+        script, params = self.page_query(order_by, after, before, page_size)
+        rows = self.execute_script(script, params, fetch=True)
+        # Попередня сторінка вибирається у зворотному порядку від граничного ключа
+        return rows[::-1] if before is not None else rows
 
-    def show_movies_paginated(self):
+    @staticmethod
+    def page_query(order_by='id', after=None, before=None, page_size=5):
+        """
+        Визначає SQL-скрипт та параметри для сторінки фільмів (див. fetch_movies_page).
+        Якщо задано `before`, скрипт повертає рядки у зворотному порядку.
+
+        :return: Кортеж (назва скрипта, параметри запиту).
+        :rtype: tuple
+        :raises ValueError: Якщо ключ сортування невідомий.
+        """
+        if order_by not in PAGINATION_KEYS:
+            raise ValueError(f"Невідомий ключ сортування: {order_by}")
+
+        if before is not None:
+            return f'get_movies_page_by_{order_by}_prev.sql', (*before, page_size)
+
+        key = FIRST_PAGE_KEYS[order_by] if after is None else after
+        return f'get_movies_page_by_{order_by}_next.sql', (*key, page_size)
+
+    @staticmethod
+    def movie_page_key(row, order_by='id'):
+        """
+        Повертає ключ пагінації рядка фільму.
+
+        :param row: Рядок (id, назва, рік випуску, жанр).
+        :type row: tuple
+        :param order_by: Ключ сортування. За замовчуванням 'id'.
+        :type order_by: str, опціонально
+        :return: Ключ для параметрів after/before методу fetch_movies_page.
+        :rtype: tuple
+        """
+        return tuple(row[index] for index in PAGINATION_KEYS[order_by])
+
+    def show_movies_paginated(self, order_by='id', page_size=5):
         """
         Показує фільми з пагінацією, дозволяючи користувачу переглядати сторінки.
+        Навігація вперед/назад виконується від граничних ключів поточної сторінки.
 
+        :param order_by: Ключ сортування (див. fetch_movies_page). За замовчуванням 'id'.
+        :type order_by: str, опціонально
+        :param page_size: Кількість фільмів на сторінці. За замовчуванням 5.
+        :type page_size: int, опціонально
         :return: None
         """
-        page_size = 5  # Кількість фільмів на сторінці
         current_page = 1
+        rows = self.fetch_movies_page(order_by, page_size=page_size)
 
-        while True:
-            offset = (current_page - 1) * page_size
-            rows = self.execute_script('get_movies_paginated.sql', (page_size, offset), fetch=True)
-
-            if not rows:
-                if current_page == 1:
-                    self.display.show_message("messages", "no_movies_available")
-                else:
-                    self.display.show_message("messages", "no_more_movies")
-                break
+        if not rows:
+            self.display.show_message("messages", "no_movies_available")
+            return
 
+        while True:
             # Відображаємо повідомлення про поточну сторінку
             self.display.show_message("pagination", "displaying_page", current_page)
 
@@ -479,11 +1054,24 @@ class MovieDatabase:
             action = self.display.get_input("pagination", "choose_option").lower()
 
             if action == 'n':
+                next_rows = self.fetch_movies_page(order_by, after=self.movie_page_key(rows[-1], order_by),
+                                                   page_size=page_size)
+                if not next_rows:
+                    self.display.show_message("messages", "no_more_movies")
+                    break
+                rows = next_rows
                 current_page += 1
             elif action == 'p':
+                previous_rows = []
                 if current_page > 1:
+                    previous_rows = self.fetch_movies_page(order_by, before=self.movie_page_key(rows[0], order_by),
+                                                           page_size=page_size)
+                if previous_rows:
+                    rows = previous_rows
                     current_page -= 1
                 else:
+                    # Попередні фільми могли бути видалені: залишаємося на поточній сторінці як на першій
+                    current_page = 1
                     self.display.show_message("messages", "already_first_page")
             elif action == 'e':
                 break
@@ -0,0 +1,107 @@
+"""
+Перевірка планів виконання звітних запитів через `EXPLAIN QUERY PLAN`.
+
+Для кожного скрипта з `INDEXED_REPORTS` перевіряється, що SQLite не виконує повне
+сканування таблиці (рядок плану 'SCAN <table>' без індексу). Скрипти з `FULL_SCAN_REPORTS`
+за своєю суттю читають всю таблицю і не перевіряються.
+
+Запуск з каталогу Home_work_8 (код виходу 1, якщо знайдено повне сканування):
+    python query_plan_check.py [--db db/kinobaza.db]
+
+Вказана база спершу мігрується до актуальної версії. Без параметра --db перевірка виконується
+на тимчасовій базі зі свіжою схемою після міграцій.
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+
+from movie_database import MovieDatabase
+
+# Звіти, які мають використовувати індекси
+INDEXED_REPORTS = [
+    'avg_birth_year_by_genre.sql',
+    'get_movies_page_by_id_next.sql',
+    'get_movies_page_by_id_prev.sql',
+    'get_movies_page_by_genre_next.sql',
+    'get_movies_page_by_genre_prev.sql',
+    'get_movies_page_by_release_year_next.sql',
+    'get_movies_page_by_release_year_prev.sql',
+]
+
+# Звіти, що навмисно читають усю таблицю (повні списки, пошук підрядка LIKE, OFFSET)
+# або малу зведену таблицю genre_stats (один рядок на жанр)
+FULL_SCAN_REPORTS = [
+    'count_movies_by_genre.sql',
+    'get_unique_genres.sql',
+    'get_all_actors.sql',
+    'get_cast_pairs.sql',
+    'get_movie_ids_by_title.sql',
+    'get_movies_with_release_year.sql',
+    'get_movies_with_actors.sql',
+    'select_actors_and_movies.sql',
+    'search_movie_by_title.sql',
+    'get_movies_paginated.sql',
+]
+
+# Повне сканування: 'SCAN movies' або 'SCAN TABLE movies' (старіші версії SQLite) без 'USING ... INDEX'
+FULL_SCAN_PATTERN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+
+
+def explain(db, script_name):
+    """
+    Повертає рядки плану виконання SQL-скрипта.
+
+    :param db: База даних, на якій будується план.
+    :type db: MovieDatabase
+    :param script_name: Назва SQL-скрипта.
+    :type script_name: str
+    :return: Список описів кроків плану.
+    :rtype: list
+    """
+    query = db.scripts.get(script_name)
+    # Значення параметрів не впливають на вибір індексу, важлива лише їх кількість
+    params = (1,) * query.count('?')
+    return [row[3] for row in db.execute_query(f"EXPLAIN QUERY PLAN {query}", params, fetch=True)]
+
+
+def find_full_scans(db, scripts=None):
+    """
+    Знаходить звіти, план яких містить повне сканування таблиці.
+
+    :param db: База даних, на якій будуються плани.
+    :type db: MovieDatabase
+    :param scripts: Назви скриптів для перевірки. За замовчуванням INDEXED_REPORTS.
+    :type scripts: list, опціонально
+    :return: Словник {назва скрипта: [кроки плану з повним скануванням]}.
+    :rtype: dict
+    """
+    violations = {}
+    for script_name in INDEXED_REPORTS if scripts is None else scripts:
+        scans = [step for step in explain(db, script_name) if FULL_SCAN_PATTERN.match(step)]
+        if scans:
+            violations[script_name] = scans
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Перевірка, що звітні запити використовують індекси.")
+    parser.add_argument('--db', help="Шлях до бази даних. За замовчуванням — тимчасова база після міграцій.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with MovieDatabase(db_name=args.db or os.path.join(tmp_dir, 'plan_check.db')) as db:
+            db.migrate()
+            violations = find_full_scans(db)
+
+    for script_name, scans in violations.items():
+        print(f"FAIL {script_name}: {'; '.join(scans)}")
+    if violations:
+        sys.exit(1)
+    print(f"OK: {len(INDEXED_REPORTS)} звітів використовують індекси.")
+
+
+if __name__ == "__main__":
+    main()
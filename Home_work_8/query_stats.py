@@ -0,0 +1,117 @@
+"""
+Модуль збору статистики виконання SQL-скриптів.
+
+Клас `QueryStats` накопичує для кожного скрипта кількість викликів, кількість рядків
+та час виконання останніх викликів (ковзне вікно фіксованого розміру), з якого
+обчислюються перцентилі p50/p95/p99. Запити, повільніші за поріг, записуються
+в окремий лог 'slow_query_logger'.
+"""
+
+import logging
+import math
+from collections import deque, namedtuple
+
+slow_query_logger = logging.getLogger('slow_query_logger')
+
+# Кількість останніх вимірювань, що зберігаються для кожного скрипта
+DEFAULT_WINDOW_SIZE = 1000
+
+# Поріг повільного запиту за замовчуванням (мс)
+DEFAULT_SLOW_QUERY_MS = 100.0
+
+# Назва для запитів, що виконуються не з реєстру скриптів (PRAGMA, EXPLAIN тощо)
+AD_HOC_QUERY = '<ad-hoc>'
+
+# Підсумок по одному скрипту; час — у мілісекундах
+ScriptStats = namedtuple('ScriptStats', ['script', 'calls', 'rows', 'p50', 'p95', 'p99', 'max'])
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Обчислює перцентиль методом найближчого рангу.
+
+    :param sorted_samples: Відсортований непорожній список значень.
+    :type sorted_samples: list
+    :param fraction: Частка від 0 до 1 (наприклад, 0.95 для p95).
+    :type fraction: float
+    :return: Значення перцентиля.
+    :rtype: float
+    """
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class QueryStats:
+    """
+    Накопичувач часу виконання та кількості рядків для SQL-скриптів.
+
+    Атрибути:
+        slow_query_ms (float): Поріг у мілісекундах, починаючи з якого запит записується в лог повільних.
+        window_size (int): Кількість останніх вимірювань на скрипт для обчислення перцентилів.
+    """
+
+    def __init__(self, slow_query_ms=DEFAULT_SLOW_QUERY_MS, window_size=DEFAULT_WINDOW_SIZE):
+        """
+        Ініціалізує QueryStats.
+
+        :param slow_query_ms: Поріг повільного запиту в мілісекундах. За замовчуванням DEFAULT_SLOW_QUERY_MS.
+        :type slow_query_ms: float, опціонально
+        :param window_size: Розмір ковзного вікна вимірювань. За замовчуванням DEFAULT_WINDOW_SIZE.
+        :type window_size: int, опціонально
+        """
+        self.slow_query_ms = slow_query_ms
+        self.window_size = window_size
+        self._timings = {}
+        self._calls = {}
+        self._rows = {}
+
+    def record(self, script, elapsed, rows, params=()):
+        """
+        Записує одне вимірювання виконання скрипта.
+
+        :param script: Назва SQL-скрипта.
+        :type script: str
+        :param elapsed: Час виконання в секундах.
+        :type elapsed: float
+        :param rows: Кількість отриманих або змінених рядків (-1, якщо невідомо).
+        :type rows: int
+        :param params: Параметри запиту (лише для запису в лог повільних запитів).
+        :type params: tuple, опціонально
+        :return: None
+        """
+        elapsed_ms = elapsed * 1000
+        timings = self._timings.get(script)
+        if timings is None:
+            timings = self._timings[script] = deque(maxlen=self.window_size)
+        timings.append(elapsed_ms)
+        self._calls[script] = self._calls.get(script, 0) + 1
+        self._rows[script] = self._rows.get(script, 0) + max(rows, 0)
+
+        if elapsed_ms >= self.slow_query_ms:
+            slow_query_logger.warning("Повільний запит %s: %.2f мс, рядків: %d, параметри: %r",
+                                      script, elapsed_ms, rows, params)
+
+    def summary(self):
+        """
+        Повертає підсумкову статистику по всіх скриптах, від найповільнішого за p95.
+
+        :return: Список підсумків ScriptStats.
+        :rtype: list
+        """
+        result = []
+        for script, timings in self._timings.items():
+            samples = sorted(timings)
+            result.append(ScriptStats(script, self._calls[script], self._rows[script],
+                                      percentile(samples, 0.50), percentile(samples, 0.95),
+                                      percentile(samples, 0.99), samples[-1]))
+        return sorted(result, key=lambda stats: stats.p95, reverse=True)
+
+    def reset(self):
+        """
+        Очищає всі накопичені вимірювання.
+
+        :return: None
+        """
+        self._timings.clear()
+        self._calls.clear()
+        self._rows.clear()
@@ -0,0 +1,78 @@
+"""
+Модуль для потокового читання записів каталогу з CSV та JSON файлів.
+
+Файли читаються по одному запису, тому імпорт мільйонів рядків не потребує
+завантаження всього файлу в пам'ять (окрім JSON-масивів, див. `iter_records`).
+"""
+
+import csv
+import json
+import os
+from itertools import islice
+
+
+def iter_records(file_path):
+    """
+    Послідовно повертає записи з файлу у вигляді словників.
+
+    Підтримувані формати:
+    - `.csv` — перший рядок містить назви колонок;
+    - `.jsonl` / `.ndjson` — один JSON-об'єкт у кожному рядку (читається потоково);
+    - `.json` — масив JSON-об'єктів (завантажується цілком, для великих файлів краще JSON Lines).
+
+    :param file_path: Шлях до файлу з записами.
+    :type file_path: str
+    :return: Генератор словників із даними записів.
+    :rtype: Iterator[dict]
+    :raises ValueError: Якщо формат файлу не підтримується.
+    :raises FileNotFoundError: Якщо файл не знайдено.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension == '.csv':
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            yield from csv.DictReader(file)
+    elif extension in ('.jsonl', '.ndjson'):
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+    elif extension == '.json':
+        with open(file_path, 'r', encoding='utf-8') as file:
+            yield from json.load(file)
+    else:
+        raise ValueError(f"Непідтримуваний формат файлу: {file_path}")
+
+
+def required(record, field):
+    """
+    Повертає значення обов'язкового поля запису (колонки NOT NULL).
+
+    :param record: Запис із файлу.
+    :type record: dict
+    :param field: Назва поля.
+    :type field: str
+    :return: Значення поля.
+    :raises KeyError: Якщо поля немає в записі.
+    :raises ValueError: Якщо значення поля null (None у JSON).
+    """
+    value = record[field]
+    if value is None:
+        raise ValueError(f"Поле '{field}' не може бути порожнім")
+    return value
+
+
+def batched(iterable, batch_size):
+    """
+    Розбиває ітерований об'єкт на списки фіксованого розміру (останній може бути коротшим).
+
+    :param iterable: Вхідна послідовність.
+    :type iterable: Iterable
+    :param batch_size: Розмір пакета.
+    :type batch_size: int
+    :return: Генератор списків-пакетів.
+    :rtype: Iterator[list]
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
@@ -0,0 +1,94 @@
+"""
+Модуль з класами даних для результатів запитів до бази даних фільмів.
+
+Використовуються API, що повертають дані замість виводу через Display
+(наприклад, AsyncMovieDatabase для веб-сервісу).
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Actor:
+    """
+    Актор.
+
+    Атрибути:
+        id (int): Ідентифікатор актора.
+        name (str): Ім'я актора.
+    """
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class Movie:
+    """
+    Фільм.
+
+    Атрибути:
+        id (int): Ідентифікатор фільму.
+        title (str): Назва фільму.
+        release_year (int): Рік випуску.
+        genre (str): Жанр.
+    """
+    id: int
+    title: str
+    release_year: int
+    genre: str
+
+
+@dataclass(frozen=True)
+class MovieRelease:
+    """
+    Назва фільму з роком випуску.
+
+    Атрибути:
+        title (str): Назва фільму.
+        release_year (int): Рік випуску.
+    """
+    title: str
+    release_year: int
+
+
+@dataclass(frozen=True)
+class MovieWithActors:
+    """
+    Фільм з іменами акторів.
+
+    Атрибути:
+        id (int): Ідентифікатор фільму.
+        title (str): Назва фільму.
+        actors (tuple): Імена акторів.
+    """
+    id: int
+    title: str
+    actors: tuple
+
+
+@dataclass(frozen=True)
+class ActorMovies:
+    """
+    Актор з назвами фільмів, у яких він знімався.
+
+    Атрибути:
+        id (int): Ідентифікатор актора.
+        name (str): Ім'я актора.
+        movies (tuple): Назви фільмів.
+    """
+    id: int
+    name: str
+    movies: tuple
+
+
+@dataclass(frozen=True)
+class GenreCount:
+    """
+    Кількість фільмів у жанрі.
+
+    Атрибути:
+        genre (str): Жанр.
+        movies_count (int): Кількість фільмів.
+    """
+    genre: str
+    movies_count: int
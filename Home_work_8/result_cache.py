@@ -0,0 +1,201 @@
+"""
+Модуль кешу результатів SQL-запитів читання.
+
+Клас `ResultCache` зберігає результати запитів за ключем (назва скрипта, параметри)
+з обмеженням кількості записів (LRU) та часу життя (TTL). Кожен запис позначається
+таблицями, з яких читає запит; запит запису інвалідовує всі записи, що залежать
+від змінених ним таблиць, з урахуванням таблиць, які оновлюються тригерами.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# Кількість записів у кеші за замовчуванням (0 вимикає кеш)
+DEFAULT_CACHE_SIZE = 256
+
+# Час життя запису в секундах
+DEFAULT_CACHE_TTL = 300.0
+
+# Результати з більшою кількістю рядків не кешуються (повні вибірки великих каталогів)
+DEFAULT_MAX_CACHED_ROWS = 10000
+
+# Максимальна кількість запам'ятованих результатів розбору тексту запитів
+MAX_PARSED_QUERIES = 1024
+
+# Таблиці, які змінюються тригерами при зміні ключової таблиці
+TRIGGER_DEPENDENCIES = {
+    'movies': {'genre_stats', 'movies_fts'},
+    'movie_cast': {'genre_stats'},
+    'actors': {'genre_stats'},
+}
+
+# Позначка для змін схеми: інвалідовує весь кеш
+ALL_TABLES = '*'
+
+READ_TABLE_PATTERN = re.compile(r'\b(?:FROM|JOIN)\s+([A-Za-z_]\w*)', re.IGNORECASE)
+WRITE_TABLE_PATTERN = re.compile(
+    r'\b(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+([A-Za-z_]\w*)',
+    re.IGNORECASE)
+SCHEMA_CHANGE_PATTERN = re.compile(r'^\s*(?:CREATE|DROP|ALTER)\b', re.IGNORECASE)
+
+
+def read_tables(query):
+    """
+    Визначає таблиці, з яких читає SQL-запит.
+
+    :param query: Текст SQL-запиту.
+    :type query: str
+    :return: Множина назв таблиць у нижньому регістрі.
+    :rtype: frozenset
+    """
+    return frozenset(name.lower() for name in READ_TABLE_PATTERN.findall(query))
+
+
+def write_tables(query):
+    """
+    Визначає таблиці, які змінює SQL-запит, разом з таблицями, що оновлюються тригерами.
+
+    :param query: Текст SQL-запиту.
+    :type query: str
+    :return: Множина назв таблиць у нижньому регістрі або {ALL_TABLES} для змін схеми.
+    :rtype: frozenset
+    """
+    if SCHEMA_CHANGE_PATTERN.match(query):
+        return frozenset({ALL_TABLES})
+    tables = {name.lower() for name in WRITE_TABLE_PATTERN.findall(query)}
+    for table in list(tables):
+        tables |= TRIGGER_DEPENDENCIES.get(table, set())
+    return frozenset(tables)
+
+
+class ResultCache:
+    """
+    LRU-кеш результатів запитів читання з обмеженим часом життя та інвалідацією за таблицями.
+
+    Атрибути:
+        max_entries (int): Максимальна кількість записів (0 вимикає кеш).
+        ttl (float): Час життя запису в секундах.
+        max_rows (int): Максимальна кількість рядків результату, що кешується.
+        hits (int): Кількість влучань.
+        misses (int): Кількість промахів.
+    """
+
+    def __init__(self, max_entries=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL, max_rows=DEFAULT_MAX_CACHED_ROWS):
+        """
+        Ініціалізує ResultCache.
+
+        :param max_entries: Максимальна кількість записів. За замовчуванням DEFAULT_CACHE_SIZE.
+        :type max_entries: int, опціонально
+        :param ttl: Час життя запису в секундах. За замовчуванням DEFAULT_CACHE_TTL.
+        :type ttl: float, опціонально
+        :param max_rows: Максимальна кількість рядків результату. За замовчуванням DEFAULT_MAX_CACHED_ROWS.
+        :type max_rows: int, опціонально
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # ключ -> (час закінчення, рядки, таблиці)
+        self._tags = {}  # текст запиту -> (таблиці читання, таблиці запису)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """
+        Чи увімкнено кеш.
+
+        :rtype: bool
+        """
+        return self.max_entries > 0
+
+    def tags(self, query):
+        """
+        Повертає таблиці читання та запису для запиту (розбір виконується один раз на текст запиту).
+
+        :param query: Текст SQL-запиту.
+        :type query: str
+        :return: Кортеж (таблиці читання, таблиці запису).
+        :rtype: tuple
+        """
+        tags = self._tags.get(query)
+        if tags is None:
+            if len(self._tags) >= MAX_PARSED_QUERIES:
+                # Обмежуємо пам'ять для випадкових ad-hoc запитів з різним текстом
+                self._tags.clear()
+            tags = self._tags[query] = (read_tables(query), write_tables(query))
+        return tags
+
+    def get(self, key):
+        """
+        Повертає закешований результат або None, якщо його немає чи строк дії минув.
+
+        :param key: Ключ (назва скрипта, параметри).
+        :type key: tuple
+        :return: Кортеж рядків або None.
+        :rtype: tuple або None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, rows, tables):
+        """
+        Зберігає результат запиту, витісняючи найдавніше використаний запис при переповненні.
+
+        :param key: Ключ (назва скрипта, параметри).
+        :type key: tuple
+        :param rows: Рядки результату.
+        :type rows: Sequence
+        :param tables: Таблиці, з яких читає запит.
+        :type tables: frozenset
+        :return: None
+        """
+        if not self.enabled or len(rows) > self.max_rows:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, tuple(rows), tables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tables):
+        """
+        Видаляє записи, що залежать від будь-якої зі змінених таблиць.
+
+        :param tables: Змінені таблиці або {ALL_TABLES} для очищення всього кешу.
+        :type tables: frozenset
+        :return: None
+        """
+        if not tables:
+            return
+        with self._lock:
+            if ALL_TABLES in tables:
+                self._entries.clear()
+                return
+            stale = [key for key, entry in self._entries.items() if entry[2] & tables]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Очищає кеш та лічильники влучань і промахів.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,168 @@
+"""
+Модуль реєстру SQL-скриптів.
+
+Клас `ScriptRegistry` один раз завантажує та перевіряє всі `.sql` файли з каталогу
+`sql_scripts` (шлях прив'язаний до модуля, а не до поточного робочого каталогу)
+і віддає їх текст за назвою без повторного читання з диску.
+"""
+
+import os
+import sqlite3
+import time
+
+# Каталог зі скриптами відносно розташування модуля
+SQL_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sql_scripts')
+
+
+class ScriptRegistry:
+    """
+    Реєстр SQL-скриптів, завантажених у пам'ять.
+
+    Скрипти індексуються назвою файлу (наприклад, 'get_all_actors.sql'). Для одного скрипта
+    завжди повертається той самий об'єкт рядка, тому кеш підготовлених запитів sqlite3
+    на постійному підключенні отримує влучання.
+
+    Атрибути:
+        scripts_dir (str): Каталог зі SQL-скриптами.
+        watch (bool): Чи перечитувати змінені файли (режим розробки).
+        watch_interval (float): Мінімальний інтервал між перевірками змін у секундах.
+    """
+
+    def __init__(self, scripts_dir=SQL_SCRIPTS_DIR, watch=False, watch_interval=1.0):
+        """
+        Ініціалізує реєстр та завантажує всі скрипти з каталогу.
+
+        :param scripts_dir: Каталог зі SQL-скриптами. За замовчуванням SQL_SCRIPTS_DIR.
+        :type scripts_dir: str
+        :param watch: Увімкнути гаряче перезавантаження змінених файлів. За замовчуванням False.
+        :type watch: bool
+        :param watch_interval: Інтервал перевірки змін у секундах. За замовчуванням 1.0.
+        :type watch_interval: float
+        :raises FileNotFoundError: Якщо каталог зі скриптами не знайдено.
+        :raises ValueError: Якщо скрипт порожній або містить незавершений SQL-вираз.
+        """
+        self.scripts_dir = scripts_dir
+        self.watch = watch
+        self.watch_interval = watch_interval
+        self._scripts = {}
+        self._names = {}
+        self._mtimes = {}
+        self._last_check = 0.0
+        self.load()
+
+    def load(self):
+        """
+        Завантажує (або перезавантажує) всі `.sql` файли з каталогу.
+
+        :return: None
+        :raises FileNotFoundError: Якщо каталог зі скриптами не знайдено.
+        :raises ValueError: Якщо скрипт порожній або містить незавершений SQL-вираз.
+        """
+        if not os.path.isdir(self.scripts_dir):
+            raise FileNotFoundError(f"Каталог SQL-скриптів не знайдено: {self.scripts_dir}")
+
+        scripts, mtimes = {}, {}
+        for filename in sorted(os.listdir(self.scripts_dir)):
+            if filename.endswith('.sql'):
+                path = os.path.join(self.scripts_dir, filename)
+                scripts[filename] = self._read_script(path)
+                mtimes[filename] = os.path.getmtime(path)
+
+        self._scripts, self._mtimes = scripts, mtimes
+        self._names = {script: filename for filename, script in scripts.items()}
+        self._last_check = time.monotonic()
+
+    @staticmethod
+    def _read_script(path):
+        """
+        Читає та перевіряє один SQL-скрипт.
+
+        :param path: Шлях до файлу скрипта.
+        :type path: str
+        :return: Текст скрипта.
+        :rtype: str
+        :raises ValueError: Якщо скрипт порожній або містить незавершений SQL-вираз.
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            script = file.read().strip()
+
+        if not script:
+            raise ValueError(f"SQL-скрипт порожній: {path}")
+        if not script.endswith(';'):
+            script += ';'
+        if not sqlite3.complete_statement(script):
+            raise ValueError(f"SQL-скрипт містить незавершений вираз: {path}")
+        return script
+
+    def _reload_changed(self):
+        """
+        Перечитує файли, змінені з моменту останньої перевірки (не частіше ніж раз на watch_interval).
+
+        :return: None
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.watch_interval:
+            return
+        self._last_check = now
+
+        current = {filename: os.path.getmtime(os.path.join(self.scripts_dir, filename))
+                   for filename in os.listdir(self.scripts_dir) if filename.endswith('.sql')}
+        if current != self._mtimes:
+            self.load()
+
+    @staticmethod
+    def _normalize(name):
+        """
+        Приводить назву скрипта до назви файлу з розширенням '.sql'.
+
+        :param name: Назва скрипта з розширенням або без нього.
+        :type name: str
+        :return: Назва файлу скрипта.
+        :rtype: str
+        """
+        return name if name.endswith('.sql') else f"{name}.sql"
+
+    def get(self, name):
+        """
+        Повертає текст SQL-скрипта за назвою.
+
+        :param name: Назва скрипта, наприклад 'get_all_actors.sql' або 'get_all_actors'.
+        :type name: str
+        :return: Текст SQL-скрипта.
+        :rtype: str
+        :raises KeyError: Якщо скрипт з такою назвою не зареєстровано.
+        """
+        if self.watch:
+            self._reload_changed()
+        try:
+            return self._scripts[self._normalize(name)]
+        except KeyError as e:
+            raise KeyError(f"SQL-скрипт не знайдено в реєстрі: {name}") from e
+
+    def name_of(self, script, default=None):
+        """
+        Повертає назву скрипта за його текстом (зворотний пошук для статистики та логів).
+
+        :param script: Текст SQL-скрипта.
+        :type script: str
+        :param default: Значення, якщо текст не належить жодному скрипту реєстру. За замовчуванням None.
+        :type default: Any, опціонально
+        :return: Назва файлу скрипта або default.
+        :rtype: str
+        """
+        return self._names.get(script, default)
+
+    def names(self):
+        """
+        Повертає назви всіх зареєстрованих скриптів.
+
+        :return: Відсортований список назв файлів скриптів.
+        :rtype: list
+        """
+        return sorted(self._scripts)
+
+    def __contains__(self, name):
+        return self._normalize(name) in self._scripts
+
+    def __len__(self):
+        return len(self._scripts)
@@ -1,5 +1,3 @@
-SELECT AVG(actors.birth_year) AS avg_birth_year
-FROM actors
-INNER JOIN movie_cast ON actors.id = movie_cast.actor_id
-INNER JOIN movies ON movies.id = movie_cast.movie_id
-WHERE movies.genre = ?;
+SELECT CAST(birth_year_sum AS REAL) / actor_count AS avg_birth_year
+FROM genre_stats
+WHERE genre = ? AND actor_count > 0;
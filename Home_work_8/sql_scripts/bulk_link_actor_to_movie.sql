@@ -0,0 +1,2 @@
+INSERT OR IGNORE INTO movie_cast (movie_id, actor_id)
+VALUES (?, ?);
@@ -0,0 +1 @@
+DELETE FROM genre_stats;
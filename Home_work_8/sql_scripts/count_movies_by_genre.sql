@@ -1,3 +1,4 @@
-SELECT genre, COUNT(*) AS movies_count
-FROM movies
-GROUP BY genre;
+SELECT genre, movie_count AS movies_count
+FROM genre_stats
+WHERE movie_count > 0
+ORDER BY genre;
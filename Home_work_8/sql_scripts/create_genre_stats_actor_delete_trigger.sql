@@ -0,0 +1,22 @@
+CREATE TRIGGER IF NOT EXISTS genre_stats_after_actor_delete AFTER DELETE ON actors
+BEGIN
+    UPDATE genre_stats
+    SET birth_year_sum = birth_year_sum - old.birth_year * (
+            SELECT COUNT(*)
+            FROM movie_cast
+            JOIN movies ON movies.id = movie_cast.movie_id
+            WHERE movie_cast.actor_id = old.id AND movies.genre = genre_stats.genre
+        ),
+        actor_count = actor_count - (
+            SELECT COUNT(*)
+            FROM movie_cast
+            JOIN movies ON movies.id = movie_cast.movie_id
+            WHERE movie_cast.actor_id = old.id AND movies.genre = genre_stats.genre
+        )
+    WHERE genre IN (
+        SELECT movies.genre
+        FROM movie_cast
+        JOIN movies ON movies.id = movie_cast.movie_id
+        WHERE movie_cast.actor_id = old.id
+    );
+END;
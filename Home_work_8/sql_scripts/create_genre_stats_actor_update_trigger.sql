@@ -0,0 +1,17 @@
+CREATE TRIGGER IF NOT EXISTS genre_stats_after_actor_update AFTER UPDATE OF birth_year ON actors
+WHEN old.birth_year IS NOT new.birth_year
+BEGIN
+    UPDATE genre_stats
+    SET birth_year_sum = birth_year_sum + (new.birth_year - old.birth_year) * (
+        SELECT COUNT(*)
+        FROM movie_cast
+        JOIN movies ON movies.id = movie_cast.movie_id
+        WHERE movie_cast.actor_id = new.id AND movies.genre = genre_stats.genre
+    )
+    WHERE genre IN (
+        SELECT movies.genre
+        FROM movie_cast
+        JOIN movies ON movies.id = movie_cast.movie_id
+        WHERE movie_cast.actor_id = new.id
+    );
+END;
@@ -0,0 +1,8 @@
+CREATE TRIGGER IF NOT EXISTS genre_stats_after_cast_insert AFTER INSERT ON movie_cast
+BEGIN
+    UPDATE genre_stats
+    SET birth_year_sum = birth_year_sum + (SELECT birth_year FROM actors WHERE id = new.actor_id),
+        actor_count = actor_count + 1
+    WHERE genre = (SELECT genre FROM movies WHERE id = new.movie_id)
+      AND EXISTS (SELECT 1 FROM actors WHERE id = new.actor_id);
+END;
@@ -0,0 +1,18 @@
+CREATE TRIGGER IF NOT EXISTS genre_stats_after_movie_delete AFTER DELETE ON movies
+BEGIN
+    UPDATE genre_stats
+    SET movie_count = movie_count - 1,
+        birth_year_sum = birth_year_sum - (
+            SELECT COALESCE(SUM(actors.birth_year), 0)
+            FROM movie_cast
+            JOIN actors ON actors.id = movie_cast.actor_id
+            WHERE movie_cast.movie_id = old.id
+        ),
+        actor_count = actor_count - (
+            SELECT COUNT(*)
+            FROM movie_cast
+            JOIN actors ON actors.id = movie_cast.actor_id
+            WHERE movie_cast.movie_id = old.id
+        )
+    WHERE genre = old.genre;
+END;
@@ -0,0 +1,5 @@
+CREATE TRIGGER IF NOT EXISTS genre_stats_after_movie_insert AFTER INSERT ON movies
+BEGIN
+    INSERT INTO genre_stats (genre, movie_count) VALUES (new.genre, 1)
+    ON CONFLICT (genre) DO UPDATE SET movie_count = movie_count + 1;
+END;
@@ -0,0 +1,28 @@
+CREATE TRIGGER IF NOT EXISTS genre_stats_after_movie_update AFTER UPDATE OF genre ON movies
+WHEN old.genre IS NOT new.genre
+BEGIN
+    UPDATE genre_stats
+    SET movie_count = movie_count - 1,
+        birth_year_sum = birth_year_sum - (
+            SELECT COALESCE(SUM(actors.birth_year), 0)
+            FROM movie_cast
+            JOIN actors ON actors.id = movie_cast.actor_id
+            WHERE movie_cast.movie_id = old.id
+        ),
+        actor_count = actor_count - (
+            SELECT COUNT(*)
+            FROM movie_cast
+            JOIN actors ON actors.id = movie_cast.actor_id
+            WHERE movie_cast.movie_id = old.id
+        )
+    WHERE genre = old.genre;
+    INSERT INTO genre_stats (genre, movie_count, birth_year_sum, actor_count)
+    SELECT new.genre, 1, COALESCE(SUM(actors.birth_year), 0), COUNT(actors.id)
+    FROM movie_cast
+    JOIN actors ON actors.id = movie_cast.actor_id
+    WHERE movie_cast.movie_id = new.id
+    ON CONFLICT (genre) DO UPDATE SET
+        movie_count = movie_count + 1,
+        birth_year_sum = birth_year_sum + excluded.birth_year_sum,
+        actor_count = actor_count + excluded.actor_count;
+END;
@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS genre_stats (
+    genre TEXT PRIMARY KEY,
+    movie_count INTEGER NOT NULL DEFAULT 0,
+    birth_year_sum INTEGER NOT NULL DEFAULT 0,
+    actor_count INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
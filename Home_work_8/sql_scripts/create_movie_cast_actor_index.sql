@@ -0,0 +1 @@
+CREATE INDEX IF NOT EXISTS idx_movie_cast_actor ON movie_cast (actor_id, movie_id);
@@ -0,0 +1,4 @@
+CREATE TRIGGER IF NOT EXISTS movies_fts_after_delete AFTER DELETE ON movies
+BEGIN
+    INSERT INTO movies_fts (movies_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
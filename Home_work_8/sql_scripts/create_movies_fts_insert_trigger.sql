@@ -0,0 +1,4 @@
+CREATE TRIGGER IF NOT EXISTS movies_fts_after_insert AFTER INSERT ON movies
+BEGIN
+    INSERT INTO movies_fts (rowid, title) VALUES (new.id, new.title);
+END;
@@ -0,0 +1,5 @@
+CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(
+    title,
+    content = 'movies',
+    content_rowid = 'id'
+);
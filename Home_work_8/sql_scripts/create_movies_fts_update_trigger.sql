@@ -0,0 +1,5 @@
+CREATE TRIGGER IF NOT EXISTS movies_fts_after_update AFTER UPDATE OF title ON movies
+BEGIN
+    INSERT INTO movies_fts (movies_fts, rowid, title) VALUES ('delete', old.id, old.title);
+    INSERT INTO movies_fts (rowid, title) VALUES (new.id, new.title);
+END;
@@ -0,0 +1 @@
+CREATE INDEX IF NOT EXISTS idx_movies_genre ON movies (genre);
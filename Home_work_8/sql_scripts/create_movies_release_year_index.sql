@@ -0,0 +1 @@
+CREATE INDEX IF NOT EXISTS idx_movies_release_year ON movies (release_year);
@@ -0,0 +1,3 @@
+SELECT movie_id, actor_id
+FROM movie_cast
+ORDER BY movie_id, actor_id;
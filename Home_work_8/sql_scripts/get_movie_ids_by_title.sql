@@ -0,0 +1,3 @@
+SELECT id, title
+FROM movies
+ORDER BY id;
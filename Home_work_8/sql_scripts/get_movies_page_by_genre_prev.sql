@@ -0,0 +1,5 @@
+SELECT id, title, release_year, genre
+FROM movies
+WHERE (genre, id) < (?, ?)
+ORDER BY genre DESC, id DESC
+LIMIT ?;
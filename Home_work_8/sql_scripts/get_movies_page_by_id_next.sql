@@ -0,0 +1,5 @@
+SELECT id, title, release_year, genre
+FROM movies
+WHERE id > ?
+ORDER BY id
+LIMIT ?;
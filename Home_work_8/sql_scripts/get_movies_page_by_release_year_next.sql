@@ -0,0 +1,5 @@
+SELECT id, title, release_year, genre
+FROM movies
+WHERE (release_year, id) > (?, ?)
+ORDER BY release_year, id
+LIMIT ?;
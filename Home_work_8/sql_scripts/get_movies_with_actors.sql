@@ -1,5 +1,5 @@
-SELECT movies.title AS movie_title, GROUP_CONCAT(actors.name, ', ') AS actors
-FROM movies
-JOIN movie_cast ON movies.id = movie_cast.movie_id
+SELECT movie_cast.movie_id, movies.title, actors.name
+FROM movie_cast
+JOIN movies ON movies.id = movie_cast.movie_id
 JOIN actors ON actors.id = movie_cast.actor_id
-GROUP BY movies.id;
+ORDER BY movie_cast.movie_id, movie_cast.actor_id;
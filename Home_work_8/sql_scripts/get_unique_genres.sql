@@ -1 +1,4 @@
-SELECT DISTINCT genre FROM movies;
\ No newline at end of file
+SELECT genre
+FROM genre_stats
+WHERE movie_count > 0
+ORDER BY genre;
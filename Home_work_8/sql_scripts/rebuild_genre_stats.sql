@@ -0,0 +1,17 @@
+INSERT INTO genre_stats (genre, movie_count, birth_year_sum, actor_count)
+SELECT movie_counts.genre,
+       movie_counts.movie_count,
+       COALESCE(cast_stats.birth_year_sum, 0),
+       COALESCE(cast_stats.actor_count, 0)
+FROM (
+    SELECT genre, COUNT(*) AS movie_count
+    FROM movies
+    GROUP BY genre
+) AS movie_counts
+LEFT JOIN (
+    SELECT movies.genre, SUM(actors.birth_year) AS birth_year_sum, COUNT(*) AS actor_count
+    FROM movie_cast
+    JOIN movies ON movies.id = movie_cast.movie_id
+    JOIN actors ON actors.id = movie_cast.actor_id
+    GROUP BY movies.genre
+) AS cast_stats ON cast_stats.genre = movie_counts.genre;
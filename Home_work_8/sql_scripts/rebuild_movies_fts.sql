@@ -0,0 +1 @@
+INSERT INTO movies_fts (movies_fts) VALUES ('rebuild');
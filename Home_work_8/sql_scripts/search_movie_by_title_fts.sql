@@ -0,0 +1,5 @@
+SELECT movies.title, movies.release_year
+FROM movies_fts
+JOIN movies ON movies.id = movies_fts.rowid
+WHERE movies_fts MATCH ?
+ORDER BY movies_fts.rowid;
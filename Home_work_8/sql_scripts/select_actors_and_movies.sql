@@ -1,5 +1,5 @@
-SELECT actors.name, GROUP_CONCAT(movies.title, ', ') AS movies
+SELECT actors.id, actors.name, movies.title
 FROM actors
 JOIN movie_cast ON actors.id = movie_cast.actor_id
 JOIN movies ON movies.id = movie_cast.movie_id
-GROUP BY actors.name;
\ No newline at end of file
+ORDER BY actors.name, actors.id, movie_cast.movie_id;
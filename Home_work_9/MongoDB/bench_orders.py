@@ -0,0 +1,155 @@
+"""
+Бенчмарк вставки замовлень: послідовний шлях (запит на кожен товар) проти пакетного MyMongo.insert_orders.
+
+Послідовний шлях повторює початкову реалізацію insert_order: find_one на кожен товар,
+update_one на кожне списання, delete_many, find_one для номера та insert_one на кожне
+замовлення. Пакетний шлях виконує сталу кількість запитів на пакет.
+
+Для сервера MongoDB кількість команд рахується через pymongo.monitoring.CommandListener.
+
+Запуск з каталогу MongoDB (каталог Home_work_9 має бути в PYTHONPATH):
+    PYTHONPATH=.. python bench_orders.py --mongomock [--orders 2000] [--batch-size 100]
+    PYTHONPATH=.. python bench_orders.py --host localhost --port 27017 --database bench_grocery_store
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime
+
+from loguru import logger
+from pymongo import monitoring
+
+from my_mongo import Collections, MyMongo
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Рахує команди, відправлені на сервер MongoDB."""
+
+    def __init__(self):
+        self.commands = 0
+
+    def started(self, event):
+        self.commands += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def make_client(args, listener):
+    """
+    Створює клієнт mongomock або MongoClient з лічильником команд.
+
+    :return: Клієнт MongoDB.
+    """
+    if args.mongomock:
+        import mongomock
+        return mongomock.MongoClient()
+    from pymongo import MongoClient
+    return MongoClient(args.host, args.port, serverSelectionTimeoutMS=5000, event_listeners=[listener])
+
+
+def legacy_insert_order(db, client_name, products):
+    """Послідовна вставка замовлення: окремий запит на кожен товар і кожне списання."""
+    products_collection = db[Collections.PRODUCTS.value]
+    orders_collection = db[Collections.ORDERS.value]
+    total_sum = 0.0
+    products_list = []
+    for product_name, quantity in products:
+        product = products_collection.find_one({"product_name": product_name})
+        if not product or product["quantity"] <= 0:
+            continue
+        quantity = min(quantity, product["quantity"])
+        total_sum += product["price"] * quantity
+        products_list.append({"product_name": product_name, "quantity": quantity})
+    if not products_list:
+        return
+    for item in products_list:
+        products_collection.update_one({"product_name": item["product_name"]},
+                                       {"$inc": {"quantity": -item["quantity"]}})
+    products_collection.delete_many({"quantity": {"$lte": 0}})
+    last_order = orders_collection.find_one(sort=[("order_number", -1)])
+    orders_collection.insert_one({
+        "order_number": last_order["order_number"] + 1 if last_order else 1,
+        "client_name": client_name,
+        "products_list": products_list,
+        "total_sum": total_sum,
+        "messages": [],
+        "order_date": datetime.now(),
+    })
+
+
+def seed(db, product_count, stock):
+    """Очищує колекції та заповнює продукти з великим залишком."""
+    db[Collections.ORDERS.value].delete_many({})
+    db[Collections.PRODUCTS.value].delete_many({})
+    db[Collections.PRODUCTS.value].insert_many(
+        {"product_name": f"product_{number}", "category": "bench", "price": 1.5, "quantity": stock}
+        for number in range(product_count)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк вставки замовлень у MongoDB.")
+    parser.add_argument('--orders', type=int, default=2000)
+    parser.add_argument('--items', type=int, default=5, help="Кількість товарів у замовленні.")
+    parser.add_argument('--products', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=100, help="Кількість замовлень у пакеті insert_orders.")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--mongomock', action='store_true', help="Використати mongomock замість сервера.")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=27017)
+    parser.add_argument('--database', default='bench_grocery_store',
+                        help="База даних для бенчмарку (її колекції будуть очищені).")
+    args = parser.parse_args()
+
+    listener = CommandCounter()
+    client = make_client(args, listener)
+    rnd = random.Random(args.seed)
+    orders = [
+        (f"client_{rnd.randint(1, 100)}",
+         *((f"product_{rnd.randrange(args.products)}", rnd.randint(1, 3)) for _ in range(args.items)))
+        for _ in range(args.orders)
+    ]
+    stock = args.orders * args.items * 3
+
+    store = MyMongo(args.host, args.port, args.database, client=client)
+    with store:
+        logger.remove()
+        results = {}
+
+        seed(store.db, args.products, stock)
+        listener.commands = 0
+        start = time.perf_counter()
+        for client_name, *products in orders:
+            legacy_insert_order(store.db, client_name, products)
+        results['sequential'] = (time.perf_counter() - start, listener.commands)
+
+        seed(store.db, args.products, stock)
+        listener.commands = 0
+        start = time.perf_counter()
+        for offset in range(0, len(orders), args.batch_size):
+            store.insert_orders(orders[offset:offset + args.batch_size])
+        results['insert_orders'] = (time.perf_counter() - start, listener.commands)
+
+    report = {
+        'backend': 'mongomock' if args.mongomock else f"{args.host}:{args.port}/{args.database}",
+        'orders': args.orders,
+        'items_per_order': args.items,
+        'batch_size': args.batch_size,
+    }
+    for name, (elapsed, commands) in results.items():
+        report[name] = {'seconds': round(elapsed, 3), 'orders_per_sec': round(args.orders / elapsed, 1)}
+        if not args.mongomock:
+            report[name]['commands_per_order'] = round(commands / args.orders, 2)
+    client.close()
+    sys.stdout.write(json.dumps(report, ensure_ascii=False, indent=2) + '\n')
+
+
+if __name__ == "__main__":
+    main()
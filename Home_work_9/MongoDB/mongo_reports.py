@@ -0,0 +1,304 @@
+"""
+Звіти за замовленнями продуктового магазину, що обчислюються на сервері MongoDB.
+
+`OrderReports` не завантажує документи замовлень у пам'ять процесу:
+- кількість замовлень рахується через count_documents (за індексом order_date);
+- списки замовлень читаються курсором з проєкцією та batch_size і видаються по одному;
+- продажі продуктів і витрати клієнтів агрегуються $group на сервері з allowDiskUse,
+  результат агрегації також читається курсором;
+- зведення за період ($facet) обчислюється за один прохід по замовленнях.
+
+Результати повертаються як моделі Pydantic.
+
+Приклад:
+    with MyMongo("localhost", 27017, "grocery_store") as gs:
+        reports = OrderReports(gs.db[Collections.ORDERS.value])
+        for sale in reports.iter_total_products_sold(days=30):
+            print(sale.product_name, sale.total_sold)
+"""
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+from pydantic import BaseModel
+
+# Кількість документів, що передаються з сервера за один getMore
+REPORT_BATCH_SIZE = 500
+# Кількість клієнтів і продуктів у зведенні за період
+SUMMARY_TOP_LIMIT = 5
+
+
+class OrderSummary(BaseModel):
+    """
+    Коротка інформація про замовлення.
+
+    Атрибути:
+        order_number (int): Номер замовлення.
+        client_name (str): Ім'я клієнта.
+        total_sum (float): Загальна сума замовлення.
+        order_date (datetime): Дата замовлення.
+    """
+    order_number: int
+    client_name: str
+    total_sum: float
+    order_date: datetime
+
+
+class ProductSales(BaseModel):
+    """
+    Продажі продукту за період.
+
+    Атрибути:
+        product_name (str): Назва продукту.
+        total_sold (int): Продана кількість.
+        orders_count (int): Кількість замовлень з продуктом.
+    """
+    product_name: str
+    total_sold: int
+    orders_count: int
+
+
+class ClientSpending(BaseModel):
+    """
+    Витрати клієнта.
+
+    Атрибути:
+        client_name (str): Ім'я клієнта.
+        total_spent (float): Загальна сума замовлень.
+        orders_count (int): Кількість замовлень.
+    """
+    client_name: str
+    total_spent: float
+    orders_count: int
+
+
+class OrdersSummary(BaseModel):
+    """
+    Зведення замовлень за період.
+
+    Атрибути:
+        start_date (datetime): Початок періоду.
+        end_date (datetime): Кінець періоду.
+        orders_count (int): Кількість замовлень.
+        revenue (float): Загальна сума замовлень.
+        top_clients (List[ClientSpending]): Клієнти з найбільшими витратами.
+        top_products (List[ProductSales]): Продукти з найбільшими продажами.
+    """
+    start_date: datetime
+    end_date: datetime
+    orders_count: int = 0
+    revenue: float = 0.0
+    top_clients: List[ClientSpending] = []
+    top_products: List[ProductSales] = []
+
+
+class OrderReports:
+    """
+    Звіти за колекцією замовлень.
+
+    Атрибути:
+        orders_collection: Колекція замовлень.
+        batch_size (int): Розмір пакета курсорів.
+    """
+
+    def __init__(self, orders_collection, batch_size: int = REPORT_BATCH_SIZE):
+        """
+        Ініціалізує OrderReports.
+
+        Аргументи:
+            orders_collection: Колекція замовлень.
+            batch_size (int): Кількість документів, що передаються з сервера за один запит курсора.
+        """
+        self.orders_collection = orders_collection
+        self.batch_size = batch_size
+
+    @staticmethod
+    def period(days: int):
+        """
+        Повертає межі періоду за останні N днів.
+
+        Аргументи:
+            days (int): Кількість днів.
+
+        Повертає:
+            Tuple[datetime, datetime]: Початок і кінець періоду.
+        """
+        end_date = datetime.now()
+        return end_date - timedelta(days=days), end_date
+
+    @staticmethod
+    def period_match(start_date: datetime, end_date: datetime) -> dict:
+        """
+        Повертає етап $match за датою замовлення.
+        """
+        return {"$match": {"order_date": {"$gte": start_date, "$lte": end_date}}}
+
+    @staticmethod
+    def product_sales_stages() -> List[dict]:
+        """
+        Повертає етапи агрегації продажів продуктів, відсортованих за проданою кількістю.
+
+        До $unwind залишаються лише _id і список продуктів, щоб не розгортати решту полів замовлення.
+        Замовлення може містити кілька позицій одного продукту, тому спершу позиції групуються
+        за парою (замовлення, продукт), і orders_count рахує замовлення, а не позиції.
+        """
+        return [
+            {"$project": {"_id": 1, "products_list": 1}},
+            {"$unwind": "$products_list"},
+            {"$group": {
+                "_id": {"order": "$_id", "product_name": "$products_list.product_name"},
+                "quantity": {"$sum": "$products_list.quantity"}
+            }},
+            {"$group": {
+                "_id": "$_id.product_name",
+                "total_sold": {"$sum": "$quantity"},
+                "orders_count": {"$sum": 1}
+            }},
+            {"$sort": {"total_sold": -1, "_id": 1}}
+        ]
+
+    @staticmethod
+    def client_spending_stages() -> List[dict]:
+        """
+        Повертає етапи агрегації витрат клієнтів, відсортованих за сумою.
+        """
+        return [
+            {"$group": {
+                "_id": "$client_name",
+                "total_spent": {"$sum": "$total_sum"},
+                "orders_count": {"$sum": 1}
+            }},
+            {"$sort": {"total_spent": -1, "_id": 1}}
+        ]
+
+    def aggregate(self, pipeline: List[dict]):
+        """
+        Виконує агрегацію з allowDiskUse і повертає курсор.
+
+        allowDiskUse дозволяє $group і $sort переходити на тимчасові файли замість
+        помилки при перевищенні ліміту пам'яті етапу (100 МБ).
+        """
+        return self.orders_collection.aggregate(pipeline, allowDiskUse=True, batchSize=self.batch_size)
+
+    def count_recent_orders(self, days: int = 30) -> int:
+        """
+        Повертає кількість замовлень за останні N днів без читання документів.
+
+        Аргументи:
+            days (int): Кількість днів.
+
+        Повертає:
+            int: Кількість замовлень.
+        """
+        start_date, _ = self.period(days)
+        return self.orders_collection.count_documents({"order_date": {"$gte": start_date}})
+
+    def iter_recent_orders(self, days: int = 30) -> Iterator[OrderSummary]:
+        """
+        Видає замовлення за останні N днів, від найновіших, читаючи курсор пакетами.
+
+        Аргументи:
+            days (int): Кількість днів.
+
+        Повертає:
+            Iterator[OrderSummary]: Замовлення.
+        """
+        start_date, _ = self.period(days)
+        cursor = self.orders_collection.find(
+            {"order_date": {"$gte": start_date}},
+            {"_id": 0, "order_number": 1, "client_name": 1, "total_sum": 1, "order_date": 1}
+        ).sort("order_date", -1).batch_size(self.batch_size)
+        with cursor:
+            for order in cursor:
+                yield OrderSummary(**order)
+
+    def iter_total_products_sold(self, days: int = 30) -> Iterator[ProductSales]:
+        """
+        Видає продажі продуктів за останні N днів, від найбільших.
+
+        Аргументи:
+            days (int): Кількість днів.
+
+        Повертає:
+            Iterator[ProductSales]: Продажі продуктів.
+        """
+        pipeline = [self.period_match(*self.period(days)), *self.product_sales_stages()]
+        with self.aggregate(pipeline) as cursor:
+            for product in cursor:
+                yield ProductSales(product_name=product["_id"], total_sold=product["total_sold"],
+                                   orders_count=product["orders_count"])
+
+    def total_spent_by_client(self, client_name: str) -> Optional[ClientSpending]:
+        """
+        Повертає витрати клієнта за всі замовлення.
+
+        Аргументи:
+            client_name (str): Ім'я клієнта.
+
+        Повертає:
+            ClientSpending або None: Витрати клієнта або None, якщо замовлень немає.
+        """
+        pipeline = [{"$match": {"client_name": client_name}}, *self.client_spending_stages()]
+        with self.aggregate(pipeline) as cursor:
+            for client in cursor:
+                return ClientSpending(client_name=client["_id"], total_spent=client["total_spent"],
+                                      orders_count=client["orders_count"])
+        return None
+
+    def iter_spending_by_client(self, days: int = 30) -> Iterator[ClientSpending]:
+        """
+        Видає витрати всіх клієнтів за останні N днів, від найбільших.
+
+        Аргументи:
+            days (int): Кількість днів.
+
+        Повертає:
+            Iterator[ClientSpending]: Витрати клієнтів.
+        """
+        pipeline = [self.period_match(*self.period(days)), *self.client_spending_stages()]
+        with self.aggregate(pipeline) as cursor:
+            for client in cursor:
+                yield ClientSpending(client_name=client["_id"], total_spent=client["total_spent"],
+                                     orders_count=client["orders_count"])
+
+    def orders_summary(self, days: int = 30, top: int = SUMMARY_TOP_LIMIT) -> OrdersSummary:
+        """
+        Обчислює зведення замовлень за останні N днів одним проходом ($facet).
+
+        Кожна гілка $facet повертає обмежену кількість документів, тому результат
+        не наближається до ліміту розміру документа (16 МБ) за будь-якої кількості замовлень.
+
+        Аргументи:
+            days (int): Кількість днів.
+            top (int): Кількість клієнтів і продуктів у рейтингах.
+
+        Повертає:
+            OrdersSummary: Кількість і сума замовлень, найбільші клієнти та продукти.
+        """
+        start_date, end_date = self.period(days)
+        pipeline = [
+            self.period_match(start_date, end_date),
+            {"$facet": {
+                "totals": [{"$group": {"_id": None, "orders_count": {"$sum": 1}, "revenue": {"$sum": "$total_sum"}}}],
+                "top_clients": [*self.client_spending_stages(), {"$limit": top}],
+                "top_products": [*self.product_sales_stages(), {"$limit": top}]
+            }}
+        ]
+        with self.aggregate(pipeline) as cursor:
+            facets = next(cursor, None) or {}
+        totals = facets.get("totals") or [{}]
+        return OrdersSummary(
+            start_date=start_date,
+            end_date=end_date,
+            orders_count=totals[0].get("orders_count", 0),
+            revenue=totals[0].get("revenue", 0.0),
+            top_clients=[
+                ClientSpending(client_name=client["_id"], total_spent=client["total_spent"],
+                               orders_count=client["orders_count"])
+                for client in facets.get("top_clients", [])
+            ],
+            top_products=[
+                ProductSales(product_name=product["_id"], total_sold=product["total_sold"],
+                             orders_count=product["orders_count"])
+                for product in facets.get("top_products", [])
+            ]
+        )
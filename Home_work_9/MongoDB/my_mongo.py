@@ -6,13 +6,23 @@
 Модуль включає методи для створення колекцій, вставки продуктів і замовлень, а також
 для обробки замовлень і перегляду недавніх операцій.
 """
-from pydantic import BaseModel, ValidationError, PositiveInt, PositiveFloat
-from typing import List, Tuple
+import threading
+from collections import Counter
+from itertools import islice
+from pydantic import BaseModel, TypeAdapter, ValidationError, PositiveInt, PositiveFloat
+from typing import Dict, Iterable, List, Optional, Tuple
 from enum import Enum
-from pymongo import MongoClient, ASCENDING
-from pymongo.errors import ConnectionFailure
+from pymongo import MongoClient, ASCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError
 from logs.log_config import get_custom_logger  # Імпортуємо фабричну функцію для отримання логера
-from datetime import datetime, timedelta
+from mongo_reports import ClientSpending, OrderReports, OrdersSummary, ProductSales
+from datetime import datetime
+
+# Кількість номерів замовлень, що резервуються в лічильнику за один запит
+ORDER_NUMBER_BLOCK_SIZE = 1000
+ORDER_NUMBER_COUNTER = "order_number"
+# Кількість продуктів в одному bulk_write при пакетному завантаженні
+PRODUCT_BULK_CHUNK_SIZE = 1000
 
 
 class Collections(Enum):
@@ -21,6 +31,7 @@ class Collections(Enum):
     """
     PRODUCTS = "products"
     ORDERS = "orders"
+    COUNTERS = "counters"
 
 
 class ProductModel(BaseModel):
@@ -38,6 +49,27 @@ class ProductModel(BaseModel):
     price: PositiveFloat
 
 
+# Валідація пакета продуктів одним викликом pydantic
+PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductModel])
+PRODUCT_FIELDS = ("product_name", "quantity", "category", "price")
+
+
+class ProductUpsertResult(BaseModel):
+    """
+    Підсумок пакетного завантаження продуктів.
+
+    Атрибути:
+        upserted (int): Кількість доданих продуктів.
+        modified (int): Кількість оновлених продуктів.
+        errors (int): Кількість продуктів, які не вдалося записати.
+        invalid (int): Кількість продуктів, що не пройшли валідацію.
+    """
+    upserted: int = 0
+    modified: int = 0
+    errors: int = 0
+    invalid: int = 0
+
+
 class OrderItem(BaseModel):
     """
     Модель для валідації одиниць замовлення.
@@ -61,6 +93,13 @@ class OrderModel(BaseModel):
     products_list: List[OrderItem]
 
 
+class StockConflictError(Exception):
+    """
+    Виникає, коли умовне списання залишків не застосувалося до частини продуктів,
+    тобто їх кількість встиг зменшити інший клієнт.
+    """
+
+
 class MyMongo:
     """
     Клас для роботи з базою даних MongoDB.
@@ -75,9 +114,11 @@ class MyMongo:
         client: Об'єкт MongoClient для взаємодії з базою даних.
         db: Поточна база даних, з якою працює клас.
         logger: Логгер для ведення журналу подій.
+        order_number_block_size (int): Кількість номерів замовлень, що резервуються за один запит.
     """
 
-    def __init__(self, host: str, port: int, database: str):
+    def __init__(self, host: str, port: int, database: str, client: Optional[MongoClient] = None,
+                 order_number_block_size: int = ORDER_NUMBER_BLOCK_SIZE):
         """
         Ініціалізує підключення до бази даних MongoDB.
 
@@ -85,11 +126,21 @@ class MyMongo:
             host (str): Адреса хоста MongoDB.
             port (int): Порт для підключення до MongoDB.
             database (str): Назва бази даних.
+            client (MongoClient, опціонально): Готовий клієнт (наприклад, спільний для застосунку
+                або mongomock). Такий клієнт не закривається при виході з контекстного менеджера.
+            order_number_block_size (int): Кількість номерів замовлень, що резервуються в лічильнику
+                за один запит. Невикористані номери блоку втрачаються після завершення процесу,
+                тому 1 дає номери без пропусків ціною запиту на кожен пакет замовлень.
         """
         self.host = host
         self.port = port
         self.database_name = database
-        self.client = None
+        self.client = client
+        self._owns_client = client is None
+        self.order_number_block_size = order_number_block_size
+        # Зарезервований, але ще не виданий діапазон номерів [next, end)
+        self._next_order_number = self._order_numbers_end = 0
+        self._order_numbers_lock = threading.Lock()
         self.db = None
         self.message = "messages_mongo.json"  # Назва файлу без шляху
 
@@ -104,7 +155,8 @@ class MyMongo:
             MyMongoDB: Об'єкт для подальшої роботи з базою даних.
         """
         try:
-            self.client = MongoClient(self.host, self.port, serverSelectionTimeoutMS=5000)
+            if self._owns_client:
+                self.client = MongoClient(self.host, self.port, serverSelectionTimeoutMS=5000)
             self.db = self.client[self.database_name]
             # Перевірка підключення
             self.client.admin.command('ping')
@@ -118,7 +170,7 @@ class MyMongo:
         """
         Закриває підключення до MongoDB при виході з контекстного менеджера.
         """
-        if self.client:
+        if self.client and self._owns_client:
             self.client.close()
             self.logger.info(['database', 'connection_closed'])
         if exc_type:
@@ -264,12 +316,11 @@ class MyMongo:
         Аргументи:
             collection: Колекція продуктів.
             product (ProductModel): Валідована модель продукту.
+
+        Повертає:
+            UpdateResult: Результат оновлення.
         """
-        result = collection.update_one(
-            {"product_name": product.product_name},
-            {"$inc": {"quantity": product.quantity}, "$set": {"price": product.price, "category": product.category}},
-            upsert=True
-        )
+        result = collection.update_one(*self.product_upsert_spec(product), upsert=True)
         if result.upserted_id:
             self.logger.info(['products', 'product_added'], product_name=product.product_name,
                              category=product.category)
@@ -277,6 +328,25 @@ class MyMongo:
             self.logger.info(['products', 'product_updated'], product_name=product.product_name)
         else:
             self.logger.error(['products', 'product_upsert_error'], product_name=product.product_name)
+        return result
+
+    @staticmethod
+    def product_upsert_spec(product: ProductModel):
+        """
+        Повертає фільтр і оновлення для вставки або оновлення продукту.
+
+        Кількість додається до наявної, ціна та категорія перезаписуються.
+
+        Аргументи:
+            product (ProductModel): Валідована модель продукту.
+
+        Повертає:
+            Tuple[dict, dict]: Фільтр і документ оновлення.
+        """
+        return (
+            {"product_name": product.product_name},
+            {"$inc": {"quantity": product.quantity}, "$set": {"price": product.price, "category": product.category}}
+        )
 
     def find_product_by_name(self, product_name: str):
         """
@@ -290,32 +360,170 @@ class MyMongo:
         """
         return self.db[Collections.PRODUCTS.value].find_one({"product_name": product_name})
 
-    def insert_order(self, client_name: str, *products):
+    def insert_order(self, client_name: str, *products, use_transaction: bool = False):
         """
         Вставляє нове замовлення в колекцію 'orders'.
 
         Аргументи:
             client_name (str): Ім'я клієнта.
             *products: Продукти та їх кількість у вигляді кортежів (назва продукту, кількість).
+            use_transaction (bool): Виконати замовлення в транзакції (див. insert_orders).
+
+        Повертає:
+            int або None: Номер створеного замовлення або None, якщо замовлення не створено.
+        """
+        order_numbers = self.insert_orders([(client_name, *products)], use_transaction=use_transaction)
+        return order_numbers[0] if order_numbers else None
+
+    def insert_orders(self, orders, use_transaction: bool = False) -> List[int]:
+        """
+        Вставляє пакет замовлень за кількість запитів, що не залежить від кількості замовлень.
+
+        Усі продукти пакета читаються одним запитом з $in, залишки розподіляються між
+        замовленнями локально, а списання виконується одним умовним $inc (quantity >= n)
+        на кожен продукт пакета з подальшим видаленням розпроданих продуктів. Замовлення
+        вставляються одним insert_many.
+
+        Умовне списання ніколи не робить залишок від'ємним. Якщо залишок продукту встиг
+        зменшити інший клієнт, без транзакції свіжий залишок цього продукту перечитується
+        й повторно розподіляється між його позиціями в пакеті, доки списання не застосується
+        або залишок не скінчиться (замовлення без позицій не створюються). З use_transaction=True
+        увесь пакет відкочується (транзакції потребують replica set). Повідомлення про створені
+        замовлення логуються лише після фіксації транзакції.
+
+        Аргументи:
+            orders: Ітерований об'єкт замовлень у вигляді кортежів
+                (ім'я клієнта, (назва продукту, кількість), ...).
+            use_transaction (bool): Виконати читання, списання та вставку в одній транзакції.
+
+        Повертає:
+            List[int]: Номери створених замовлень.
+        """
+        validated_orders = []
+        for client_name, *products in orders:
+            products_list = self.prepare_products_list(*products)
+            if not products_list:
+                self.logger.error(['orders', 'empty_or_invalid_product_list'])
+                continue
+            order_data = self.validate_order_data(client_name, products_list)
+            if order_data:
+                validated_orders.append(order_data)
+        if not validated_orders:
+            return []
+
+        if not use_transaction:
+            created_orders = self.place_orders(validated_orders)
+        else:
+            # Номери, зарезервовані першою спробою, використовуються й у повторних спробах транзакції
+            order_numbers = []
+            try:
+                with self.client.start_session() as session:
+                    created_orders = session.with_transaction(
+                        lambda s: self.place_orders(validated_orders, session=s, order_numbers=order_numbers))
+            except StockConflictError:
+                self.logger.error(['orders', 'orders_rolled_back'], count=len(validated_orders))
+                return []
+        self.log_created_orders(created_orders)
+        return [order_number for order_number, _, _ in created_orders]
+
+    def place_orders(self, validated_orders: List[OrderModel], session=None,
+                     order_numbers: Optional[List[int]] = None) -> List[Tuple[int, OrderModel, List[str]]]:
+        """
+        Розподіляє залишки між валідованими замовленнями, списує їх і вставляє замовлення.
+
+        Вхідні замовлення не змінюються: розподіл працює з їх копіями, тому метод можна
+        безпечно повторювати (with_transaction повторює його після тимчасових помилок).
+
+        Аргументи:
+            validated_orders (List[OrderModel]): Валідовані замовлення.
+            session (ClientSession, опціонально): Сесія транзакції.
+            order_numbers (List[int], опціонально): Вже зарезервовані номери замовлень; доповнюється
+                за потреби, щоб повторна спроба використала ті самі номери.
+
+        Повертає:
+            List[Tuple[int, OrderModel, List[str]]]: Номер, дані та повідомлення кожного створеного замовлення.
+
+        Викидає:
+            StockConflictError: Якщо в транзакції частину залишків змінив інший клієнт.
         """
-        products_list = self.prepare_products_list(*products)
-        if not products_list:
-            self.logger.error(['orders', 'empty_or_invalid_product_list'])
-            return
-        order_data = self.validate_order_data(client_name, products_list)
-        if not order_data:
-            return
         orders_collection = self.db[Collections.ORDERS.value]
         products_collection = self.db[Collections.PRODUCTS.value]
-        order_number = self.generate_order_number(orders_collection)
-        products_to_update, total_sum, messages = self.process_order_items(order_data, products_collection)
-        if not products_to_update:
-            self.logger.info(['orders', 'order_not_created'])
-            return
-        self.update_product_quantities(products_collection, products_to_update)
-        self.remove_zero_quantity_products(products_collection)
-        self.insert_order_document(orders_collection, order_data, order_number, total_sum, messages)
-        self.log_messages(messages)
+        validated_orders = [order_data.model_copy(deep=True) for order_data in validated_orders]
+
+        product_names = list({item.product_name for order in validated_orders for item in order.products_list})
+        products = self.find_products(products_collection, product_names, session=session)
+        remaining = {name: product["quantity"] for name, product in products.items()}
+
+        placed_orders = []
+        for order_data in validated_orders:
+            reserved_items, total_sum, messages = self.process_order_items(order_data, products, remaining)
+            if not reserved_items:
+                self.logger.info(['orders', 'order_not_created'])
+                continue
+            placed_orders.append([order_data, total_sum, messages, reserved_items])
+
+        decrements = self.sum_reserved_quantities(placed_orders)
+        while decrements:
+            conflicts = self.update_product_quantities(products_collection, decrements, session=session)
+            if not conflicts:
+                break
+            fresh_products = self.find_products(products_collection, conflicts, session=session)
+            placed_orders = self.reallocate_conflicting_items(placed_orders, conflicts, fresh_products, products)
+            decrements = self.sum_reserved_quantities(placed_orders, conflicts)
+        if not placed_orders:
+            return []
+
+        if order_numbers is None:
+            order_numbers = []
+        if len(order_numbers) < len(placed_orders):
+            order_numbers.extend(self.allocate_order_numbers(len(placed_orders) - len(order_numbers)))
+        created_orders = [
+            (order_number, order_data, messages)
+            for order_number, (order_data, _, messages, _) in zip(order_numbers, placed_orders)
+        ]
+        self.insert_order_documents(orders_collection, placed_orders, order_numbers, session=session)
+        return created_orders
+
+    @staticmethod
+    def find_products(products_collection, product_names: List[str], session=None) -> Dict[str, dict]:
+        """
+        Читає продукти за назвами одним запитом з $in.
+
+        Аргументи:
+            products_collection: Колекція продуктів.
+            product_names (List[str]): Назви продуктів.
+            session (ClientSession, опціонально): Сесія транзакції.
+
+        Повертає:
+            Dict[str, dict]: Знайдені продукти (назва, кількість, ціна) за назвою.
+        """
+        return {
+            product["product_name"]: product
+            for product in products_collection.find(
+                {"product_name": {"$in": list(product_names)}},
+                {"_id": 0, "product_name": 1, "quantity": 1, "price": 1},
+                session=session
+            )
+        }
+
+    @staticmethod
+    def sum_reserved_quantities(placed_orders, product_names=None) -> Dict[str, int]:
+        """
+        Підсумовує зарезервовану кількість кожного продукту в замовленнях пакета.
+
+        Аргументи:
+            placed_orders: Список [OrderModel, загальна сума, повідомлення, зарезервовані позиції].
+            product_names (опціонально): Враховувати лише ці продукти.
+
+        Повертає:
+            Dict[str, int]: Назва продукту -> кількість для списання.
+        """
+        decrements = Counter()
+        for _, _, _, reserved_items in placed_orders:
+            for item in reserved_items:
+                if product_names is None or item.product_name in product_names:
+                    decrements[item.product_name] += item.quantity
+        return dict(decrements)
 
     def prepare_products_list(self, *products) -> List[OrderItem]:
         """
@@ -375,31 +583,99 @@ class MyMongo:
             int: Наступний номер замовлення.
         """
         last_order = orders_collection.find_one(
-            sort=[("order_number", -1)])
+            sort=[("order_number", -1)], projection={"order_number": 1})
         if last_order and "order_number" in last_order:
             return last_order["order_number"] + 1
         else:
             return 1
 
-    def process_order_items(self, order_data: OrderModel, products_collection):
+    def allocate_order_numbers(self, count: int) -> List[int]:
+        """
+        Видає номери замовлень з локально зарезервованого блоку, резервуючи новий блок за потреби.
+
+        Номери резервуються поза транзакцією замовлень: відкочена транзакція лише
+        залишає пропуск у нумерації, а не повторно видає ті самі номери.
+
+        Аргументи:
+            count (int): Кількість потрібних номерів.
+
+        Повертає:
+            List[int]: Унікальні номери замовлень за зростанням.
+        """
+        order_numbers = []
+        with self._order_numbers_lock:
+            while len(order_numbers) < count:
+                if self._next_order_number >= self._order_numbers_end:
+                    size = max(self.order_number_block_size, count - len(order_numbers))
+                    self._order_numbers_end = self.reserve_order_numbers(size) + 1
+                    self._next_order_number = self._order_numbers_end - size
+                take = min(count - len(order_numbers), self._order_numbers_end - self._next_order_number)
+                order_numbers.extend(range(self._next_order_number, self._next_order_number + take))
+                self._next_order_number += take
+        return order_numbers
+
+    def reserve_order_numbers(self, size: int) -> int:
         """
-        Обробляє замовлені товари, перевіряючи їх наявність і оновлюючи кількість товарів.
+        Атомарно резервує блок номерів замовлень у колекції 'counters' ($inc у find_one_and_update).
+
+        Якщо лічильника ще немає, він ініціалізується найбільшим наявним номером
+        замовлення, щоб нові номери не збігалися з уже створеними замовленнями.
+
+        Аргументи:
+            size (int): Кількість номерів у блоці.
+
+        Повертає:
+            int: Останній номер зарезервованого блоку.
+        """
+        counters_collection = self.db[Collections.COUNTERS.value]
+        counter = counters_collection.find_one_and_update(
+            {"_id": ORDER_NUMBER_COUNTER},
+            {"$inc": {"value": size}},
+            projection={"value": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if counter is None:
+            last_number = self.generate_order_number(self.db[Collections.ORDERS.value]) - 1
+            try:
+                # Конкурентний клієнт міг ініціалізувати лічильник раніше — тоді $setOnInsert нічого не змінює
+                counters_collection.update_one(
+                    {"_id": ORDER_NUMBER_COUNTER}, {"$setOnInsert": {"value": last_number}}, upsert=True)
+            except DuplicateKeyError:
+                pass
+            counter = counters_collection.find_one_and_update(
+                {"_id": ORDER_NUMBER_COUNTER},
+                {"$inc": {"value": size}},
+                projection={"value": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        last_reserved = counter["value"]
+        self.logger.info(['orders', 'order_numbers_reserved'], first=last_reserved - size + 1, last=last_reserved)
+        return last_reserved
+
+    def process_order_items(self, order_data: OrderModel, products: Dict[str, dict], remaining: Dict[str, int]):
+        """
+        Обробляє замовлені товари, перевіряючи їх наявність і резервуючи кількість товарів.
 
         Аргументи:
             order_data (OrderModel): Дані замовлення, що містять список продуктів.
-            products_collection: Колекція продуктів у базі даних.
+            products (Dict[str, dict]): Продукти пакета за назвою, прочитані з бази.
+            remaining (Dict[str, int]): Залишки продуктів з урахуванням попередніх замовлень пакета;
+                зменшуються на зарезервовану кількість.
 
         Повертає:
-            Tuple[List[Tuple[str, int]], float, List[str]]: Список продуктів для оновлення, загальна сума замовлення та повідомлення.
+            Tuple[List[OrderItem], float, List[str]]: Зарезервовані позиції, загальна сума замовлення та повідомлення.
         """
         total_sum = 0.0
-        products_to_update = []
+        reserved_items = []
         messages = []
 
         for item in order_data.products_list:
             product_name = item.product_name
             quantity = item.quantity
-            product = products_collection.find_one({"product_name": product_name})
+            product = products.get(product_name)
+            if product:
+                product = dict(product, quantity=remaining[product_name])
             message, available_quantity = self.check_product_availability(product, product_name, quantity)
             if message:
                 messages.append(message)
@@ -409,12 +685,13 @@ class MyMongo:
                     item.quantity = available_quantity
             if product:
                 total_sum += product["price"] * item.quantity
-                products_to_update.append((product_name, item.quantity))
+                remaining[product_name] -= item.quantity
+                reserved_items.append(item)
             else:
                 # Продукт не знайдено, вже було залоговано у check_product_availability
                 continue
 
-        return products_to_update, total_sum, messages
+        return reserved_items, total_sum, messages
 
     def check_product_availability(self, product: dict, product_name: str, requested_quantity: int):
         """
@@ -443,57 +720,126 @@ class MyMongo:
                 self.logger.info(['availability', 'product_fully_purchased'], product_name=product_name)
             return "", requested_quantity
 
-    def update_product_quantities(self, products_collection, products_to_update):
+    def update_product_quantities(self, products_collection, decrements: Dict[str, int], session=None) -> List[str]:
         """
-        Оновлює кількість продуктів у колекції на основі замовлення.
+        Списує кількість продуктів та видаляє розпродані продукти пакета.
+
+        Кожне списання — окремий умовний update_one (quantity >= n), тому залишок не стає
+        від'ємним навіть за одночасних замовлень, а результат відомий для кожного продукту.
+        Запитів стільки, скільки різних продуктів у пакеті, незалежно від кількості замовлень.
 
         Аргументи:
             products_collection: Колекція продуктів.
-            products_to_update (List[Tuple[str, int]]): Список продуктів з їх кількістю для оновлення.
+            decrements (Dict[str, int]): Назва продукту -> кількість для списання.
+            session (ClientSession, опціонально): Сесія транзакції.
+
+        Повертає:
+            List[str]: Назви продуктів, списання яких не застосувалося через нестачу залишку.
+
+        Викидає:
+            StockConflictError: Якщо в транзакції частина списань не застосувалася.
         """
-        for product_name, quantity in products_to_update:
+        conflicts = []
+        for product_name, quantity in decrements.items():
             result = products_collection.update_one(
-                {"product_name": product_name},
-                {"$inc": {"quantity": -quantity}}
+                {"product_name": product_name, "quantity": {"$gte": quantity}},
+                {"$inc": {"quantity": -quantity}},
+                session=session
             )
-            if result.modified_count:
-                self.logger.info(['products', 'product_quantity_updated'], product_name=product_name)
-            else:
-                self.logger.error(['products', 'product_quantity_update_error'], product_name=product_name)
+            if not result.modified_count:
+                conflicts.append(product_name)
+        if conflicts:
+            self.logger.error(['products', 'stock_conflict'], count=len(conflicts))
+            if session is not None:
+                raise StockConflictError(len(conflicts))
+
+        self.logger.info(['products', 'product_quantities_updated'], count=len(decrements) - len(conflicts))
+        delete_result = products_collection.delete_many(
+            {"product_name": {"$in": list(decrements)}, "quantity": {"$lte": 0}}, session=session)
+        if delete_result.deleted_count:
+            self.logger.info(['products', 'product_removed'], count=delete_result.deleted_count)
+        return conflicts
 
-    def remove_zero_quantity_products(self, products_collection):
+    def reallocate_conflicting_items(self, placed_orders, conflicts: List[str], fresh_products: Dict[str, dict],
+                                     products: Dict[str, dict]):
         """
-        Видаляє продукти, кількість яких дорівнює або менше 0 з колекції 'products'.
+        Повторно розподіляє свіжі залишки продуктів, списання яких не застосувалося.
+
+        Позиції цих продуктів отримують залишок у порядку замовлень пакета. Якщо залишку
+        не вистачає, кількість позиції зменшується, а позиція без залишку вилучається
+        із замовлення. Сума замовлення зменшується на вартість недоотриманих одиниць
+        (за ціною першого читання), а замовлення без жодної позиції не створюється.
 
         Аргументи:
-            products_collection: Колекція продуктів.
+            placed_orders: Список [OrderModel, загальна сума, повідомлення, зарезервовані позиції].
+            conflicts (List[str]): Назви продуктів, списання яких не застосувалося.
+            fresh_products (Dict[str, dict]): Перечитані продукти за назвою (розпродані відсутні).
+            products (Dict[str, dict]): Продукти першого читання за назвою.
+
+        Повертає:
+            Список замовлень у тому ж форматі.
         """
-        delete_result = products_collection.delete_many({"quantity": {"$lte": 0}})
-        if delete_result.deleted_count:
-            self.logger.info(['products', 'product_removed'], count=delete_result.deleted_count)
+        remaining = {name: fresh_products[name]["quantity"] if name in fresh_products else 0 for name in conflicts}
+        remaining_orders = []
+        for order_data, total_sum, messages, reserved_items in placed_orders:
+            kept_items = []
+            for item in reserved_items:
+                if item.product_name not in remaining:
+                    kept_items.append(item)
+                    continue
+                available_quantity = min(item.quantity, remaining[item.product_name])
+                remaining[item.product_name] -= available_quantity
+                if available_quantity == item.quantity:
+                    kept_items.append(item)
+                    continue
+                total_sum -= products[item.product_name]["price"] * (item.quantity - available_quantity)
+                if available_quantity:
+                    messages.append(f"Продукту {item.product_name} залишилося лише {available_quantity}.")
+                    item.quantity = available_quantity
+                    kept_items.append(item)
+                else:
+                    messages.append(f"Продукт {item.product_name} розпродано іншим клієнтом.")
+                    order_data.products_list = [line for line in order_data.products_list if line is not item]
+            if not kept_items:
+                self.logger.info(['orders', 'order_not_created'])
+                continue
+            remaining_orders.append([order_data, total_sum, messages, kept_items])
+        return remaining_orders
 
-    def insert_order_document(self, orders_collection, order_data: OrderModel, order_number: int, total_sum: float,
-                              messages: List[str]):
+    def insert_order_documents(self, orders_collection, placed_orders, order_numbers: List[int], session=None):
         """
-        Вставляє документ замовлення в колекцію 'orders'.
+        Вставляє документи замовлень у колекцію 'orders' одним insert_many.
 
         Аргументи:
             orders_collection: Колекція замовлень.
-            order_data (OrderModel): Дані замовлення, що включають інформацію про клієнта та продукти.
-            order_number (int): Номер замовлення.
-            total_sum (float): Загальна сума замовлення.
-            messages (List[str]): Список повідомлень, пов'язаних із замовленням.
-        """
-        new_order = {
-            "order_number": order_number,
-            "client_name": order_data.client_name,
-            "products_list": [item.model_dump() for item in order_data.products_list],
-            "total_sum": total_sum,
-            "messages": messages,
-            "order_date": datetime.now()
-        }
-        orders_collection.insert_one(new_order)
-        self.logger.info(['orders', 'order_created'], order_number=order_number, client_name=order_data.client_name)
+            placed_orders: Список [OrderModel, загальна сума, повідомлення, зарезервовані позиції].
+            order_numbers (List[int]): Номери замовлень у тому ж порядку.
+            session (ClientSession, опціонально): Сесія транзакції.
+        """
+        order_date = datetime.now()
+        new_orders = [
+            {
+                "order_number": order_number,
+                "client_name": order_data.client_name,
+                "products_list": [item.model_dump() for item in order_data.products_list],
+                "total_sum": total_sum,
+                "messages": messages,
+                "order_date": order_date
+            }
+            for order_number, (order_data, total_sum, messages, _) in zip(order_numbers, placed_orders)
+        ]
+        orders_collection.insert_many(new_orders, session=session)
+
+    def log_created_orders(self, created_orders: List[Tuple[int, OrderModel, List[str]]]):
+        """
+        Логує створені замовлення та повідомлення до них.
+
+        Аргументи:
+            created_orders: Номер, дані та повідомлення кожного створеного замовлення.
+        """
+        for order_number, order_data, messages in created_orders:
+            self.logger.info(['orders', 'order_created'], order_number=order_number, client_name=order_data.client_name)
+            self.log_messages(messages)
 
     def log_messages(self, messages: List[str]):
         """
@@ -505,84 +851,182 @@ class MyMongo:
         for message in messages:
             self.logger.info(['orders', 'message'], message=message)
 
-    def show_recent_orders(self, days: int = 30):
+    @property
+    def reports(self) -> OrderReports:
+        """
+        Звіти за колекцією замовлень (агрегація на сервері, курсори з batch_size).
+        """
+        return OrderReports(self.db[Collections.ORDERS.value])
+
+    def show_recent_orders(self, days: int = 30) -> int:
         """
-        Показує замовлення, зроблені за останні N днів.
+        Показує кількість замовлень, зроблених за останні N днів.
+
+        Кількість рахується на сервері (count_documents); самі замовлення можна
+        перебрати курсором через reports.iter_recent_orders.
 
         Аргументи:
             days (int): Кількість днів для фільтрації замовлень (за замовчуванням 30).
+
+        Повертає:
+            int: Кількість замовлень.
         """
-        date_threshold = datetime.now() - timedelta(days=days)
-        orders_collection = self.db[Collections.ORDERS.value]
-        recent_orders = list(orders_collection.find({"order_date": {"$gte": date_threshold}}))
-        count = len(recent_orders)
-        self.logger.info(['orders', 'recent_orders_retrieved'], count=count, days=days)
+        count = self.reports.count_recent_orders(days)
         self.logger.info(['orders', 'recent_orders_count'], count=count, days=days)
+        return count
 
-    def show_total_products_sold(self, days: int = 30):
+    def show_total_products_sold(self, days: int = 30) -> List[ProductSales]:
         """
         Показує загальну кількість проданих продуктів за останні N днів.
 
         Аргументи:
             days (int): Кількість днів для підрахунку проданих продуктів (за замовчуванням 30).
+
+        Повертає:
+            List[ProductSales]: Продажі продуктів від найбільших (по одному запису на продукт,
+            тому розмір не залежить від кількості замовлень).
         """
-        start_date = datetime.now() - timedelta(days=days)
-        end_date = datetime.now()
-        orders_collection = self.db[Collections.ORDERS.value]
-        pipeline = [
-            {"$match": {"order_date": {"$gte": start_date, "$lte": end_date}}},
-            {"$unwind": "$products_list"},
-            {"$group": {
-                "_id": "$products_list.product_name",
-                "total_sold": {"$sum": "$products_list.quantity"}
-            }}
-        ]
-        total_products_sold = list(orders_collection.aggregate(pipeline))
+        start_date, end_date = OrderReports.period(days)
         self.logger.info(['orders', 'total_products_sold_retrieved'], start_date=start_date, end_date=end_date)
-        # Логуємо інформацію про продані продукти
-        for product in total_products_sold:
-            self.logger.info(['orders', 'product_sold'], product_name=product['_id'], total_sold=product['total_sold'])
+        total_products_sold = []
+        for product in self.reports.iter_total_products_sold(days):
+            self.logger.info(['orders', 'product_sold'], product_name=product.product_name,
+                             total_sold=product.total_sold)
+            total_products_sold.append(product)
+        return total_products_sold
+
+    def show_orders_summary(self, days: int = 30) -> OrdersSummary:
+        """
+        Показує зведення замовлень за останні N днів: кількість, суму, найбільших клієнтів і продукти.
+
+        Аргументи:
+            days (int): Кількість днів (за замовчуванням 30).
 
-    def insert_products(self, products: List[Tuple[str, int, str, float]]):
+        Повертає:
+            OrdersSummary: Зведення замовлень.
+        """
+        summary = self.reports.orders_summary(days)
+        self.logger.info(['orders', 'orders_summary'], days=days, count=summary.orders_count, revenue=summary.revenue)
+        return summary
+
+    def insert_products(self, products: Iterable[Tuple[str, int, str, float]], bulk: bool = True,
+                        chunk_size: int = PRODUCT_BULK_CHUNK_SIZE):
         """
         Вставляє кілька продуктів у колекцію 'products'.
 
+        У пакетному режимі продукти читаються частинами по chunk_size: кожна частина
+        валідується одним викликом TypeAdapter і записується одним bulk_write(ordered=False),
+        тому завантаження каталогу з мільйонів продуктів не тримає його в пам'яті повністю
+        і не робить запит на кожен продукт. Без пакетного режиму кожен продукт записується
+        окремим update_one з повідомленням у журналі.
+
         Аргументи:
-            products (List[Tuple[str, int, str, float]]): Список кортежів з даними продукту (назва, кількість, категорія, ціна).
+            products (Iterable[Tuple[str, int, str, float]]): Кортежі з даними продукту (назва, кількість, категорія, ціна).
+            bulk (bool): Використати пакетний режим.
+            chunk_size (int): Кількість продуктів в одному bulk_write.
+
+        Повертає:
+            ProductUpsertResult: Кількість доданих, оновлених, незаписаних і невалідних продуктів.
         """
-        validated_products = []
-        for product_data in products:
-            product = self.validate_product_data(*product_data)
-            if product:
-                validated_products.append(product)
-        if not validated_products:
-            self.logger.error(['products', 'product_not_validated'])
-            return
         collection = self.db[Collections.PRODUCTS.value]
-        for product in validated_products:
-            self.upsert_product(collection, product)
+        total = ProductUpsertResult()
+        if not bulk:
+            for product_data in products:
+                product = self.validate_product_data(*product_data)
+                if not product:
+                    total.invalid += 1
+                    continue
+                result = self.upsert_product(collection, product)
+                if result.upserted_id:
+                    total.upserted += 1
+                elif result.modified_count:
+                    total.modified += 1
+                else:
+                    total.errors += 1
+            return total
+
+        products = iter(products)
+        while chunk := list(islice(products, chunk_size)):
+            validated_products, invalid = self.validate_products_chunk(chunk)
+            total.invalid += invalid
+            if validated_products:
+                result = self.bulk_upsert_products(collection, validated_products)
+                total.upserted += result.upserted
+                total.modified += result.modified
+                total.errors += result.errors
+
+        if not total.upserted and not total.modified and not total.errors:
+            self.logger.error(['products', 'product_not_validated'])
+        else:
+            self.logger.info(['products', 'products_bulk_upserted'], **total.model_dump())
+        return total
 
-    def show_total_spent_by_client(self, client_name: str):
+    def validate_products_chunk(self, chunk: List[Tuple[str, int, str, float]]):
+        """
+        Валідує частину продуктів одним викликом TypeAdapter(List[ProductModel]).
+
+        Якщо частина містить невалідні продукти, вони відкидаються, а решта валідується повторно.
+
+        Аргументи:
+            chunk (List[Tuple[str, int, str, float]]): Кортежі з даними продукту.
+
+        Повертає:
+            Tuple[List[ProductModel], int]: Валідовані продукти та кількість невалідних.
+        """
+        items = [dict(zip(PRODUCT_FIELDS, product_data)) for product_data in chunk]
+        try:
+            return PRODUCT_LIST_ADAPTER.validate_python(items), 0
+        except ValidationError as e:
+            errors = e.errors()
+            invalid_indexes = {error["loc"][0] for error in errors}
+            self.logger.error(['validation', 'products_validation_error'], count=len(invalid_indexes),
+                              error=errors[0]["msg"], item=chunk[errors[0]["loc"][0]])
+            valid_items = [item for index, item in enumerate(items) if index not in invalid_indexes]
+            return PRODUCT_LIST_ADAPTER.validate_python(valid_items), len(invalid_indexes)
+
+    def bulk_upsert_products(self, collection, products: List[ProductModel]) -> ProductUpsertResult:
+        """
+        Вставляє або оновлює продукти одним bulk_write(ordered=False).
+
+        Помилка запису одного продукту не зупиняє запис інших.
+
+        Аргументи:
+            collection: Колекція продуктів.
+            products (List[ProductModel]): Валідовані продукти.
+
+        Повертає:
+            ProductUpsertResult: Кількість доданих, оновлених і незаписаних продуктів.
+        """
+        operations = [UpdateOne(*self.product_upsert_spec(product), upsert=True) for product in products]
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            return ProductUpsertResult(upserted=result.upserted_count, modified=result.modified_count)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                self.logger.error(['products', 'product_upsert_error'], product_name=products[error["index"]].product_name)
+            return ProductUpsertResult(
+                upserted=e.details.get("nUpserted", 0),
+                modified=e.details.get("nModified", 0),
+                errors=len(e.details.get("writeErrors", []))
+            )
+
+    def show_total_spent_by_client(self, client_name: str) -> Optional[ClientSpending]:
         """
         Показує загальну суму, витрачену клієнтом.
 
         Аргументи:
             client_name (str): Ім'я клієнта, для якого потрібно підрахувати витрати.
+
+        Повертає:
+            ClientSpending або None: Витрати клієнта або None, якщо замовлень немає.
         """
-        orders_collection = self.db[Collections.ORDERS.value]
-        pipeline = [
-            {"$match": {"client_name": client_name}},
-            {"$group": {
-                "_id": "$client_name",
-                "total_spent": {"$sum": "$total_sum"}
-            }}
-        ]
-        result = list(orders_collection.aggregate(pipeline))
-        if result:
-            total_spent = result[0]['total_spent']
-            self.logger.info(['orders', 'total_spent_retrieved'], client_name=client_name, total_spent=total_spent)
+        spending = self.reports.total_spent_by_client(client_name)
+        if spending:
+            self.logger.info(['orders', 'total_spent_retrieved'], client_name=client_name,
+                             total_spent=spending.total_spent)
         else:
             self.logger.info(['orders', 'no_orders_for_client'], client_name=client_name)
+        return spending
 
 
 # Приклад Використання
@@ -613,3 +1057,4 @@ if __name__ == "__main__":
         gs.show_recent_orders(30)
         gs.show_total_products_sold(30)
         gs.show_total_spent_by_client("John Doe")
+        gs.show_orders_summary(30)
@@ -0,0 +1,208 @@
+"""
+Асинхронний варіант MyRedis на основі redis.asyncio.
+
+`AsyncMyRedis` має той самий API сесій, що й `MyRedis` (створення, пошук користувача
+за токеном, оновлення активності, видалення), і виконує ті самі Lua-скрипти з каталогу
+lua_scripts, тому веб-сервіс може обслуговувати тисячі одночасних перевірок сесій
+в одному потоці без блокування на кожному запиті.
+
+Ключ сесії обчислюється в кожному виклику, а не зберігається в екземплярі, тому один
+екземпляр можна безпечно використовувати з багатьох одночасних корутин.
+
+Приклад:
+    async with AsyncMyRedis("localhost", 6379, 0) as store:
+        session_token = await store.create_session_user("ayu")
+        user_id = await store.get_user_id_by_token(session_token)
+"""
+
+import asyncio
+import time
+import weakref
+
+import redis.asyncio as aioredis
+
+from logs.log_config import get_custom_logger
+from my_redis import DEFAULT_MAX_CONNECTIONS, SESSION_TTL, MyRedis, TokenManager, load_lua_scripts
+
+
+class AsyncMyRedis:
+    """
+    Асинхронний клас для роботи з сесіями в Redis.
+
+    Пули з'єднань redis.asyncio прив'язані до циклу подій, тому спільні пули
+    зберігаються окремо для кожного циклу.
+    """
+
+    # Цикл подій -> {(host, port, database, decode_responses): пул з'єднань}
+    _pools = weakref.WeakKeyDictionary()
+
+    def __init__(self, host: str, port: int, database: int, connection_pool: aioredis.ConnectionPool = None,
+                 decode_responses: bool = False):
+        """
+        Ініціалізація класу AsyncMyRedis.
+
+        :param host: Адреса сервера Redis.
+        :param port: Порт сервера Redis.
+        :param database: Номер бази даних Redis.
+        :param connection_pool: Асинхронний пул з'єднань. За замовчуванням спільний пул
+            для host/port/database у поточному циклі подій.
+        :param decode_responses: Декодувати відповіді в рядки на рівні пулу.
+        """
+        self.host = host
+        self.port = port
+        self.database_name = database
+        self.connection_pool = connection_pool
+        if connection_pool is not None:
+            decode_responses = connection_pool.connection_kwargs.get('decode_responses', False)
+        self.decode_responses = decode_responses
+        self._text = str if decode_responses else bytes.decode
+        self.client = None
+        self.scripts = {}
+        self.logger = get_custom_logger("message_redis.json")
+
+    @classmethod
+    def shared_pool(cls, host: str, port: int, database: int, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                    decode_responses: bool = False) -> aioredis.ConnectionPool:
+        """
+        Повертає спільний пул з'єднань поточного циклу подій, створюючи його за потреби.
+
+        :param host: Адреса сервера Redis.
+        :param port: Порт сервера Redis.
+        :param database: Номер бази даних Redis.
+        :param max_connections: Максимальна кількість з'єднань у новому пулі.
+        :param decode_responses: Чи декодує пул відповіді в рядки.
+        :return: Асинхронний пул з'єднань.
+        """
+        pools = cls._pools.setdefault(asyncio.get_running_loop(), {})
+        key = (host, port, database, decode_responses)
+        if key not in pools:
+            pools[key] = aioredis.ConnectionPool(host=host, port=port, db=database, max_connections=max_connections,
+                                                 decode_responses=decode_responses)
+        return pools[key]
+
+    async def __aenter__(self):
+        """
+        Встановлює підключення до Redis при вході в асинхронний контекстний менеджер.
+
+        :return: Екземпляр класу AsyncMyRedis.
+        :raises redis.ConnectionError: Якщо не вдається підключитися до Redis.
+        """
+        try:
+            pool = self.connection_pool or self.shared_pool(self.host, self.port, self.database_name,
+                                                            decode_responses=self.decode_responses)
+            self.client = aioredis.Redis(connection_pool=pool)
+            await self.client.ping()
+            self.scripts = {name: self.client.register_script(source) for name, source in load_lua_scripts().items()}
+            self.logger.info(['redis', 'connected'], db_name=self.database_name)
+            return self
+        except aioredis.ConnectionError as e:
+            self.logger.error(['redis', 'connection_error'], error=str(e))
+            raise e
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Повертає з'єднання до пулу при виході з контекстного менеджера (сам пул не закривається).
+
+        :param exc_type: Тип виключення.
+        :param exc_value: Значення виключення.
+        :param traceback: Слід виключення.
+        """
+        if self.client:
+            await self.client.aclose()
+            self.logger.info(['redis', 'disconnected'])
+        if exc_type:
+            self.logger.error(['general', 'exception_in_with_block'], error=str(exc_value))
+        return False
+
+    async def session_exists(self, user_id):
+        """
+        Перевірка наявності сесії користувача.
+
+        :param user_id: Ідентифікатор користувача.
+        :return: True, якщо сесія існує, інакше False.
+        """
+        return bool(await self.client.exists(f"user_session:{user_id}"))
+
+    async def create_session_user(self, user_id):
+        """
+        Створює сесію користувача в Redis, якщо вона не існує (скрипт create_session.lua).
+
+        :param user_id: Ідентифікатор користувача.
+        :return: Токен нової сесії або None, якщо сесія вже існує.
+        """
+        login_time = int(time.time())
+        session_token = TokenManager.generate_token()
+
+        created = await self.scripts['create_session'](
+            keys=[f"user_session:{user_id}", f"session_token:{session_token}"],
+            args=[session_token, login_time, SESSION_TTL, user_id]
+        )
+
+        if not created:
+            self.logger.info(["general", "session_exists"], user_id=user_id)
+            return None
+
+        self.logger.info(["general", "session_token_saved"], session_token=session_token, user_id=user_id)
+        self.logger.info(
+            ["general", "save_session"],
+            session_token=session_token,
+            login_time=MyRedis.convert_login_time({"login_time": login_time})
+        )
+        return session_token
+
+    async def get_user_id_by_token(self, session_token):
+        """
+        Отримати user_id по session_token.
+
+        :param session_token: Токен сесії.
+        :return: Ідентифікатор користувача або None, якщо не знайдено.
+        """
+        user_id = await self.client.get(f"session_token:{session_token}")
+        if user_id:
+            return self._text(user_id)
+        self.logger.error(["general", "user_id_not_found_by_token"], session_token=session_token)
+        return None
+
+    async def update_last_activity(self, user_id):
+        """
+        Оновлює час останньої активності користувача (скрипт touch_session.lua).
+
+        :param user_id: Ідентифікатор користувача.
+        :return: Оновлена сесія або None, якщо сесії немає.
+        """
+        fields = await self.scripts['touch_session'](
+            keys=[f"user_session:{user_id}"], args=[int(time.time()), SESSION_TTL]
+        )
+        if not fields:
+            self.logger.error(["general", "session_not_found"], user_id=user_id)
+            return None
+
+        session_info = {self._text(field): self._text(value) for field, value in zip(fields[::2], fields[1::2])}
+        self.logger.info(["general", "update_last_activity"])
+        self.logger.info(
+            ["general", "updated_session_info"],
+            user_id=user_id,
+            session_token=session_info.get('session_token'),
+            login_time=MyRedis.convert_login_time(session_info)
+        )
+        return session_info
+
+    async def delete_session(self, user_id):
+        """
+        Видалення сесії для користувача та відповідного session_token (скрипт delete_session.lua).
+
+        :param user_id: Ідентифікатор користувача.
+        :return: True, якщо сесію видалено, інакше False.
+        """
+        result = await self.scripts['delete_session'](keys=[f"user_session:{user_id}"])
+        if not result[0]:
+            self.logger.error(["general", "session_not_found"], user_id=user_id)
+            return False
+
+        self.logger.info(["general", "delete_session"], user_id=user_id)
+        session_token = self._text(result[1])
+        if session_token:
+            self.logger.info(["general", "delete_session_token"], session_token=session_token)
+        else:
+            self.logger.error(["general", "token_not_found_in_session"], user_id=user_id)
+        return True
@@ -0,0 +1,99 @@
+"""
+Бенчмарк обмежувача частоти та лічильників активних користувачів.
+
+Вимірює кількість перевірок ліміту та записів активності за секунду, кількість
+round trip на операцію, а також похибку оцінки HyperLogLog відносно точної кількості.
+
+Запуск з каталогу Redis (каталог Home_work_9 має бути в PYTHONPATH):
+    PYTHONPATH=.. python bench_rate_limit.py --fakeredis [--operations 20000] [--identities 500]
+    PYTHONPATH=.. python bench_rate_limit.py --host localhost --port 6379 --database 15
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import redis
+
+from bench_sessions import make_pool
+from rate_limiter import SlidingWindowRateLimiter
+from session_analytics import ActiveUserCounter
+
+
+def measure(operation, arguments, connection_class):
+    """
+    Виконує операцію для кожного аргументу та вимірює пропускну здатність.
+
+    :return: Словник з кількістю операцій за секунду та round trip на операцію.
+    """
+    connection_class.round_trips = 0
+    start = time.perf_counter()
+    for argument in arguments:
+        operation(argument)
+    elapsed = time.perf_counter() - start
+    return {
+        'ops_per_sec': round(len(arguments) / elapsed, 1),
+        'round_trips_per_op': round(connection_class.round_trips / len(arguments), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк обмежувача частоти та лічильників активних користувачів.")
+    parser.add_argument('--operations', type=int, default=20000)
+    parser.add_argument('--identities', type=int, default=500, help="Кількість різних користувачів/IP.")
+    parser.add_argument('--limit', type=int, default=30, help="Ліміт запитів у вікні.")
+    parser.add_argument('--window-ms', type=int, default=60_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--fakeredis', action='store_true', help="Використати fakeredis замість сервера.")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=6379)
+    parser.add_argument('--database', type=int, default=15,
+                        help="База даних для бенчмарку (її ключі будуть перезаписані).")
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help="Змодельована затримка мережі на один запит у мілісекундах.")
+    args = parser.parse_args()
+
+    pool, connection_class = make_pool(args)
+    client = redis.Redis(connection_pool=pool)
+    rnd = random.Random(args.seed)
+    identities = [f"10.0.{number // 256}.{number % 256}" for number in range(args.identities)]
+    requests = [rnd.choice(identities) for _ in range(args.operations)]
+
+    limiter = SlidingWindowRateLimiter(client, args.limit, args.window_ms, prefix="bench_rate_limit")
+    for identity in identities:
+        limiter.reset(identity, scope="ip")
+    allowed = 0
+
+    def check(identity):
+        nonlocal allowed
+        allowed += limiter.hit(identity, scope="ip").allowed
+
+    rate_limit = measure(check, requests, connection_class)
+    rate_limit.update(allowed=allowed, denied=args.operations - allowed)
+
+    # Кошик поточної хвилини; користувачі повторюються, щоб перевірити унікальність
+    counter = ActiveUserCounter(client, prefix="bench_active_users")
+    now = time.time()
+    client.delete(counter.key(counter.bucket_start(now)))
+    users = [f"user_{rnd.randint(1, args.operations // 2)}" for _ in range(args.operations)]
+    active_users = measure(lambda user_id: counter.record(user_id, timestamp=now), users, connection_class)
+    estimate = counter.count(now, now)
+    exact = len(set(users))
+    active_users.update(exact_unique=exact, estimated_unique=estimate,
+                        error_percent=round(abs(estimate - exact) / exact * 100, 3))
+
+    report = {
+        'backend': 'fakeredis' if args.fakeredis else f"{args.host}:{args.port}/{args.database}",
+        'operations': args.operations,
+        'latency_ms': args.latency_ms,
+        'rate_limit': rate_limit,
+        'active_users': active_users,
+    }
+    client.close()
+    sys.stdout.write(json.dumps(report, ensure_ascii=False, indent=2) + '\n')
+
+
+if __name__ == "__main__":
+    main()
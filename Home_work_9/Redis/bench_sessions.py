@@ -0,0 +1,158 @@
+"""
+Бенчмарк операцій сесій MyRedis: покомандний доступ проти атомарних Lua-скриптів через пул з'єднань.
+
+Для кожної фази (створення, оновлення активності, видалення) вимірюється кількість
+сесій за секунду та кількість round trip на сесію. Базовий варіант повторює послідовність
+команд попередньої версії MyRedis (окремий запит на кожну команду).
+
+На fakeredis сервер працює в процесі, тому мережеву затримку можна змоделювати
+параметром --latency-ms (затримка додається на кожен відправлений запит або pipeline).
+Для виконання Lua-скриптів fakeredis потребує пакет lupa.
+
+Запуск з каталогу Redis (каталог Home_work_9 має бути в PYTHONPATH):
+    PYTHONPATH=.. python bench_sessions.py --fakeredis [--users 2000] [--latency-ms 0.2]
+    PYTHONPATH=.. python bench_sessions.py --host localhost --port 6379 --database 15
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import redis
+from loguru import logger
+
+from my_redis import MyRedis, SESSION_TTL, TokenManager
+
+
+def counting_connection(connection_class, latency=0.0):
+    """
+    Створює клас з'єднання, що рахує відправлені запити та додає до кожного затримку.
+
+    :param connection_class: Базовий клас з'єднання redis-py.
+    :param latency: Затримка на один запит у секундах.
+    :return: Підклас connection_class з лічильником round_trips.
+    """
+    class CountingConnection(connection_class):
+        round_trips = 0
+
+        def send_packed_command(self, command, check_health=True):
+            # Один виклик на команду або на весь pipeline
+            CountingConnection.round_trips += 1
+            if latency:
+                time.sleep(latency)
+            return super().send_packed_command(command, check_health)
+
+    return CountingConnection
+
+
+def make_pool(args):
+    """
+    Створює пул з'єднань до fakeredis або до сервера Redis.
+
+    :param args: Аргументи командного рядка.
+    :return: Пул з'єднань і клас з'єднання з лічильником.
+    """
+    if args.fakeredis:
+        import fakeredis
+        connection_class = counting_connection(fakeredis.FakeRedisConnection, args.latency_ms / 1000)
+        pool = redis.ConnectionPool(connection_class=connection_class, server=fakeredis.FakeServer())
+    else:
+        connection_class = counting_connection(redis.Connection, args.latency_ms / 1000)
+        pool = redis.ConnectionPool(connection_class=connection_class,
+                                    host=args.host, port=args.port, db=args.database)
+    return pool, connection_class
+
+
+def legacy_create(client, user_id):
+    """Створення сесії послідовністю команд попередньої версії."""
+    session_key = f"user_session:{user_id}"
+    if not client.exists(session_key):
+        session_token = TokenManager.generate_token()
+        client.hset(session_key, mapping={"session_token": session_token, "login_time": int(time.time())})
+        client.set(f"session_token:{session_token}", user_id)
+        client.expire(session_key, SESSION_TTL)
+        client.get(f"session_token:{session_token}")
+        client.type(session_key)
+        client.hgetall(session_key)
+
+
+def legacy_touch(client, user_id):
+    """Оновлення активності послідовністю команд попередньої версії."""
+    session_key = f"user_session:{user_id}"
+    client.hset(session_key, "login_time", int(time.time()))
+    client.expire(session_key, SESSION_TTL)
+    client.type(session_key)
+    session_token = client.hgetall(session_key)[b"session_token"].decode('utf-8')
+    client.get(f"session_token:{session_token}")
+
+
+def legacy_delete(client, user_id):
+    """Видалення сесії послідовністю команд попередньої версії."""
+    session_key = f"user_session:{user_id}"
+    client.type(session_key)
+    session_token = client.hgetall(session_key)[b"session_token"].decode('utf-8')
+    client.delete(session_key)
+    client.delete(f"session_token:{session_token}")
+
+
+def run_phase(operation, user_ids, connection_class):
+    """
+    Виконує операцію для кожного користувача та вимірює час і кількість round trip.
+
+    :return: Словник з кількістю сесій за секунду та round trip на сесію.
+    """
+    connection_class.round_trips = 0
+    start = time.perf_counter()
+    for user_id in user_ids:
+        operation(user_id)
+    elapsed = time.perf_counter() - start
+    return {
+        'sessions_per_sec': round(len(user_ids) / elapsed, 1),
+        'round_trips_per_session': round(connection_class.round_trips / len(user_ids), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк операцій сесій MyRedis.")
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--fakeredis', action='store_true', help="Використати fakeredis замість сервера.")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=6379)
+    parser.add_argument('--database', type=int, default=15,
+                        help="База даних для бенчмарку (її ключі сесій будуть перезаписані).")
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help="Змодельована затримка мережі на один запит у мілісекундах.")
+    args = parser.parse_args()
+
+    pool, connection_class = make_pool(args)
+    user_ids = [f"bench_user_{number}" for number in range(args.users)]
+    results = {}
+
+    with MyRedis(args.host, args.port, args.database, connection_pool=pool) as store:
+        # Логування кожної операції не вимірюється
+        logger.remove()
+        client = store.client
+
+        results['sequential'] = {
+            'create': run_phase(lambda user_id: legacy_create(client, user_id), user_ids, connection_class),
+            'touch': run_phase(lambda user_id: legacy_touch(client, user_id), user_ids, connection_class),
+            'delete': run_phase(lambda user_id: legacy_delete(client, user_id), user_ids, connection_class),
+        }
+        results['my_redis'] = {
+            'create': run_phase(store.create_session_user, user_ids, connection_class),
+            'touch': run_phase(store.update_last_activity, user_ids, connection_class),
+            'delete': run_phase(store.delete_session, user_ids, connection_class),
+        }
+
+    report = {
+        'backend': 'fakeredis' if args.fakeredis else f"{args.host}:{args.port}/{args.database}",
+        'users': args.users,
+        'latency_ms': args.latency_ms,
+        **results,
+    }
+    sys.stdout.write(json.dumps(report, ensure_ascii=False, indent=2) + '\n')
+
+
+if __name__ == "__main__":
+    main()
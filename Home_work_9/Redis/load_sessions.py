@@ -0,0 +1,171 @@
+"""
+Генератор навантаження сесій: синхронний MyRedis у пулі потоків проти AsyncMyRedis.
+
+Кожна сесія — повний цикл з чотирьох запитів: створення, пошук користувача за токеном,
+оновлення активності та видалення. Синхронний варіант виконує цикли в --concurrency
+потоках (по екземпляру MyRedis на потік, спільний пул з'єднань), асинхронний —
+у --concurrency корутинах одного потоку зі спільним екземпляром AsyncMyRedis.
+
+На fakeredis мережеву затримку можна змоделювати параметром --latency-ms:
+саме очікування відповіді сервера визначає, скільки потоків потрібно синхронному коду.
+
+Запуск з каталогу Redis (каталог Home_work_9 має бути в PYTHONPATH):
+    PYTHONPATH=.. python load_sessions.py --fakeredis --sessions 5000 --concurrency 100 --latency-ms 0.5
+    PYTHONPATH=.. python load_sessions.py --host localhost --port 6379 --database 15
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import redis
+import redis.asyncio as aioredis
+from loguru import logger
+
+from async_my_redis import AsyncMyRedis
+from bench_sessions import counting_connection
+from my_redis import MyRedis
+
+
+def async_latency_connection(connection_class, latency=0.0):
+    """
+    Створює асинхронний клас з'єднання, що додає затримку до кожного відправленого запиту.
+
+    :param connection_class: Базовий асинхронний клас з'єднання.
+    :param latency: Затримка на один запит у секундах.
+    :return: Підклас connection_class.
+    """
+    class LatencyConnection(connection_class):
+        async def send_packed_command(self, command, check_health=True):
+            if latency:
+                await asyncio.sleep(latency)
+            return await super().send_packed_command(command, check_health)
+
+    return LatencyConnection
+
+
+def make_pools(args):
+    """
+    Створює синхронний і асинхронний пули з'єднань до fakeredis або до сервера Redis.
+
+    :param args: Аргументи командного рядка.
+    :return: Пара (синхронний пул, асинхронний пул).
+    """
+    latency = args.latency_ms / 1000
+    if args.fakeredis:
+        import fakeredis
+        server = fakeredis.FakeServer()
+        sync_pool = redis.ConnectionPool(
+            connection_class=counting_connection(fakeredis.FakeRedisConnection, latency),
+            server=server, max_connections=args.concurrency)
+        async_pool = aioredis.ConnectionPool(
+            connection_class=async_latency_connection(fakeredis.FakeAsyncRedisConnection, latency),
+            server=server, max_connections=args.concurrency)
+    else:
+        connection_kwargs = {'host': args.host, 'port': args.port, 'db': args.database,
+                             'max_connections': args.concurrency}
+        sync_pool = redis.ConnectionPool(connection_class=counting_connection(redis.Connection, latency),
+                                         **connection_kwargs)
+        async_pool = aioredis.ConnectionPool(
+            connection_class=async_latency_connection(aioredis.Connection, latency), **connection_kwargs)
+    return sync_pool, async_pool
+
+
+def session_lifecycle(store, user_id):
+    """Повний цикл сесії через синхронний MyRedis."""
+    session_token = store.create_session_user(user_id)
+    store.get_user_id_by_token(session_token)
+    store.update_last_activity(user_id)
+    store.delete_session(user_id)
+
+
+async def async_session_lifecycle(store, user_id):
+    """Повний цикл сесії через AsyncMyRedis."""
+    session_token = await store.create_session_user(user_id)
+    await store.get_user_id_by_token(session_token)
+    await store.update_last_activity(user_id)
+    await store.delete_session(user_id)
+
+
+def run_sync(args, pool, user_ids):
+    """
+    Виконує цикли сесій у пулі потоків.
+
+    :return: Тривалість у секундах.
+    """
+    # MyRedis зберігає ключ поточної сесії в екземплярі, тому кожен потік має власний екземпляр
+    stores = [MyRedis(args.host, args.port, args.database, connection_pool=pool) for _ in range(args.concurrency)]
+    logger.remove()
+
+    def worker(store, worker_user_ids):
+        with store:
+            for user_id in worker_user_ids:
+                session_lifecycle(store, user_id)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [executor.submit(worker, store, user_ids[number::args.concurrency])
+                   for number, store in enumerate(stores)]
+        for future in futures:
+            future.result()
+    return time.perf_counter() - start
+
+
+async def run_async(args, pool, user_ids):
+    """
+    Виконує цикли сесій у корутинах одного циклу подій.
+
+    :return: Тривалість у секундах.
+    """
+    store = AsyncMyRedis(args.host, args.port, args.database, connection_pool=pool)
+    logger.remove()
+
+    async def worker(worker_user_ids):
+        for user_id in worker_user_ids:
+            await async_session_lifecycle(store, user_id)
+
+    async with store:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(user_ids[number::args.concurrency]) for number in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+    await pool.aclose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Навантаження сесій: MyRedis у потоках проти AsyncMyRedis.")
+    parser.add_argument('--sessions', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--fakeredis', action='store_true', help="Використати fakeredis замість сервера.")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=6379)
+    parser.add_argument('--database', type=int, default=15,
+                        help="База даних для навантаження (її ключі сесій будуть перезаписані).")
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help="Змодельована затримка мережі на один запит у мілісекундах.")
+    args = parser.parse_args()
+
+    sync_pool, async_pool = make_pools(args)
+    user_ids = [f"load_user_{number}" for number in range(args.sessions)]
+
+    results = {}
+    for name, elapsed in (('sync_threads', run_sync(args, sync_pool, user_ids)),
+                          ('async', asyncio.run(run_async(args, async_pool, user_ids)))):
+        results[name] = {'seconds': round(elapsed, 3), 'sessions_per_sec': round(args.sessions / elapsed, 1)}
+    sync_pool.disconnect()
+
+    report = {
+        'backend': 'fakeredis' if args.fakeredis else f"{args.host}:{args.port}/{args.database}",
+        'sessions': args.sessions,
+        'concurrency': args.concurrency,
+        'latency_ms': args.latency_ms,
+        **results,
+    }
+    sys.stdout.write(json.dumps(report, ensure_ascii=False, indent=2) + '\n')
+
+
+if __name__ == "__main__":
+    main()
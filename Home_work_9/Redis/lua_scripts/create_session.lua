@@ -0,0 +1,12 @@
+-- Атомарно створює сесію користувача та зворотний індекс токена, якщо сесії ще немає.
+-- KEYS[1] - user_session:{user_id}, KEYS[2] - session_token:{token}
+-- ARGV[1] - токен сесії, ARGV[2] - час входу (UNIX), ARGV[3] - TTL у секундах, ARGV[4] - user_id
+-- Повертає 1, якщо сесію створено, і 0, якщо вона вже існує.
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+
+redis.call('HSET', KEYS[1], 'session_token', ARGV[1], 'login_time', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('SET', KEYS[2], ARGV[4], 'EX', ARGV[3])
+return 1
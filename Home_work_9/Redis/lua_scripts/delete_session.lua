@@ -0,0 +1,16 @@
+-- Атомарно видаляє сесію користувача та ключ її токена.
+-- KEYS[1] - user_session:{user_id}
+-- Повертає {0}, якщо сесії немає, інакше {1, токен} (порожній рядок, якщо токена в сесії немає).
+-- Ключ токена стає відомим лише з хешу сесії, тому він не передається в KEYS
+-- (скрипт розрахований на Redis без кластера).
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {0}
+end
+
+local session_token = redis.call('HGET', KEYS[1], 'session_token')
+redis.call('DEL', KEYS[1])
+if session_token then
+    redis.call('DEL', 'session_token:' .. session_token)
+    return {1, session_token}
+end
+return {1, ''}
@@ -0,0 +1,21 @@
+-- Обмеження частоти запитів ковзним вікном на sorted set (журнал запитів у межах вікна).
+-- KEYS[1] - rate_limit:{scope}:{identity}
+-- ARGV[1] - ширина вікна в мілісекундах, ARGV[2] - ліміт запитів у вікні, ARGV[3] - унікальний ідентифікатор запиту
+-- Час береться з сервера (TIME), тому ліміт не залежить від розбіжності годинників клієнтів.
+-- Повертає {1 - дозволено / 0 - відхилено, кількість запитів у вікні, мс до звільнення місця}.
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, count + 1, 0}
+end
+
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, count, tonumber(oldest[2]) + window - now}
@@ -0,0 +1,19 @@
+-- Атомарно оновлює час активності та продовжує TTL сесії разом з ключем її токена.
+-- KEYS[1] - user_session:{user_id}
+-- ARGV[1] - поточний час (UNIX), ARGV[2] - TTL у секундах
+-- Повертає поля сесії плоским списком (поле, значення, ...) або порожній список, якщо сесії немає.
+-- Ключ токена стає відомим лише з хешу сесії, тому він не передається в KEYS
+-- (скрипт розрахований на Redis без кластера).
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {}
+end
+
+redis.call('HSET', KEYS[1], 'login_time', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+
+local session_token = redis.call('HGET', KEYS[1], 'session_token')
+if session_token then
+    redis.call('EXPIRE', 'session_token:' .. session_token, ARGV[2])
+end
+
+return redis.call('HGETALL', KEYS[1])
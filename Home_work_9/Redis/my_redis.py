@@ -3,8 +3,49 @@ import time
 import redis
 import uuid
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 from logs.log_config import get_custom_logger
 
+# Час життя сесії в секундах
+SESSION_TTL = 1800
+
+# Максимальна кількість з'єднань у спільному пулі
+DEFAULT_MAX_CONNECTIONS = 50
+
+# Кількість ключів в одному пакеті SCAN/pipeline при експорті та імпорті
+EXPORT_BATCH_SIZE = 500
+
+# Кількість елементів списку або zset, що читаються одним LRANGE/ZRANGE у decode_many
+VALUE_CHUNK_SIZE = 1000
+
+# Каталог Lua-скриптів операцій сесії
+LUA_SCRIPTS_DIR = Path(__file__).parent / "lua_scripts"
+
+
+@lru_cache(maxsize=None)
+def load_lua_scripts():
+    """
+    Зчитує Lua-скрипти з каталогу lua_scripts (один раз на процес).
+
+    :return: Словник назва скрипта (без .lua) -> текст скрипта.
+    """
+    return {path.stem: path.read_text(encoding='utf-8') for path in sorted(LUA_SCRIPTS_DIR.glob('*.lua'))}
+
+
+def batched(iterable, size):
+    """
+    Розбиває ітерований об'єкт на кортежі довжиною до size елементів.
+
+    :param iterable: Ітерований об'єкт.
+    :param size: Розмір пакета.
+    :return: Генератор кортежів.
+    """
+    iterator = iter(iterable)
+    while chunk := tuple(islice(iterator, size)):
+        yield chunk
+
 
 class TokenManager:
     """
@@ -24,23 +65,68 @@ class TokenManager:
 class MyRedis:
     """
     Клас для роботи з Redis.
+
+    Усі екземпляри з однаковими host/port/database використовують спільний пул з'єднань,
+    тому вхід у контекстний менеджер не відкриває нове TCP-з'єднання.
+
+    Створення, оновлення та видалення сесії виконуються Lua-скриптами з каталогу lua_scripts
+    (EVALSHA): кожна операція — один атомарний виклик на сервері, що підтримує і хеш
+    user_session:{id}, і зворотний індекс session_token:{token}.
     """
 
-    def __init__(self, host: str, port: int, database: int):
+    # Спільні пули з'єднань за (host, port, database)
+    _pools = {}
+
+    def __init__(self, host: str, port: int, database: int, connection_pool: redis.ConnectionPool = None,
+                 decode_responses: bool = False, token_cache=None):
         """
         Ініціалізація класу MyRedis.
 
         :param host: Адреса сервера Redis.
         :param port: Порт сервера Redis.
         :param database: Номер бази даних Redis.
+        :param connection_pool: Пул з'єднань. За замовчуванням спільний пул для host/port/database.
+        :param decode_responses: Декодувати відповіді в рядки на рівні пулу замість ручного
+            .decode('utf-8'). Для переданого connection_pool визначається його налаштуваннями.
+        :param token_cache: Локальний кеш session_token -> user_id (TokenCache), спільний для
+            екземплярів. За замовчуванням кожен пошук за токеном звертається до Redis.
         """
         self.host = host
         self.port = port
         self.database_name = database
+        self.connection_pool = connection_pool
+        if connection_pool is not None:
+            decode_responses = connection_pool.connection_kwargs.get('decode_responses', False)
+        self.decode_responses = decode_responses
+        # Перетворення відповіді Redis на рядок: str для вже декодованих відповідей
+        self._text = str if decode_responses else bytes.decode
         self.client = None
+        self.scripts = {}
+        self.token_cache = token_cache
         self.logger = get_custom_logger("message_redis.json")
         self.session_key = None
 
+    @classmethod
+    def shared_pool(cls, host: str, port: int, database: int, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                    decode_responses: bool = False) -> redis.ConnectionPool:
+        """
+        Повертає спільний пул з'єднань для сервера та бази даних, створюючи його за потреби.
+
+        :param host: Адреса сервера Redis.
+        :param port: Порт сервера Redis.
+        :param database: Номер бази даних Redis.
+        :param max_connections: Максимальна кількість з'єднань у новому пулі.
+        :param decode_responses: Чи декодує пул відповіді в рядки.
+        :return: Пул з'єднань.
+        """
+        key = (host, port, database, decode_responses)
+        pool = cls._pools.get(key)
+        if pool is None:
+            pool = cls._pools.setdefault(key, redis.ConnectionPool(
+                host=host, port=port, db=database, max_connections=max_connections,
+                decode_responses=decode_responses))
+        return pool
+
     def __enter__(self):
         """
         Встановлює підключення до Redis при вході в контекстний менеджер.
@@ -49,8 +135,14 @@ class MyRedis:
         :raises redis.ConnectionError: Якщо не вдається підключитися до Redis.
         """
         try:
-            self.client = redis.Redis(host=self.host, port=self.port, db=self.database_name)
+            pool = self.connection_pool or self.shared_pool(self.host, self.port, self.database_name,
+                                                                decode_responses=self.decode_responses)
+            self.client = redis.Redis(connection_pool=pool)
             self.client.ping()
+            # register_script не звертається до сервера: скрипт завантажується при першому NOSCRIPT
+            self.scripts = {name: self.client.register_script(source) for name, source in load_lua_scripts().items()}
+            if self.token_cache is not None and not self.token_cache.start_listener(self.client, self.database_name):
+                self.logger.warning(['redis', 'keyspace_notifications_unavailable'])
             self.logger.info(['redis', 'connected'], db_name=self.database_name)
             return self
         except redis.ConnectionError as e:
@@ -59,7 +151,7 @@ class MyRedis:
 
     def __exit__(self, exc_type, exc_value, traceback):
         """
-        Закриває підключення до Redis при виході з контекстного менеджера.
+        Повертає з'єднання до пулу при виході з контекстного менеджера (сам пул не закривається).
 
         :param exc_type: Тип виключення.
         :param exc_value: Значення виключення.
@@ -110,67 +202,81 @@ class MyRedis:
         """
         Створює сесію користувача в Redis, якщо вона не існує.
 
+        Перевірка існування, запис сесії та ключа токена виконуються атомарно
+        скриптом create_session.lua, тому одночасні входи одного користувача не перезаписують сесію.
+        Ключ токена отримує той самий TTL, що й сесія.
+
         :param user_id: Ідентифікатор користувача.
+        :return: Токен нової сесії або None, якщо сесія вже існує.
         """
         self.init_user_id(user_id)
-        if not self.session_exists(user_id):
-            login_time = int(time.time())
-            # Генерация нового токена для каждого пользователя
-            session_token = TokenManager.generate_token()
-
-            session_data = {
-                "session_token": session_token,
-                "login_time": login_time
-            }
-
-            # Зберігання сесії по user_id
-            self.client.hset(self.session_key, mapping=session_data)
-
-            # Зберігання user_id по session_token
-            self.client.set(f"session_token:{session_token}", user_id)
-
-            self.client.expire(self.session_key, 1800)
+        login_time = int(time.time())
+        # Генерация нового токена для каждого пользователя
+        session_token = TokenManager.generate_token()
 
-            # Логування факту збереження даних
-            saved_user_id = self.client.get(f"session_token:{session_token}")
-            if saved_user_id:
-                self.logger.info(
-                    ["general", "session_token_saved"],
-                    session_token=session_token,
-                    user_id=saved_user_id.decode('utf-8')
-                )
-            else:
-                self.logger.error(["general", "session_token_not_saved"], session_token=session_token)
-
-            readable_login_time = self.convert_login_time(self.get_session())
+        created = self.scripts['create_session'](
+            keys=[self.session_key, f"session_token:{session_token}"],
+            args=[session_token, login_time, SESSION_TTL, user_id]
+        )
 
-            self.logger.info(
-                ["general", "save_session"],
-                session_token=session_token,
-                login_time=readable_login_time
-            )
-        else:
+        if not created:
             self.logger.info(["general", "session_exists"], user_id=user_id)
+            return None
+
+        # Логування факту збереження даних
+        self.logger.info(["general", "session_token_saved"], session_token=session_token, user_id=user_id)
+        self.logger.info(
+            ["general", "save_session"],
+            session_token=session_token,
+            login_time=self.convert_login_time({"login_time": login_time})
+        )
+        return session_token
 
     def get_session(self):
         """
         Отримати активну сесію для поточного користувача.
 
-        :return: Інформація про сесію.
+        :return: Інформація про сесію (порожній словник, якщо сесії немає).
+        """
+        return self.decode_hash(self.client.hgetall(self.session_key))
+
+    def decode_hash(self, raw_hash):
+        """
+        Декодує хеш-таблицю Redis з байтів у рядки.
+
+        :param raw_hash: Результат HGETALL.
+        :return: Словник рядків.
         """
-        session_inf = self.universal_decoder(self.session_key)
-        return session_inf
+        if self.decode_responses:
+            return dict(raw_hash)
+        return {k.decode('utf-8'): v.decode('utf-8') for k, v in raw_hash.items()}
 
     def get_user_id_by_token(self, session_token):
         """
         Отримати user_id по session_token.
 
+        Якщо задано token_cache, відповідь спершу шукається в локальному кеші.
+
         :param session_token: Токен сесії.
         :return: Ідентифікатор користувача або None, якщо не знайдено.
         """
-        user_id = self.client.get(f"session_token:{session_token}")
+        token_key = f"session_token:{session_token}"
+        if self.token_cache is None:
+            user_id = self.client.get(token_key)
+        else:
+            user_id = self.token_cache.get(session_token)
+            if user_id is not None:
+                return user_id
+            # TTL ключа обмежує час життя запису в кеші
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(token_key)
+            pipe.pttl(token_key)
+            user_id, key_ttl = pipe.execute()
+            if user_id:
+                self.token_cache.put(session_token, self._text(user_id), key_ttl)
+
         if user_id:
-            return user_id.decode('utf-8')
+            return self._text(user_id)
         else:
             self.logger.error(["general", "user_id_not_found_by_token"], session_token=session_token)
             return None
@@ -182,103 +288,293 @@ class MyRedis:
         :param key: Ключ для декодування.
         :return: Розкодовані дані у вигляді рядка, списку або словника.
         """
-        key_type = self.client.type(key).decode('utf-8')
+        return self.decode_many([key])[key]
 
+    def decode_many(self, keys, chunk_size=VALUE_CHUNK_SIZE):
+        """
+        Декодує пакет ключів різних типів за мінімальну кількість round trip.
+
+        TYPE для всіх ключів надсилається одним pipeline, далі ключі групуються за типом
+        і читаються другим pipeline (рядки — одним MGET). Великі списки та zset читаються
+        вікнами по chunk_size елементів (LRANGE/ZRANGE за індексами), по одному pipeline
+        на вікно для всіх великих ключів разом. Вікна читаються не атомарно, тому
+        одночасна зміна великого значення може дати несумісний знімок.
+
+        :param keys: Ключі для декодування.
+        :param chunk_size: Кількість елементів списку або zset в одному вікні читання.
+        :return: Словник ключ -> рядок, список або словник; для відсутніх ключів і
+            непідтримуваних типів — рядок 'Unsupported key type: ...', як у universal_decoder.
+        """
+        keys = list(keys)
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+        key_types = [self._text(key_type) for key_type in pipe.execute()]
+
+        values = self._read_values(keys, key_types, chunk_size=chunk_size)
+        return {
+            key: values[key] if key in values else f"Unsupported key type: {key_type}"
+            for key, key_type in zip(keys, key_types)
+        }
+
+    def _read_values(self, keys, key_types, chunk_size=VALUE_CHUNK_SIZE, withscores=False):
+        """
+        Читає значення ключів відомих типів, згрупувавши їх за типом.
+
+        :param keys: Ключі.
+        :param key_types: Типи ключів у тому ж порядку (результат TYPE).
+        :param chunk_size: Кількість елементів списку або zset в одному вікні читання.
+        :param withscores: Повертати елементи zset разом з балами ([елемент, бал]).
+        :return: Словник ключ -> декодоване значення; ключі непідтримуваних типів, а також
+            ключі, що зникли або змінили тип між запитами, відсутні.
+        """
+        groups = {}
+        for key, key_type in zip(keys, key_types):
+            groups.setdefault(key_type, []).append(key)
+        strings = groups.get('string', [])
+
+        pipe = self.client.pipeline(transaction=False)
+        if strings:
+            pipe.mget(strings)
+        for key in groups.get('hash', []):
+            pipe.hgetall(key)
+        for key in groups.get('set', []):
+            pipe.smembers(key)
+        windowed = [(key, 'list') for key in groups.get('list', [])] + [(key, 'zset') for key in groups.get('zset', [])]
+        for key, key_type in windowed:
+            self._queue_window(pipe, key, key_type, 0, chunk_size, withscores)
+        replies = iter(pipe.execute(raise_on_error=False))
+
+        raw = {}
+        if strings:
+            raw.update(zip(strings, next(replies)))
+        for key in groups.get('hash', []) + groups.get('set', []):
+            raw[key] = next(replies)
+
+        # Великі значення дочитуються вікнами, доки вікно не виявиться неповним
+        pending = {}
+        for key, key_type in windowed:
+            raw[key] = chunk = next(replies)
+            if not isinstance(chunk, Exception) and len(chunk) == chunk_size:
+                raw[key] = list(chunk)
+                pending[key] = key_type
+        start = chunk_size
+        while pending:
+            for key, key_type in pending.items():
+                self._queue_window(pipe, key, key_type, start, chunk_size, withscores)
+            for key, chunk in zip(list(pending), pipe.execute(raise_on_error=False)):
+                if isinstance(chunk, Exception):
+                    raw[key] = chunk
+                else:
+                    raw[key].extend(chunk)
+                if isinstance(chunk, Exception) or len(chunk) < chunk_size:
+                    del pending[key]
+            start += chunk_size
+
+        types = dict(zip(keys, key_types))
+        return {
+            key: self._decode_value(types[key], value, withscores)
+            for key, value in raw.items()
+            if value is not None and not isinstance(value, Exception)
+        }
+
+    @staticmethod
+    def _queue_window(pipe, key, key_type, start, chunk_size, withscores):
+        """
+        Додає в pipeline читання вікна елементів списку або zset.
+        """
+        if key_type == 'list':
+            pipe.lrange(key, start, start + chunk_size - 1)
+        else:
+            pipe.zrange(key, start, start + chunk_size - 1, withscores=withscores)
+
+    def _decode_value(self, key_type, value, withscores=False):
+        """
+        Перетворює відповідь Redis на рядок, словник або список рядків.
+
+        :param key_type: Тип ключа.
+        :param value: Відповідь команди читання.
+        :param withscores: Чи містить відповідь zset бали.
+        :return: Декодоване значення; для zset з балами — список пар [елемент, бал].
+        """
+        text = self._text
         if key_type == 'string':
-            return self.client.get(key).decode('utf-8')
+            return text(value)
+        if key_type == 'hash':
+            return self.decode_hash(value)
+        if key_type == 'zset' and withscores:
+            return [[text(member), score] for member, score in value]
+        return list(value) if self.decode_responses else [text(item) for item in value]
 
-        elif key_type == 'hash':
-            return {k.decode('utf-8'): v.decode('utf-8') for k, v in self.client.hgetall(key).items()}
+    def _export_batch(self, keys):
+        """
+        Читає тип, TTL і значення пакета ключів (див. decode_many).
 
-        elif key_type == 'list':
-            return [item.decode('utf-8') for item in self.client.lrange(key, 0, -1)]
+        :param keys: Ключі пакета.
+        :return: Генератор записів {'key', 'type', 'ttl_ms', 'value'}; ключі, що зникли
+            або змінили тип між запитами, пропускаються.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+            pipe.pttl(key)
+        meta = pipe.execute()
+        key_types = [self._text(key_type) for key_type in meta[::2]]
+
+        # Бали zset зберігаються, щоб імпорт відновив порядок елементів
+        values = self._read_values(keys, key_types, withscores=True)
+        for key, key_type, ttl in zip(keys, key_types, meta[1::2]):
+            value = values.get(key)
+            # Ключ зник між запитами: Redis не зберігає порожні колекції
+            if value is None or (key_type != 'string' and not value):
+                continue
+            yield {'key': self._text(key), 'type': key_type, 'ttl_ms': ttl, 'value': value}
+
+    def database_to_json(self, file_path='redis_data.ndjson', match=None, batch_size=EXPORT_BATCH_SIZE):
+        """
+        Потоково експортує дані з Redis у файл JSON Lines (один ключ на рядок).
+
+        Ключі перебираються курсором SCAN замість блокуючого KEYS, тип, TTL і значення
+        читаються pipeline-запитами пакетами по batch_size ключів, а записи одразу
+        пишуться у файл, тому пам'ять обмежена розміром пакета.
+
+        :param file_path: Шлях до файлу експорту.
+        :param match: Шаблон ключів для SCAN MATCH. За замовчуванням усі ключі.
+        :param batch_size: Кількість ключів у пакеті (і підказка COUNT для SCAN).
+        :return: Кількість експортованих ключів.
+        """
+        count = 0
+        with open(file_path, 'w', encoding='utf-8') as json_file:
+            for keys in batched(self.client.scan_iter(match=match, count=batch_size), batch_size):
+                for record in self._export_batch(keys):
+                    json_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    count += 1
+
+        self.logger.info(["general", "export_data"], file_path=file_path, count=count)
+        return count
 
-        elif key_type == 'set':
-            return [item.decode('utf-8') for item in self.client.smembers(key)]
+    @staticmethod
+    def _queue_write(pipe, record):
+        """
+        Додає в pipeline відновлення ключа із запису експорту (разом з TTL).
 
+        :param pipe: Pipeline Redis.
+        :param record: Запис експорту {'key', 'type', 'ttl_ms', 'value'}.
+        :raises ValueError: Якщо тип ключа не підтримується.
+        """
+        key, key_type, value = record['key'], record['type'], record['value']
+        pipe.delete(key)
+        if key_type == 'string':
+            pipe.set(key, value)
+        elif key_type == 'hash':
+            pipe.hset(key, mapping=value)
+        elif key_type == 'list':
+            pipe.rpush(key, *value)
+        elif key_type == 'set':
+            pipe.sadd(key, *value)
         elif key_type == 'zset':
-            return [item.decode('utf-8') for item in self.client.zrange(key, 0, -1)]
-
+            pipe.zadd(key, dict(value))
         else:
-            return f"Unsupported key type: {key_type}"
+            raise ValueError(f"Unsupported key type: {key_type}")
 
-    def database_to_json(self):
-        """
-        Експортує всі дані з Redis у JSON.
+        # -1 означає ключ без TTL
+        if record.get('ttl_ms', -1) > 0:
+            pipe.pexpire(key, record['ttl_ms'])
+
+    def json_to_database(self, file_path='redis_data.ndjson', batch_size=EXPORT_BATCH_SIZE):
         """
-        keys = self.client.keys()
-        data = {}
+        Потоково імпортує ключі з файлу JSON Lines, створеного database_to_json.
 
-        for key in keys:
-            key_str = key.decode('utf-8')
-            data[key_str] = self.universal_decoder(key_str)
+        Існуючі ключі з тими самими іменами перезаписуються, TTL відновлюється
+        (залишок часу життя на момент експорту). Записи надсилаються pipeline-запитами
+        пакетами по batch_size ключів.
 
-        with open('redis_data.json', 'w') as json_file:
-            json.dump(data, json_file, indent=4)
+        :param file_path: Шлях до файлу експорту.
+        :param batch_size: Кількість ключів в одному pipeline-запиті.
+        :return: Кількість імпортованих ключів.
+        """
+        count = 0
+        with open(file_path, 'r', encoding='utf-8') as json_file:
+            lines = (line for line in json_file if line.strip())
+            for chunk in batched(lines, batch_size):
+                pipe = self.client.pipeline(transaction=False)
+                for line in chunk:
+                    self._queue_write(pipe, json.loads(line))
+                pipe.execute()
+                count += len(chunk)
 
-        self.logger.info(["general", "export_data"])
+        self.logger.info(["general", "import_data"], file_path=file_path, count=count)
+        return count
 
     def update_last_activity(self, user_id):
         """
         Оновлює час останньої активності користувача.
 
+        Оновлення часу, продовження TTL сесії та ключа токена і читання оновленої сесії
+        виконуються атомарно скриптом touch_session.lua; відсутня сесія не створюється.
+
         :param user_id: Ідентифікатор користувача.
+        :return: Оновлена сесія або None, якщо сесії немає.
         """
         self.init_user_id(user_id)
 
         if self.session_key is None:
             self.logger.error(['general', 'session_key_error'])
-            return
-
-        current_time = int(time.time())
-
-        # Оновлюємо поле login_time в хеш-таблиці користувача
-        self.client.hset(self.session_key, "login_time", current_time)
+            return None
 
-        # Оновлюємо TTL для продовження часу життя сесії
-        self.client.expire(self.session_key, 1800)
+        # Оновлюємо login_time і продовжуємо TTL сесії та ключа токена
+        fields = self.scripts['touch_session'](keys=[self.session_key], args=[int(time.time()), SESSION_TTL])
+        if not fields:
+            self.logger.error(["general", "session_not_found"], user_id=user_id)
+            return None
 
         # Логування успішної операції
         self.logger.info(["general", "update_last_activity"])
 
-        self.updated_session_info()
+        session_info = self.decode_hash(dict(zip(fields[::2], fields[1::2])))
+        self.updated_session_info(session_info, user_id)
+        return session_info
 
     def delete_session(self, user_id):
         """
         Видалення сесії для користувача та відповідного session_token.
 
+        Сесія та ключ токена видаляються атомарно скриптом delete_session.lua.
+
         :param user_id: Ідентифікатор користувача.
+        :return: True, якщо сесію видалено, інакше False.
         """
         self.init_user_id(user_id)
 
-        # Отримуємо інформацію про сесію
-        session_info = self.get_session()
-
-        if session_info:
-            session_token = session_info.get('session_token')
-
-            # Видаляємо саму сесію
-            self.client.delete(self.session_key)
-            self.logger.info(["general", "delete_session"], user_id=user_id)
-
-            # Видаляємо інформацію про session_token
-            if session_token:
-                self.client.delete(f"session_token:{session_token}")
-                self.logger.info(["general", "delete_session_token"], session_token=session_token)
-            else:
-                self.logger.error(["general", "token_not_found_in_session"], user_id=user_id)
-        else:
+        result = self.scripts['delete_session'](keys=[self.session_key])
+        if not result[0]:
             self.logger.error(["general", "session_not_found"], user_id=user_id)
+            return False
+
+        self.logger.info(["general", "delete_session"], user_id=user_id)
+        session_token = self._text(result[1])
+        if session_token:
+            if self.token_cache is not None:
+                # Власне видалення не чекає на keyspace-сповіщення
+                self.token_cache.invalidate(session_token)
+            self.logger.info(["general", "delete_session_token"], session_token=session_token)
+        else:
+            self.logger.error(["general", "token_not_found_in_session"], user_id=user_id)
+        return True
 
-    def updated_session_info(self):
+    def updated_session_info(self, session_info=None, user_id=None):
         """
         Логування оновленої інформації про сесію користувача.
+
+        :param session_info: Розкодована сесія. За замовчуванням читається з Redis.
+        :param user_id: Ідентифікатор користувача. За замовчуванням шукається за токеном сесії.
         """
-        updated_session_info = self.get_session()
-        if updated_session_info:
-            session_token = updated_session_info.get('session_token')
+        updated_session_info = self.get_session() if session_info is None else session_info
+        session_token = updated_session_info.get('session_token')
+        if session_token:
             login_time = self.convert_login_time(updated_session_info)
-            user_id = self.get_user_id_by_token(session_token)
+            if user_id is None:
+                user_id = self.get_user_id_by_token(session_token)
 
             if user_id:
                 self.logger.info(
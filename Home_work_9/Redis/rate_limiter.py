@@ -0,0 +1,88 @@
+"""
+Обмеження частоти запитів ковзним вікном у Redis.
+
+`SlidingWindowRateLimiter` зберігає журнал запитів кожного користувача або IP-адреси
+в sorted set (бал — час запиту в мс) і перевіряє ліміт скриптом sliding_window_limit.lua:
+очищення застарілих записів, підрахунок і додавання нового запиту виконуються
+атомарно за один round trip (EVALSHA), тому сплеск одночасних входів не перевищує ліміт.
+
+Приклад:
+    with MyRedis("localhost", 6379, 0) as redis_instance:
+        limiter = SlidingWindowRateLimiter(redis_instance.client, limit=5, window_ms=60_000)
+        if not limiter.hit("192.168.0.10", scope="ip").allowed:
+            ...
+"""
+
+import uuid
+from collections import namedtuple
+
+from my_redis import load_lua_scripts
+
+# Результат перевірки: дозволено, кількість запитів у вікні, мс до звільнення місця (0, якщо дозволено)
+RateLimitResult = namedtuple('RateLimitResult', ['allowed', 'count', 'retry_after_ms'])
+
+
+class SlidingWindowRateLimiter:
+    """
+    Ліміт limit запитів за будь-які window_ms мілісекунд для кожного ідентифікатора.
+
+    Атрибути:
+        client (redis.Redis): Клієнт Redis.
+        limit (int): Максимальна кількість запитів у вікні.
+        window_ms (int): Ширина вікна в мілісекундах.
+        prefix (str): Префікс ключів лімітів.
+    """
+
+    def __init__(self, client, limit, window_ms, prefix="rate_limit"):
+        """
+        Ініціалізує SlidingWindowRateLimiter.
+
+        :param client: Синхронний клієнт Redis (наприклад, MyRedis.client).
+        :param limit: Максимальна кількість запитів у вікні.
+        :param window_ms: Ширина вікна в мілісекундах.
+        :param prefix: Префікс ключів лімітів.
+        :raises ValueError: Якщо limit або window_ms не додатні.
+        """
+        if limit <= 0 or window_ms <= 0:
+            raise ValueError("limit і window_ms мають бути додатними")
+        self.client = client
+        self.limit = limit
+        self.window_ms = window_ms
+        self.prefix = prefix
+        self._script = client.register_script(load_lua_scripts()['sliding_window_limit'])
+
+    def key(self, identity, scope="user"):
+        """
+        Повертає ключ журналу запитів.
+
+        :param identity: Ідентифікатор користувача або IP-адреса.
+        :param scope: Простір ідентифікаторів ('user', 'ip' тощо).
+        :return: Ключ Redis.
+        """
+        return f"{self.prefix}:{scope}:{identity}"
+
+    def hit(self, identity, scope="user"):
+        """
+        Реєструє запит і перевіряє ліміт (один round trip).
+
+        Відхилений запит не додається до журналу, тому повторні спроби під час
+        блокування не продовжують його.
+
+        :param identity: Ідентифікатор користувача або IP-адреса.
+        :param scope: Простір ідентифікаторів ('user', 'ip' тощо).
+        :return: Результат перевірки.
+        :rtype: RateLimitResult
+        """
+        allowed, count, retry_after_ms = self._script(
+            keys=[self.key(identity, scope)], args=[self.window_ms, self.limit, uuid.uuid4().hex]
+        )
+        return RateLimitResult(bool(allowed), count, retry_after_ms)
+
+    def reset(self, identity, scope="user"):
+        """
+        Скидає журнал запитів ідентифікатора (наприклад, після успішного входу).
+
+        :param identity: Ідентифікатор користувача або IP-адреса.
+        :param scope: Простір ідентифікаторів.
+        """
+        self.client.delete(self.key(identity, scope))
@@ -0,0 +1,120 @@
+"""
+Підрахунок унікальних активних користувачів у часових кошиках на HyperLogLog.
+
+`ActiveUserCounter` додає користувача в HyperLogLog кошика (наприклад, хвилини)
+командою PFADD разом з EXPIRE в одному pipeline. Кожен кошик займає до 12 КБ
+незалежно від кількості користувачів, а похибка оцінки — близько 0.81%.
+Кількість унікальних користувачів за довільний проміжок обчислюється одним
+PFCOUNT над кількома кошиками (об'єднання на сервері), розподіл за кошиками —
+одним pipeline PFCOUNT.
+
+Приклад:
+    with MyRedis("localhost", 6379, 0) as redis_instance:
+        counter = ActiveUserCounter(redis_instance.client, bucket_seconds=60)
+        counter.record("ayu")
+        active_last_hour = counter.count(time.time() - 3600)
+"""
+
+import time
+
+# Тривалість кошика та строк зберігання кошиків за замовчуванням, у секундах
+DEFAULT_BUCKET_SECONDS = 60
+DEFAULT_RETENTION_SECONDS = 24 * 3600
+
+
+class ActiveUserCounter:
+    """
+    Лічильник унікальних активних користувачів за часовими кошиками.
+
+    Атрибути:
+        client (redis.Redis): Клієнт Redis.
+        bucket_seconds (int): Тривалість кошика в секундах.
+        retention_seconds (int): Час життя кошика в секундах.
+        prefix (str): Префікс ключів кошиків.
+    """
+
+    def __init__(self, client, bucket_seconds=DEFAULT_BUCKET_SECONDS, retention_seconds=DEFAULT_RETENTION_SECONDS,
+                 prefix="active_users"):
+        """
+        Ініціалізує ActiveUserCounter.
+
+        :param client: Синхронний клієнт Redis (наприклад, MyRedis.client).
+        :param bucket_seconds: Тривалість кошика в секундах.
+        :param retention_seconds: Час життя кошика в секундах.
+        :param prefix: Префікс ключів кошиків.
+        """
+        self.client = client
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self.prefix = prefix
+
+    def bucket_start(self, timestamp):
+        """
+        Повертає початок кошика, до якого належить момент часу.
+
+        :param timestamp: UNIX-час у секундах.
+        :return: UNIX-час початку кошика.
+        """
+        return int(timestamp) // self.bucket_seconds * self.bucket_seconds
+
+    def key(self, bucket_start):
+        """
+        Повертає ключ HyperLogLog кошика.
+
+        :param bucket_start: UNIX-час початку кошика.
+        :return: Ключ Redis.
+        """
+        return f"{self.prefix}:{self.bucket_seconds}:{bucket_start}"
+
+    def buckets(self, start, end=None):
+        """
+        Повертає початки кошиків, що перетинаються з проміжком [start, end].
+
+        :param start: Початок проміжку (UNIX-час).
+        :param end: Кінець проміжку. За замовчуванням поточний час.
+        :return: Список початків кошиків за зростанням.
+        """
+        end = time.time() if end is None else end
+        return list(range(self.bucket_start(start), self.bucket_start(end) + 1, self.bucket_seconds))
+
+    def record(self, *user_ids, timestamp=None):
+        """
+        Реєструє активність користувачів у кошику моменту timestamp (один round trip).
+
+        :param user_ids: Ідентифікатори користувачів.
+        :param timestamp: UNIX-час активності. За замовчуванням поточний час.
+        :return: True, якщо оцінка кількості в кошику змінилася.
+        """
+        key = self.key(self.bucket_start(time.time() if timestamp is None else timestamp))
+        pipe = self.client.pipeline(transaction=False)
+        pipe.pfadd(key, *user_ids)
+        pipe.expire(key, self.retention_seconds)
+        changed, _ = pipe.execute()
+        return bool(changed)
+
+    def count(self, start, end=None):
+        """
+        Оцінює кількість унікальних користувачів за проміжок (один PFCOUNT над кошиками).
+
+        :param start: Початок проміжку (UNIX-час).
+        :param end: Кінець проміжку. За замовчуванням поточний час.
+        :return: Оцінка кількості унікальних користувачів; 0, якщо проміжок не містить кошиків (end < start).
+        """
+        keys = [self.key(bucket) for bucket in self.buckets(start, end)]
+        if not keys:
+            return 0
+        return self.client.pfcount(*keys)
+
+    def count_per_bucket(self, start, end=None):
+        """
+        Оцінює кількість унікальних користувачів у кожному кошику проміжку (один pipeline).
+
+        :param start: Початок проміжку (UNIX-час).
+        :param end: Кінець проміжку. За замовчуванням поточний час.
+        :return: Список пар (початок кошика, оцінка кількості) за зростанням часу.
+        """
+        buckets = self.buckets(start, end)
+        pipe = self.client.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.pfcount(self.key(bucket))
+        return list(zip(buckets, pipe.execute()))
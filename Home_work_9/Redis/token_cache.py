@@ -0,0 +1,229 @@
+"""
+Локальний near-cache відповідностей session_token -> user_id.
+
+`TokenCache` — потокобезпечний LRU-кеш з коротким TTL у пам'яті процесу перед
+запитами session_token:* у MyRedis. Запис живе не довше за TTL кешу і не довше
+за залишок TTL самого ключа в Redis (GET і PTTL читаються одним pipeline), тому
+прострочена сесія не обслуговується з кешу навіть без сповіщень.
+
+Видалення та зміни ключів токенів іншими клієнтами надходять як keyspace-сповіщення
+Redis (`notify-keyspace-events` з класами K, g, $, x, e): фоновий потік pubsub
+видаляє відповідний запис з кешу. Сповіщення доставляються за принципом
+«не більше одного разу», тому під час розриву з'єднання з pubsub кеш очищується,
+а застарілість обмежена TTL кешу.
+
+Приклад:
+    token_cache = TokenCache(max_entries=10_000, ttl=5)
+    with MyRedis("localhost", 6379, 0, token_cache=token_cache) as redis_instance:
+        redis_instance.get_user_id_by_token(session_token)
+    token_cache.stop()
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+
+# Класи keyspace-сповіщень: K — keyspace-канал, g — DEL/EXPIRE тощо, $ — рядкові команди,
+# x — закінчення TTL, e — витіснення за maxmemory
+NOTIFY_KEYSPACE_EVENTS = "Kg$xe"
+# Події, після яких запис кешу застарів. Подія expire (клас g) ігнорується:
+# touch_session.lua продовжує TTL токена при кожній активності, а сам зв'язок
+# токена з користувачем не змінюється; залишок TTL у кеші обмежено при записі.
+INVALIDATING_EVENTS = frozenset({"del", "expired", "evicted", "set"})
+
+TOKEN_KEY_PREFIX = "session_token:"
+
+
+class TokenCache:
+    """
+    LRU-кеш session_token -> user_id з TTL та інвалідацією через keyspace-сповіщення.
+
+    Атрибути:
+        max_entries (int): Максимальна кількість записів.
+        ttl (float): Максимальний час життя запису в секундах.
+        hits, misses (int): Кількість влучань і промахів get().
+        invalidations (int): Кількість записів, видалених за сповіщеннями або invalidate().
+        expirations (int): Кількість записів, що прострочилися до звернення.
+        evictions (int): Кількість записів, витіснених через max_entries.
+        notifications (int): Кількість отриманих keyspace-сповіщень.
+    """
+
+    def __init__(self, max_entries=10_000, ttl=5.0, clock=time.monotonic):
+        """
+        Ініціалізує TokenCache.
+
+        :param max_entries: Максимальна кількість записів.
+        :param ttl: Максимальний час життя запису в секундах.
+        :param clock: Монотонний годинник (для тестів і бенчмарків).
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        # token -> (user_id, час запису, час закінчення)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._listener = None
+        self._pubsub = None
+        self.hits = self.misses = 0
+        self.invalidations = self.expirations = self.evictions = 0
+        self.notifications = 0
+        self._served_age_total = 0.0
+        self._served_age_max = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, session_token):
+        """
+        Повертає user_id для токена з кешу.
+
+        :param session_token: Токен сесії.
+        :return: user_id або None, якщо запису немає або він прострочений.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(session_token)
+            if entry is None:
+                self.misses += 1
+                return None
+            user_id, stored_at, expires_at = entry
+            if now >= expires_at:
+                del self._entries[session_token]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_token)
+            self.hits += 1
+            # Вік виданого запису — верхня межа його застарілості
+            age = now - stored_at
+            self._served_age_total += age
+            self._served_age_max = max(self._served_age_max, age)
+            return user_id
+
+    def put(self, session_token, user_id, key_ttl_ms=-1):
+        """
+        Зберігає відповідність токена користувачу.
+
+        :param session_token: Токен сесії.
+        :param user_id: Ідентифікатор користувача.
+        :param key_ttl_ms: Залишок TTL ключа в Redis у мілісекундах (PTTL); -1 — без TTL.
+        """
+        now = self._clock()
+        ttl = self.ttl if key_ttl_ms < 0 else min(self.ttl, key_ttl_ms / 1000)
+        with self._lock:
+            self._entries[session_token] = (user_id, now, now + ttl)
+            self._entries.move_to_end(session_token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, session_token):
+        """
+        Видаляє запис токена з кешу.
+
+        :param session_token: Токен сесії.
+        """
+        with self._lock:
+            if self._entries.pop(session_token, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        """
+        Очищує кеш (лічильники зберігаються).
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Повертає метрики кешу.
+
+        :return: Словник з кількістю записів, влучань, промахів, часткою влучань,
+            кількістю інвалідацій, прострочень, витіснень, сповіщень та віком виданих
+            записів (середнім і максимальним, у секундах) як оцінкою застарілості.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'invalidations': self.invalidations,
+                'expirations': self.expirations,
+                'evictions': self.evictions,
+                'notifications': self.notifications,
+                'served_age_avg_s': round(self._served_age_total / self.hits, 4) if self.hits else None,
+                'served_age_max_s': round(self._served_age_max, 4),
+            }
+
+    def _on_notification(self, message):
+        """
+        Обробляє keyspace-сповіщення для ключа session_token:*.
+
+        :param message: Повідомлення pubsub з каналом '__keyspace@<db>__:session_token:<token>'
+            і назвою події в data.
+        """
+        self.notifications += 1
+        event = message['data']
+        if isinstance(event, bytes):
+            event = event.decode('utf-8')
+        if event not in INVALIDATING_EVENTS:
+            return
+        channel = message['channel']
+        if isinstance(channel, bytes):
+            channel = channel.decode('utf-8')
+        key = channel.split(':', 1)[1]
+        self.invalidate(key[len(TOKEN_KEY_PREFIX):])
+
+    def _on_connect(self, connection):
+        # Сповіщення за час розриву втрачено: записи могли застаріти
+        self.clear()
+
+    def start_listener(self, client, database, configure_notifications=True, sleep_time=0.1):
+        """
+        Запускає фоновий потік, що інвалідує кеш за keyspace-сповіщеннями (повторний виклик нічого не робить).
+
+        :param client: Синхронний клієнт Redis; pubsub використовує окреме з'єднання з його пулу.
+        :param database: Номер бази даних Redis, сповіщення якої відстежуються.
+        :param configure_notifications: Увімкнути потрібні класи сповіщень через CONFIG SET.
+            Якщо CONFIG недоступна (керований Redis), сповіщення мають бути увімкнені на сервері.
+        :param sleep_time: Інтервал очікування повідомлень фоновим потоком у секундах.
+        :return: True, якщо сповіщення увімкнено цим викликом або вже були налаштовані.
+        """
+        with self._lock:
+            if self._listener is not None:
+                return True
+            configured = True
+            if configure_notifications:
+                try:
+                    flags = next(iter(client.config_get('notify-keyspace-events').values()), '')
+                    if isinstance(flags, bytes):
+                        flags = flags.decode('utf-8')
+                    # A — псевдонім для всіх класів подій, крім K/E та m/n
+                    enabled = flags.replace('A', 'g$lshzxetd')
+                    missing = ''.join(flag for flag in NOTIFY_KEYSPACE_EVENTS if flag not in enabled)
+                    if missing:
+                        client.config_set('notify-keyspace-events', flags + missing)
+                except redis.ResponseError:
+                    configured = False
+
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.psubscribe(**{f"__keyspace@{database}__:{TOKEN_KEY_PREFIX}*": self._on_notification})
+            self._pubsub.connection.register_connect_callback(self._on_connect)
+            self._listener = self._pubsub.run_in_thread(sleep_time=sleep_time, daemon=True)
+            return configured
+
+    def stop(self):
+        """
+        Зупиняє фоновий потік сповіщень і очищує кеш.
+        """
+        with self._lock:
+            listener, self._listener = self._listener, None
+            self._pubsub = None
+        if listener is not None:
+            listener.stop()
+            listener.join(timeout=1)
+        self.clear()